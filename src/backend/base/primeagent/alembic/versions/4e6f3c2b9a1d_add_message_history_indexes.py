@@ -0,0 +1,43 @@
+"""add message history indexes
+
+Revision ID: 4e6f3c2b9a1d
+Revises: bfa720abd068
+Create Date: 2026-10-17 09:12:41.503217
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4e6f3c2b9a1d"
+down_revision: str | None = "bfa720abd068"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXES = {
+    "ix_message_flow_id_session_id_timestamp": ["flow_id", "session_id", "timestamp"],
+    "ix_message_session_id_timestamp": ["session_id", "timestamp"],
+}
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        for name, columns in INDEXES.items():
+            if name not in indexes_names:
+                batch_op.create_index(name, columns, unique=False)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        for name in INDEXES:
+            if name in indexes_names:
+                batch_op.drop_index(name)
@@ -0,0 +1,35 @@
+"""add mcp_tool_schema to flow
+
+Revision ID: 7c1d9e2f4a6b
+Revises: 4e6f3c2b9a1d
+Create Date: 2026-10-17 14:03:27.118406
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+from primeagent.utils import migration
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1d9e2f4a6b"
+down_revision: str | None = "4e6f3c2b9a1d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    # Existing flows get their schema when MCP tools are first listed
+    if not migration.column_exists(table_name="flow", column_name="mcp_tool_schema", conn=conn):
+        with op.batch_alter_table("flow", schema=None) as batch_op:
+            batch_op.add_column(sa.Column("mcp_tool_schema", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if migration.column_exists(table_name="flow", column_name="mcp_tool_schema", conn=conn):
+        with op.batch_alter_table("flow", schema=None) as batch_op:
+            batch_op.drop_column("mcp_tool_schema")
@@ -0,0 +1,78 @@
+"""add mcp tool names to flow
+
+Revision ID: a93f5e7c2d18
+Revises: 7c1d9e2f4a6b
+Create Date: 2026-10-17 16:21:09.664512
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+from primeagent.utils import migration
+
+# revision identifiers, used by Alembic.
+revision: str = "a93f5e7c2d18"
+down_revision: str | None = "7c1d9e2f4a6b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COLUMNS = ("mcp_tool_name", "mcp_action_name")
+INDEXES = {
+    "ix_flow_user_id_mcp_tool_name": ["user_id", "mcp_tool_name"],
+    "ix_flow_user_id_mcp_action_name": ["user_id", "mcp_action_name"],
+}
+
+
+def upgrade() -> None:
+    from wfx.base.mcp.util import sanitize_mcp_name
+
+    conn = op.get_bind()
+    with op.batch_alter_table("flow", schema=None) as batch_op:
+        for column in COLUMNS:
+            if not migration.column_exists(table_name="flow", column_name=column, conn=conn):
+                batch_op.add_column(sa.Column(column, sa.String(), nullable=True))
+
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes_names = [index["name"] for index in inspector.get_indexes("flow")]
+    with op.batch_alter_table("flow", schema=None) as batch_op:
+        for name, columns in INDEXES.items():
+            if name not in indexes_names:
+                batch_op.create_index(name, columns, unique=False)
+
+    flow = sa.table(
+        "flow",
+        sa.column("id"),
+        sa.column("name", sa.String),
+        sa.column("action_name", sa.String),
+        sa.column("mcp_tool_name", sa.String),
+        sa.column("mcp_action_name", sa.String),
+    )
+    rows = conn.execute(sa.select(flow.c.id, flow.c.name, flow.c.action_name).where(flow.c.mcp_tool_name.is_(None)))
+    for flow_id, name, action_name in rows.all():
+        if not name:
+            continue
+        tool_name = sanitize_mcp_name(name)
+        conn.execute(
+            sa.update(flow)
+            .where(flow.c.id == flow_id)
+            .values(
+                mcp_tool_name=tool_name,
+                mcp_action_name=sanitize_mcp_name(action_name) if action_name else tool_name,
+            )
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes_names = [index["name"] for index in inspector.get_indexes("flow")]
+    with op.batch_alter_table("flow", schema=None) as batch_op:
+        for name in INDEXES:
+            if name in indexes_names:
+                batch_op.drop_index(name)
+        for column in COLUMNS:
+            if migration.column_exists(table_name="flow", column_name=column, conn=conn):
+                batch_op.drop_column(column)
@@ -334,8 +334,12 @@ async def generate_flow_events(
 
             result_data_response.message = artifacts
 
-            # Log the vertex build
-            if not vertex.will_stream and log_builds:
+            # The stream endpoint reads the graph back from the cache to stream a vertex. The results of
+            # the other vertices were already cached on their own by build_vertex, so the whole graph,
+            # cached once when the build started, is not written again for them.
+            if vertex.will_stream:
+                await chat_service.set_cache(flow_id_str, graph)
+            elif log_builds:
                 background_tasks.add_task(
                     log_vertex_build,
                     flow_id=flow_id_str,
@@ -345,8 +349,6 @@ async def generate_flow_events(
                     data=result_data_response,
                     artifacts=artifacts,
                 )
-            else:
-                await chat_service.set_cache(flow_id_str, graph)
 
             timedelta = time.perf_counter() - start_time
             duration = format_elapsed_time(timedelta)
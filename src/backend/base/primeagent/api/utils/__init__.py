@@ -31,6 +31,7 @@ from primeagent.api.utils.core import (
     get_suggestion_message,
     get_top_level_vertices,
     has_api_terms,
+    infer_is_component,
     parse_exception,
     parse_value,
     remove_api_keys,
@@ -68,6 +69,7 @@ __all__ = [
     "get_top_level_vertices",
     # Functions
     "has_api_terms",
+    "infer_is_component",
     "parse_exception",
     "parse_value",
     "remove_api_keys",
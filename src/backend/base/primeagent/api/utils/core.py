@@ -95,14 +95,18 @@ def validate_is_component(flows: list[Flow]):
         if not flow.data or flow.is_component is not None:
             continue
 
-        is_component = get_is_component_from_data(flow.data)
-        if is_component is not None:
-            flow.is_component = is_component
-        else:
-            flow.is_component = len(flow.data.get("nodes", [])) == 1
+        flow.is_component = infer_is_component(flow.data)
     return flows
 
 
+def infer_is_component(data: dict) -> bool:
+    """Returns whether the data of a flow saved without an `is_component` flag is a component."""
+    is_component = get_is_component_from_data(data)
+    if is_component is not None:
+        return is_component
+    return len(data.get("nodes", [])) == 1
+
+
 def get_is_component_from_data(data: dict):
     """Returns True if the data is a component."""
     return data.get("is_component")
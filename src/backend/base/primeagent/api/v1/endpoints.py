@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import time
 from collections.abc import AsyncGenerator
 from http import HTTPStatus
@@ -42,6 +43,7 @@ from primeagent.exceptions.api import APIException, InvalidChatInputError
 from primeagent.exceptions.serialization import SerializationError
 from primeagent.helpers.flow import get_flow_by_id_or_endpoint_name
 from primeagent.interface.initialize.loading import update_params_with_load_from_db_fields
+from primeagent.processing.graph_cache import get_prepared_graph_cache
 from primeagent.processing.process import process_tweaks, run_graph_internal
 from primeagent.schema.graph import Tweaks
 from primeagent.services.auth.utils import api_key_security, get_current_active_user, get_webhook_user
@@ -51,7 +53,7 @@ from primeagent.services.database.models.flow.utils import get_all_webhook_compo
 from primeagent.services.database.models.user.model import User, UserRead
 from primeagent.services.deps import get_session_service, get_settings_service, get_telemetry_service
 from primeagent.services.telemetry.schema import RunPayload
-from primeagent.utils.compression import compress_response
+from primeagent.utils.compression import PrecompressedJSON
 from primeagent.utils.version import get_version_info
 
 if TYPE_CHECKING:
@@ -83,18 +85,36 @@ async def parse_input_request_from_body(http_request: Request) -> SimplifiedAPIR
         return SimplifiedAPIRequest()
 
 
+# (all_types_dict, component cache version, catalog) of the last serialized component catalog
+_component_catalog: tuple[dict, int, PrecompressedJSON] | None = None
+
+
+async def get_component_catalog() -> PrecompressedJSON:
+    """Returns the serialized and compressed component catalog, rebuilding it only when the components change."""
+    from wfx.interface.components import component_cache
+
+    from primeagent.interface.components import get_and_cache_all_types_dict
+
+    global _component_catalog  # noqa: PLW0603
+    all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
+    version = component_cache.version
+    if _component_catalog is None or _component_catalog[0] is not all_types or _component_catalog[1] != version:
+        catalog = await asyncio.to_thread(PrecompressedJSON.from_data, all_types)
+        _component_catalog = (all_types, version, catalog)
+    return _component_catalog[2]
+
+
 @router.get("/all", dependencies=[Depends(get_current_active_user)])
-async def get_all():
+async def get_all(request: Request):
     """Retrieve all component types with compression for better performance.
 
-    Returns a compressed response containing all available component types.
+    Returns a compressed response containing all available component types. The response is
+    serialized once per catalog change and carries an ETag, so unchanged catalogs answer
+    `If-None-Match` requests with 304 Not Modified.
     """
-    from primeagent.interface.components import get_and_cache_all_types_dict
-
     try:
-        all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
-        # Return compressed response using our utility function
-        return compress_response(all_types)
+        catalog = await get_component_catalog()
+        return catalog.response(request.headers)
 
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -105,6 +125,9 @@ def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
     # then we need to check the tweaks if the ChatInput component is present
     # and if its input_value is not None
     # if so, we raise an error
+    if input_request.input_value is not None and input_request.input_values is not None:
+        msg = "You cannot pass both an input_value and input_values."
+        raise InvalidChatInputError(msg)
     if not input_request.tweaks:
         return
 
@@ -116,7 +139,7 @@ def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
         if input_value is None:
             continue
 
-        request_has_input = input_request.input_value is not None
+        request_has_input = input_request.input_value is not None or input_request.input_values is not None
 
         if any(chat_key in key for chat_key in ("ChatInput", "Chat Input")):
             if request_has_input and input_request.input_type == "chat":
@@ -132,6 +155,32 @@ def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
             raise InvalidChatInputError(msg)
 
 
+def get_prepared_graph(flow: Flow, tweaks: Tweaks | None, *, stream: bool, user_id: str) -> Graph:
+    """Returns a graph of the flow with `tweaks` applied, ready to run.
+
+    Graphs are forked from a cached template keyed by the flow id, its `updated_at` timestamp, the tweaks
+    and the user, so repeated runs of an unchanged flow skip building the graph from its payload.
+    """
+    flow_id_str = str(flow.id)
+    cache = get_prepared_graph_cache()
+    if not cache.enabled:
+        graph_data = process_tweaks(flow.data.copy(), tweaks or {}, stream=stream)
+        return Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=user_id, flow_name=flow.name)
+
+    key = cache.make_key(flow_id_str, flow.updated_at, tweaks, stream=stream, user_id=user_id)
+    template = cache.get(key)
+    get_telemetry_service().ot.increment_counter(
+        "graph_template_cache_hits" if template is not None else "graph_template_cache_misses",
+        labels={"flow_id": flow_id_str},
+    )
+    if template is None:
+        # Templates outlive the request, so they must not share node dicts with the flow
+        graph_data = process_tweaks(copy.deepcopy(flow.data), tweaks or {}, stream=stream)
+        template = Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=user_id, flow_name=flow.name)
+        cache.set(key, template)
+    return template.fork()
+
+
 async def simple_run_flow(
     flow: Flow,
     input_request: SimplifiedAPIRequest,
@@ -150,22 +199,30 @@ async def simple_run_flow(
         if flow.data is None:
             msg = f"Flow {flow_id_str} has no data"
             raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(
-            graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name, context=context
-        )
+        graph = get_prepared_graph(flow, input_request.tweaks, stream=stream, user_id=str(user_id))
+        # Nothing reads the graph of an API run back, so it is not written to the chat cache
+        graph.stateless = True
+        if context:
+            graph.context = context
         if run_id is None:
             run_id = str(uuid4())
         graph.set_run_id(run_id)
-        inputs = None
+        input_values = input_request.input_values
         if input_request.input_value is not None:
+            input_values = [input_request.input_value]
+        inputs = None
+        batch_concurrency = None
+        if input_request.input_values is not None:
+            # The input values of a batch each run on their own fork of the graph, see Graph.arun
+            batch_concurrency = get_settings_service().settings.batch_run_concurrency
+        if input_values is not None:
             inputs = [
                 InputValueRequest(
                     components=[],
-                    input_value=input_request.input_value,
+                    input_value=input_value,
                     type=input_request.input_type,
                 )
+                for input_value in input_values
             ]
         if input_request.output_component:
             outputs = [input_request.output_component]
@@ -187,6 +244,7 @@ async def simple_run_flow(
             outputs=outputs,
             stream=stream,
             event_manager=event_manager,
+            batch_concurrency=batch_concurrency,
         )
 
         return RunResponse(outputs=task_result, session_id=session_id)
@@ -302,6 +360,7 @@ async def run_flow_generator(
     Events Generated:
         - "add_message": Sent when new messages are added during flow execution
         - "token": Sent for each token generated during streaming
+        - "content_block_delta": Sent when a content of a streamed message is added or updated
         - "end": Sent when flow execution completes, includes final result
         - "error": Sent if an error occurs during execution
 
@@ -389,6 +448,7 @@ async def simplified_run_flow(
         - In streaming mode, uses EventManager to handle events:
             - "add_message": New messages during execution
             - "token": Individual tokens during streaming
+            - "content_block_delta": Contents added or updated in a streamed message
             - "end": Final execution result
     """
     await check_flow_user_permission(flow=flow, api_key_user=api_key_user)
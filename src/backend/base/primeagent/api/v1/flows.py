@@ -16,6 +16,7 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlmodel import apaginate
+from sqlalchemy import case, null, or_
 from sqlmodel import and_, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from wfx.log import logger
@@ -24,12 +25,14 @@ from primeagent.api.utils import (
     CurrentActiveUser,
     DbSession,
     cascade_delete_flow,
+    infer_is_component,
     remove_api_keys,
     validate_is_component,
 )
 from primeagent.api.v1.schemas import FlowListCreate
 from primeagent.helpers.user import get_user_by_flow_id_or_endpoint_name
 from primeagent.initial_setup.constants import STARTER_FOLDER_NAME
+from primeagent.processing.graph_cache import invalidate_prepared_graphs
 from primeagent.services.database.models.flow.model import (
     AccessTypeEnum,
     Flow,
@@ -253,16 +256,15 @@ async def read_flows(
             stmt = stmt.where(Flow.is_component == True)  # noqa: E712
 
         if get_all:
+            if header_flows:
+                return compress_response(await _read_flow_headers(session, stmt.whereclause))
+
             flows = (await session.exec(stmt)).all()
             flows = validate_is_component(flows)
             if components_only:
                 flows = [flow for flow in flows if flow.is_component]
             if remove_example_flows and starter_folder_id:
                 flows = [flow for flow in flows if flow.folder_id != starter_folder_id]
-            if header_flows:
-                # Convert to FlowHeader objects and compress the response
-                flow_headers = [FlowHeader.model_validate(flow, from_attributes=True) for flow in flows]
-                return compress_response(flow_headers)
 
             # Compress the full flows response
             return compress_response(flows)
@@ -281,6 +283,29 @@ async def read_flows(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+_FLOW_HEADER_COLUMNS = tuple(name for name in FlowHeader.model_fields if name != "data")
+
+
+async def _read_flow_headers(session: AsyncSession, where_clause) -> list[FlowHeader]:
+    """Read the headers of the flows matching `where_clause`.
+
+    The `data` column is only read for components, which send it with their header, and for the
+    flows saved without an `is_component` flag, which is then inferred from it.
+    """
+    header_data = case(
+        (or_(col(Flow.is_component).is_(None), col(Flow.is_component) == True), Flow.data),  # noqa: E712
+        else_=null(),
+    )
+    stmt = select(*(getattr(Flow, name) for name in _FLOW_HEADER_COLUMNS), header_data).where(where_clause)
+    headers = []
+    for *values, data in (await session.exec(stmt)).all():
+        header = dict(zip(_FLOW_HEADER_COLUMNS, values, strict=True))
+        if header["is_component"] is None and data:
+            header["is_component"] = infer_is_component(data)
+        headers.append(FlowHeader(**header, data=data))
+    return headers
+
+
 async def _read_flow(
     session: AsyncSession,
     flow_id: UUID,
@@ -366,6 +391,7 @@ async def update_flow(
         session.add(db_flow)
         await session.commit()
         await session.refresh(db_flow)
+        invalidate_prepared_graphs(db_flow.id)
 
         await _save_flow_to_fs(db_flow)
 
@@ -405,6 +431,7 @@ async def delete_flow(
         raise HTTPException(status_code=404, detail="Flow not found")
     await cascade_delete_flow(session, flow.id)
     await session.commit()
+    invalidate_prepared_graphs(flow.id)
     return {"message": "Flow deleted successfully"}
 
 
@@ -498,6 +525,8 @@ async def delete_multiple_flows(
             await cascade_delete_flow(db, flow.id)
 
         await db.commit()
+        for flow in flows_to_delete:
+            invalidate_prepared_graphs(flow.id)
         return {"deleted": len(flows_to_delete)}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
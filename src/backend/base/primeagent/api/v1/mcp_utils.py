@@ -13,7 +13,7 @@ from urllib.parse import quote, unquote, urlparse
 from uuid import uuid4
 
 from mcp import types
-from sqlmodel import select
+from sqlmodel import col, select, update
 from wfx.base.mcp.constants import MAX_MCP_TOOL_NAME_LENGTH
 from wfx.base.mcp.util import get_flow_snake_case, get_unique_name, sanitize_mcp_name
 from wfx.log.logger import logger
@@ -21,9 +21,9 @@ from wfx.utils.helpers import build_content_type_from_extension
 
 from primeagent.api.v1.endpoints import simple_run_flow
 from primeagent.api.v1.schemas import SimplifiedAPIRequest
-from primeagent.helpers.flow import json_schema_from_flow
 from primeagent.schema.message import Message
 from primeagent.services.database.models import Flow
+from primeagent.services.database.models.flow.utils import build_mcp_tool_schema, get_stored_input_schema
 from primeagent.services.database.models.user.model import User
 from primeagent.services.deps import get_settings_service, get_storage_service, session_scope
 
@@ -283,6 +283,22 @@ async def handle_call_tool(
         raise
 
 
+async def _get_input_schemas(session, flows) -> dict:
+    """Returns the input schemas of `flows` by id, storing the ones that had to be computed again."""
+    input_schemas = {flow.id: get_stored_input_schema(flow.mcp_tool_schema) for flow in flows}
+    if outdated_ids := [flow_id for flow_id, input_schema in input_schemas.items() if input_schema is None]:
+        rows = await session.exec(select(Flow.id, Flow.data).where(col(Flow.id).in_(outdated_ids)))
+        for flow_id, data in rows.all():
+            try:
+                mcp_tool_schema = build_mcp_tool_schema(data)
+            except Exception as e:  # noqa: BLE001
+                await logger.awarning(f"Error building the input schema of flow {flow_id}: {e!s}")
+                continue
+            input_schemas[flow_id] = mcp_tool_schema["input_schema"]
+            await session.exec(update(Flow).where(col(Flow.id) == flow_id).values(mcp_tool_schema=mcp_tool_schema))
+    return input_schemas
+
+
 async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
     """Handle listing tools for MCP.
 
@@ -293,17 +309,26 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
     tools = []
     try:
         async with session_scope() as session:
+            # Input schemas are read from the stored MCP tool schemas, the data of the flows is only
+            # loaded for the ones that are missing or outdated
+            flows_query = select(
+                Flow.id,
+                Flow.name,
+                Flow.description,
+                Flow.action_name,
+                Flow.action_description,
+                Flow.user_id,
+                Flow.mcp_tool_schema,
+            )
             # Build query based on parameters
             if project_id:
                 # Filter flows by project and optionally by MCP enabled status
-                flows_query = select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
+                flows_query = flows_query.where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
                 if mcp_enabled_only:
                     flows_query = flows_query.where(Flow.mcp_enabled == True)  # noqa: E712
-            else:
-                # Get all flows
-                flows_query = select(Flow)
 
             flows = (await session.exec(flows_query)).all()
+            input_schemas = await _get_input_schemas(session, flows)
 
             existing_names = set()
             for flow in flows:
@@ -341,7 +366,7 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
                     tool = types.Tool(
                         name=name,
                         description=description,
-                        inputSchema=json_schema_from_flow(flow),
+                        inputSchema=input_schemas[flow.id],
                     )
                     tools.append(tool)
                     existing_names.add(name)
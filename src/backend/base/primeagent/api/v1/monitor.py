@@ -1,10 +1,10 @@
-from typing import Annotated
+from typing import Annotated, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlmodel import apaginate
-from sqlalchemy import delete
+from sqlalchemy import and_, delete, or_
 from sqlmodel import col, select
 
 from primeagent.api.utils import DbSession, custom_params
@@ -66,7 +66,15 @@ async def get_messages(
     sender: Annotated[str | None, Query()] = None,
     sender_name: Annotated[str | None, Query()] = None,
     order_by: Annotated[str | None, Query()] = "timestamp",
+    order: Annotated[Literal["ASC", "DESC"], Query()] = "ASC",
+    limit: Annotated[int | None, Query(ge=1)] = None,
+    after: Annotated[UUID | None, Query()] = None,
 ) -> list[MessageResponse]:
+    """Get the messages matching the filters, in pages of `limit` messages when it is set.
+
+    Pages are read by keyset: `after` is the ID of the last message of the previous page, and the
+    page starts right after it in the `order_by` order, with the message IDs breaking ties.
+    """
     try:
         stmt = select(MessageTable)
         if flow_id:
@@ -80,11 +88,32 @@ async def get_messages(
             stmt = stmt.where(MessageTable.sender == sender)
         if sender_name:
             stmt = stmt.where(MessageTable.sender_name == sender_name)
-        if order_by:
-            col = getattr(MessageTable, order_by).asc()
-            stmt = stmt.order_by(col)
+        order_column = getattr(MessageTable, order_by or "timestamp")
+        descending = order == "DESC"
+        if after:
+            cursor = (await session.exec(select(order_column, MessageTable.id).where(MessageTable.id == after))).first()
+            if cursor is None:
+                raise HTTPException(status_code=404, detail="Message not found")
+            cursor_value, cursor_id = cursor
+            if descending:
+                stmt = stmt.where(
+                    or_(order_column < cursor_value, and_(order_column == cursor_value, MessageTable.id < cursor_id))
+                )
+            else:
+                stmt = stmt.where(
+                    or_(order_column > cursor_value, and_(order_column == cursor_value, MessageTable.id > cursor_id))
+                )
+        if order_by or after or limit:
+            if descending:
+                stmt = stmt.order_by(order_column.desc(), col(MessageTable.id).desc())
+            else:
+                stmt = stmt.order_by(order_column.asc(), col(MessageTable.id).asc())
+        if limit:
+            stmt = stmt.limit(limit)
         messages = await session.exec(stmt)
         return [MessageResponse.model_validate(d, from_attributes=True) for d in messages]
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -158,13 +158,19 @@ async def run_flow_for_openai_responses(
                                     list(data.keys()) if isinstance(data, dict) else type(data),
                                 )
 
-                                # Handle add_message events
+                                steps = []
                                 if event_type == "token":
                                     token_data = data.get("chunk", "")
+                                    # Streamed text is part of the text of the next message of the same answer
+                                    if isinstance(token_data, str):
+                                        previous_content += token_data
                                     await logger.adebug(
                                         "[OpenAIResponses][stream] token: token_data=%s",
                                         token_data,
                                     )
+                                if event_type == "content_block_delta":
+                                    steps = [data.get("content") or {}]
+                                # Handle add_message events
                                 if event_type == "add_message":
                                     sender_name = data.get("sender_name", "")
                                     text = data.get("text", "")
@@ -178,123 +184,13 @@ async def run_flow_for_openai_responses(
                                         len(text) if isinstance(text, str) else -1,
                                     )
 
-                                    # Look for Agent Steps in content_blocks
-                                    for block in content_blocks:
-                                        if block.get("title") == "Agent Steps":
-                                            contents = block.get("contents", [])
-                                            for step in contents:
-                                                # Look for tool_use type items
-                                                if step.get("type") == "tool_use":
-                                                    tool_name = step.get("name", "")
-                                                    tool_input = step.get("tool_input", {})
-                                                    tool_output = step.get("output")
-
-                                                    # Only emit tool calls with explicit tool names and
-                                                    # meaningful arguments
-                                                    if tool_name and tool_input is not None and tool_output is not None:
-                                                        # Create unique identifier for this tool call
-                                                        tool_signature = (
-                                                            f"{tool_name}:{hash(str(sorted(tool_input.items())))}"
-                                                        )
-
-                                                        # Skip if we've already processed this tool call
-                                                        if tool_signature in processed_tools:
-                                                            continue
-
-                                                        processed_tools.add(tool_signature)
-                                                        tool_call_counter += 1
-                                                        call_id = f"call_{tool_call_counter}"
-                                                        tool_id = f"fc_{tool_call_counter}"
-                                                        tool_call_event = {
-                                                            "type": "response.output_item.added",
-                                                            "item": {
-                                                                "id": tool_id,
-                                                                "type": "function_call",  # OpenAI uses "function_call"
-                                                                "status": "in_progress",  # OpenAI includes status
-                                                                "name": tool_name,
-                                                                "arguments": "",  # Start with empty, build via deltas
-                                                                "call_id": call_id,
-                                                            },
-                                                        }
-                                                        yield (
-                                                            f"event: response.output_item.added\n"
-                                                            f"data: {json.dumps(tool_call_event)}\n\n"
-                                                        )
-
-                                                        # Send function call arguments as delta events (like OpenAI)
-                                                        arguments_str = json.dumps(tool_input)
-                                                        arg_delta_event = {
-                                                            "type": "response.function_call_arguments.delta",
-                                                            "delta": arguments_str,
-                                                            "item_id": tool_id,
-                                                            "output_index": 0,
-                                                        }
-                                                        yield (
-                                                            f"event: response.function_call_arguments.delta\n"
-                                                            f"data: {json.dumps(arg_delta_event)}\n\n"
-                                                        )
-
-                                                        # Send function call arguments done event
-                                                        arg_done_event = {
-                                                            "type": "response.function_call_arguments.done",
-                                                            "arguments": arguments_str,
-                                                            "item_id": tool_id,
-                                                            "output_index": 0,
-                                                        }
-                                                        yield (
-                                                            f"event: response.function_call_arguments.done\n"
-                                                            f"data: {json.dumps(arg_done_event)}\n\n"
-                                                        )
-                                                        await logger.adebug(
-                                                            "[OpenAIResponses][stream] tool_call.args.done name=%s",
-                                                            tool_name,
-                                                        )
-
-                                                        # If there's output, send completion event
-                                                        if tool_output is not None:
-                                                            # Check if include parameter requests tool_call.results
-                                                            include_results = (
-                                                                request.include
-                                                                and "tool_call.results" in request.include
-                                                            )
-
-                                                            if include_results:
-                                                                # Format with detailed results
-                                                                tool_done_event = {
-                                                                    "type": "response.output_item.done",
-                                                                    "item": {
-                                                                        "id": f"{tool_name}_{tool_id}",
-                                                                        "inputs": tool_input,  # Raw inputs as-is
-                                                                        "status": "completed",
-                                                                        "type": "tool_call",
-                                                                        "tool_name": f"{tool_name}",
-                                                                        "results": tool_output,  # Raw output as-is
-                                                                    },
-                                                                    "output_index": 0,
-                                                                    "sequence_number": tool_call_counter + 5,
-                                                                }
-                                                            else:
-                                                                # Regular function call format
-                                                                tool_done_event = {
-                                                                    "type": "response.output_item.done",
-                                                                    "item": {
-                                                                        "id": tool_id,
-                                                                        "type": "function_call",  # Match OpenAI format
-                                                                        "status": "completed",
-                                                                        "arguments": arguments_str,
-                                                                        "call_id": call_id,
-                                                                        "name": tool_name,
-                                                                    },
-                                                                }
-
-                                                            yield (
-                                                                f"event: response.output_item.done\n"
-                                                                f"data: {json.dumps(tool_done_event)}\n\n"
-                                                            )
-                                                            await logger.adebug(
-                                                                "[OpenAIResponses][stream] tool_call.done name=%s",
-                                                                tool_name,
-                                                            )
+                                    # Tool calls of the agent steps
+                                    steps = [
+                                        step
+                                        for block in content_blocks
+                                        if block.get("title") == "Agent Steps"
+                                        for step in block.get("contents", [])
+                                    ]
 
                                     # Extract text content for streaming (only AI responses)
                                     if (
@@ -321,6 +217,118 @@ async def run_flow_for_openai_responses(
                                                 len(content),
                                             )
 
+                                # Emit the tool calls of the agent steps, whole or streamed as deltas
+                                for step in steps:
+                                    # Look for tool_use type items
+                                    if step.get("type") == "tool_use":
+                                        tool_name = step.get("name", "")
+                                        tool_input = step.get("tool_input", {})
+                                        tool_output = step.get("output")
+
+                                        # Only emit tool calls with explicit tool names and
+                                        # meaningful arguments
+                                        if tool_name and tool_input is not None and tool_output is not None:
+                                            # Create unique identifier for this tool call
+                                            tool_signature = f"{tool_name}:{hash(str(sorted(tool_input.items())))}"
+
+                                            # Skip if we've already processed this tool call
+                                            if tool_signature in processed_tools:
+                                                continue
+
+                                            processed_tools.add(tool_signature)
+                                            tool_call_counter += 1
+                                            call_id = f"call_{tool_call_counter}"
+                                            tool_id = f"fc_{tool_call_counter}"
+                                            tool_call_event = {
+                                                "type": "response.output_item.added",
+                                                "item": {
+                                                    "id": tool_id,
+                                                    "type": "function_call",  # OpenAI uses "function_call"
+                                                    "status": "in_progress",  # OpenAI includes status
+                                                    "name": tool_name,
+                                                    "arguments": "",  # Start with empty, build via deltas
+                                                    "call_id": call_id,
+                                                },
+                                            }
+                                            yield (
+                                                f"event: response.output_item.added\n"
+                                                f"data: {json.dumps(tool_call_event)}\n\n"
+                                            )
+
+                                            # Send function call arguments as delta events (like OpenAI)
+                                            arguments_str = json.dumps(tool_input)
+                                            arg_delta_event = {
+                                                "type": "response.function_call_arguments.delta",
+                                                "delta": arguments_str,
+                                                "item_id": tool_id,
+                                                "output_index": 0,
+                                            }
+                                            yield (
+                                                f"event: response.function_call_arguments.delta\n"
+                                                f"data: {json.dumps(arg_delta_event)}\n\n"
+                                            )
+
+                                            # Send function call arguments done event
+                                            arg_done_event = {
+                                                "type": "response.function_call_arguments.done",
+                                                "arguments": arguments_str,
+                                                "item_id": tool_id,
+                                                "output_index": 0,
+                                            }
+                                            yield (
+                                                f"event: response.function_call_arguments.done\n"
+                                                f"data: {json.dumps(arg_done_event)}\n\n"
+                                            )
+                                            await logger.adebug(
+                                                "[OpenAIResponses][stream] tool_call.args.done name=%s",
+                                                tool_name,
+                                            )
+
+                                            # If there's output, send completion event
+                                            if tool_output is not None:
+                                                # Check if include parameter requests tool_call.results
+                                                include_results = (
+                                                    request.include and "tool_call.results" in request.include
+                                                )
+
+                                                if include_results:
+                                                    # Format with detailed results
+                                                    tool_done_event = {
+                                                        "type": "response.output_item.done",
+                                                        "item": {
+                                                            "id": f"{tool_name}_{tool_id}",
+                                                            "inputs": tool_input,  # Raw inputs as-is
+                                                            "status": "completed",
+                                                            "type": "tool_call",
+                                                            "tool_name": f"{tool_name}",
+                                                            "results": tool_output,  # Raw output as-is
+                                                        },
+                                                        "output_index": 0,
+                                                        "sequence_number": tool_call_counter + 5,
+                                                    }
+                                                else:
+                                                    # Regular function call format
+                                                    tool_done_event = {
+                                                        "type": "response.output_item.done",
+                                                        "item": {
+                                                            "id": tool_id,
+                                                            "type": "function_call",  # Match OpenAI format
+                                                            "status": "completed",
+                                                            "arguments": arguments_str,
+                                                            "call_id": call_id,
+                                                            "name": tool_name,
+                                                        },
+                                                    }
+
+                                                yield (
+                                                    f"event: response.output_item.done\n"
+                                                    f"data: {json.dumps(tool_done_event)}\n\n"
+                                                )
+                                                await logger.adebug(
+                                                    "[OpenAIResponses][stream] tool_call.done name=%s",
+                                                    tool_name,
+                                                )
+
                         except (json.JSONDecodeError, UnicodeDecodeError):
                             await logger.adebug("[OpenAIResponses][stream] failed to decode event bytes; skipping")
                             continue
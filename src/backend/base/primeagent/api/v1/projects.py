@@ -13,7 +13,6 @@ from fastapi.responses import StreamingResponse
 from fastapi_pagination import Params
 from fastapi_pagination.ext.sqlmodel import apaginate
 from sqlalchemy import or_, update
-from sqlalchemy.orm import selectinload
 from sqlmodel import select
 from wfx.log.logger import logger
 from wfx.services.mcp_composer.service import MCPComposerService
@@ -236,11 +235,7 @@ async def read_project(
 ):
     try:
         project = (
-            await session.exec(
-                select(Folder)
-                .options(selectinload(Folder.flows))
-                .where(Folder.id == project_id, Folder.user_id == current_user.id)
-            )
+            await session.exec(select(Folder).where(Folder.id == project_id, Folder.user_id == current_user.id))
         ).first()
     except Exception as e:
         if "No result found" in str(e):
@@ -275,9 +270,10 @@ async def read_project(
             return FolderWithPaginatedFlows(folder=FolderRead.model_validate(project), flows=paginated_flows)
 
         # If no pagination requested, return all flows for the current user
-        flows_from_current_user_in_project = [flow for flow in project.flows if flow.user_id == current_user.id]
-        project.flows = flows_from_current_user_in_project
-        return project  # noqa: TRY300
+        flows_from_current_user_in_project = (
+            await session.exec(select(Flow).where(Flow.folder_id == project_id, Flow.user_id == current_user.id))
+        ).all()
+        return FolderReadWithFlows.model_validate({**project.model_dump(), "flows": flows_from_current_user_in_project})
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
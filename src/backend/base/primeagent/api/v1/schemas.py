@@ -337,6 +337,10 @@ class VerticesBuiltResponse(BaseModel):
 
 class SimplifiedAPIRequest(BaseModel):
     input_value: str | None = Field(default=None, description="The input value")
+    input_values: list[str] | None = Field(
+        default=None,
+        description="A batch of input values, each run on its own. The outputs are returned in the same order.",
+    )
     input_type: InputType | None = Field(default="chat", description="The input type")
     output_type: OutputType | None = Field(default="chat", description="The output type")
     output_component: str | None = Field(
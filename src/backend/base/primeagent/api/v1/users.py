@@ -15,6 +15,7 @@ from primeagent.services.auth.utils import (
     get_password_hash,
     verify_password,
 )
+from primeagent.services.database.models.api_key.crud import invalidate_verified_api_keys
 from primeagent.services.database.models.user.crud import get_user_by_id, update_user
 from primeagent.services.database.models.user.model import User, UserCreate, UserRead, UserUpdate
 from primeagent.services.deps import get_settings_service
@@ -142,5 +143,6 @@ async def delete_user(
 
     await session.delete(user_db)
     await session.commit()
+    invalidate_verified_api_keys(user_id=user_id)
 
     return {"detail": "User deleted"}
@@ -1,7 +1,5 @@
-import io
 import re
 import uuid
-import zipfile
 from collections.abc import AsyncGenerator, AsyncIterable
 from datetime import datetime
 from http import HTTPStatus
@@ -9,7 +7,7 @@ from pathlib import Path
 from typing import Annotated
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Header, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
 from sqlmodel import col, select
 from wfx.log.logger import logger
@@ -19,6 +17,7 @@ from primeagent.api.utils import CurrentActiveUser, DbSession
 from primeagent.services.database.models.file.model import File as UserFile
 from primeagent.services.deps import get_settings_service, get_storage_service
 from primeagent.services.storage.service import StorageService
+from primeagent.utils.zip_stream import ZipEntry, stream_zip
 
 router = APIRouter(tags=["Files"], prefix="/files")
 
@@ -51,6 +50,33 @@ async def byte_stream_generator(file_input, chunk_size: int = 8192) -> AsyncGene
             yield chunk
 
 
+def parse_byte_range(range_header: str, file_size: int) -> tuple[int, int] | None:
+    """Parse a single `bytes=` range of an HTTP Range header into inclusive (first, last) offsets.
+
+    Returns None for headers that should be ignored (other units or several ranges), and raises a
+    416 HTTPException for ranges outside of the file.
+    """
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+    first, _, last = ranges.strip().partition("-")
+    try:
+        if not first:
+            # Suffix range: the last `last` bytes
+            start, end = max(file_size - int(last), 0), file_size - 1
+        else:
+            start, end = int(first), min(int(last), file_size - 1) if last else file_size - 1
+    except ValueError:
+        return None
+    if start > end or start >= file_size:
+        raise HTTPException(
+            status_code=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{file_size}"},
+        )
+    return start, end
+
+
 async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser, session: DbSession):
     # Fetch the file from the DB
     stmt = select(UserFile).where(UserFile.id == file_id)
@@ -319,27 +345,17 @@ async def download_files_batch(
         if not files:
             raise HTTPException(status_code=404, detail="No files found")
 
-        # Create a byte stream to hold the ZIP file
-        zip_stream = io.BytesIO()
-
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
-            for file in files:
-                # Get the file content from storage
-                file_content = await storage_service.get_file(
-                    flow_id=str(current_user.id), file_name=file.path.split("/")[-1]
-                )
-
-                # Get the file extension from the original filename
-                file_extension = Path(file.path).suffix
-                # Create the filename with extension
-                filename_with_extension = f"{file.name}{file_extension}"
-
-                # Write the file to the ZIP with the proper extension
-                zip_file.writestr(filename_with_extension, file_content)
+        def zip_entry(file: UserFile) -> ZipEntry:
+            file_name = file.path.split("/")[-1]
+            return ZipEntry(
+                # Name the entry after the original filename, with its extension
+                name=f"{file.name}{Path(file.path).suffix}",
+                open_stream=lambda: storage_service.stream_file(flow_id=str(current_user.id), file_name=file_name),
+                size=file.size,
+            )
 
-        # Seek to the beginning of the byte stream
-        zip_stream.seek(0)
+        # The archive is written while it is sent, reading a few files ahead from storage
+        zip_stream = stream_zip([zip_entry(file) for file in files])
 
         # Generate the filename with the current datetime
         current_time = datetime.now(tz=ZoneInfo("UTC")).astimezone().strftime("%Y%m%d_%H%M%S")
@@ -399,6 +415,7 @@ async def download_file(
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
     *,
     return_content: bool = False,
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
 ):
     """Download a file by its ID or return its content as a string/bytes.
 
@@ -408,6 +425,7 @@ async def download_file(
         session: Database session.
         storage_service: File storage service.
         return_content: If True, return raw content (str) instead of StreamingResponse.
+        range_header: HTTP Range header; a single byte range is answered with a 206 partial response.
 
     Returns:
         StreamingResponse for client downloads or str for internal use.
@@ -421,28 +439,39 @@ async def download_file(
         # Get the basename of the file path
         file_name = file.path.split("/")[-1]
 
-        # Get file stream
-        file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
-
-        if file_stream is None:
-            raise HTTPException(status_code=404, detail="File stream not available")
-
         # If return_content is True, read the file content and return it
         if return_content:
+            file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
+            if file_stream is None:
+                raise HTTPException(status_code=404, detail="File stream not available")
             return await read_file_content(file_stream, decode=True)
 
-        # For streaming, ensure file_stream is an async iterator returning bytes
-        byte_stream = byte_stream_generator(file_stream)
-
         # Create the filename with extension
         file_extension = Path(file.path).suffix
         filename_with_extension = f"{file.name}{file_extension}"
+        headers = {
+            "Content-Disposition": f'attachment; filename="{filename_with_extension}"',
+            "Accept-Ranges": "bytes",
+        }
+
+        # Also fails here, before the response starts, when the file is missing from storage
+        file_size = await storage_service.get_file_size(flow_id=str(current_user.id), file_name=file_name)
+        byte_range = parse_byte_range(range_header, file_size) if range_header else None
+        if byte_range is not None:
+            headers["Content-Range"] = f"bytes {byte_range[0]}-{byte_range[1]}/{file_size}"
+            headers["Content-Length"] = str(byte_range[1] - byte_range[0] + 1)
+        else:
+            headers["Content-Length"] = str(file_size)
 
-        # Return the file as a streaming response
+        # Stream the file from storage instead of loading it in memory
+        byte_stream = storage_service.stream_file(
+            flow_id=str(current_user.id), file_name=file_name, byte_range=byte_range
+        )
         return StreamingResponse(
             byte_stream,
+            status_code=HTTPStatus.PARTIAL_CONTENT if byte_range is not None else HTTPStatus.OK,
             media_type="application/octet-stream",
-            headers={"Content-Disposition": f'attachment; filename="{filename_with_extension}"'},
+            headers=headers,
         )
 
     except HTTPException:
@@ -6,10 +6,10 @@ from uuid import UUID
 from fastapi import HTTPException
 from pydantic.v1 import BaseModel, Field, create_model
 from sqlmodel import select
-from wfx.log.logger import logger
 
 from primeagent.schema.schema import INPUT_FIELD_NAME
 from primeagent.services.database.models.flow.model import Flow, FlowRead
+from primeagent.services.database.models.flow.utils import get_input_schema_from_flow_data
 from primeagent.services.deps import get_settings_service, session_scope
 
 if TYPE_CHECKING:
@@ -320,42 +320,4 @@ async def generate_unique_flow_name(flow_name, user_id, session):
 
 def json_schema_from_flow(flow: Flow) -> dict:
     """Generate JSON schema from flow input nodes."""
-    from wfx.graph.graph.base import Graph
-
-    # Get the flow's data which contains the nodes and their configurations
-    flow_data = flow.data or {}
-
-    graph = Graph.from_payload(flow_data)
-    input_nodes = [vertex for vertex in graph.vertices if vertex.is_input]
-
-    properties = {}
-    required = []
-    for node in input_nodes:
-        node_data = node.data["node"]
-        template = node_data["template"]
-
-        for field_name, field_data in template.items():
-            if field_data != "Component" and field_data.get("show", False) and not field_data.get("advanced", False):
-                field_type = field_data.get("type", "string")
-                properties[field_name] = {
-                    "type": field_type,
-                    "description": field_data.get("info", f"Input for {field_name}"),
-                }
-                # Update field_type in properties after determining the JSON Schema type
-                if field_type == "str":
-                    field_type = "string"
-                elif field_type == "int":
-                    field_type = "integer"
-                elif field_type == "float":
-                    field_type = "number"
-                elif field_type == "bool":
-                    field_type = "boolean"
-                else:
-                    logger.warning(f"Unknown field type: {field_type} defaulting to string")
-                    field_type = "string"
-                properties[field_name]["type"] = field_type
-
-                if field_data.get("required", False):
-                    required.append(field_name)
-
-    return {"type": "object", "properties": properties, "required": required}
+    return get_input_schema_from_flow_data(flow.data)
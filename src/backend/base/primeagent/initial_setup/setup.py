@@ -45,6 +45,14 @@ from primeagent.services.database.models.folder.constants import (
 from primeagent.services.database.models.folder.model import Folder, FolderCreate, FolderRead
 from primeagent.services.deps import get_settings_service, get_storage_service, get_variable_service, session_scope
 
+try:
+    from watchfiles import awatch
+except ImportError:
+    awatch = None
+
+# Fields of a flow file copied to the flow when the file is modified
+FS_FLOW_FIELDS = ("name", "description", "data", "locked")
+
 # In the folder ./starter_projects we have a few JSON files that represent
 # starter projects. We want to load these into the database so that users
 # can use them as a starting point for their own projects.
@@ -1095,38 +1103,114 @@ async def get_or_create_default_folder(session: AsyncSession, user_id: UUID) ->
     return FolderRead.model_validate(folder_obj, from_attributes=True)
 
 
+def _absolute_flow_paths(rows) -> dict[str, UUID]:
+    return {str(Path(fs_path).absolute()): flow_id for flow_id, fs_path in rows}
+
+
+def _flow_file_folders(flow_paths: dict[str, UUID]) -> set[str]:
+    return {str(Path(fs_path).parent) for fs_path in flow_paths}
+
+
+async def _get_fs_flow_paths() -> dict[str, UUID]:
+    """Map the absolute paths of the flows saved to the file system to their IDs."""
+    async with session_scope() as session:
+        rows = (await session.exec(select(Flow.id, Flow.fs_path).where(col(Flow.fs_path).is_not(None)))).all()
+    return _absolute_flow_paths(rows)
+
+
+async def _update_flows_from_fs(flow_paths: dict[str, UUID], flow_mtimes: dict[str, float]) -> None:
+    """Update, in one transaction, the flows whose file was modified since it was last read."""
+    updates: dict[UUID, dict] = {}
+    for fs_path, flow_id in flow_paths.items():
+        path = anyio.Path(fs_path)
+        try:
+            if not await path.exists():
+                continue
+            mtime = (await path.stat()).st_mtime
+            if mtime <= flow_mtimes.get(fs_path, 0):
+                continue
+            update_data = orjson.loads(await path.read_text(encoding="utf-8"))
+            values = {field_name: value for field_name in FS_FLOW_FIELDS if (value := update_data.get(field_name))}
+            if folder_id := update_data.get("folder_id"):
+                values["folder_id"] = UUID(folder_id)
+            if "data" in values:
+                # Computed again the next time MCP tools are listed
+                values["mcp_tool_schema"] = None
+            if "name" in values:
+                # Flows without stored MCP tool names are still found by MCP tool calls
+                values["mcp_tool_name"] = values["mcp_action_name"] = None
+            flow_mtimes[fs_path] = mtime
+        except Exception:  # noqa: BLE001
+            await logger.aexception(f"Error while handling flow file {path}")
+            continue
+        if values:
+            updates[flow_id] = values
+
+    if not updates:
+        return
+    try:
+        async with session_scope() as session:
+            for flow_id, values in updates.items():
+                await session.exec(sa.update(Flow).where(col(Flow.id) == flow_id).values(**values))
+    except Exception:  # noqa: BLE001
+        await logger.aexception(f"Couldn't update flows {list(updates)} in database from the file system")
+
+
+async def _watch_flow_files(flow_paths: dict[str, UUID], flow_mtimes: dict[str, float], interval: int) -> None:
+    """Update the flows when their files change, until the paths of the flows change.
+
+    Only the folders of the flow files are watched, and the paths are looked up again every
+    `interval` milliseconds.
+    """
+    folders = [folder for folder in _flow_file_folders(flow_paths) if await anyio.Path(folder).is_dir()]
+    if not folders:
+        await asyncio.sleep(interval / 1000)
+        return
+
+    await _update_flows_from_fs(flow_paths, flow_mtimes)
+    started = False
+    async for changes in awatch(
+        *folders,
+        watch_filter=lambda _change, path: path in flow_paths,
+        rust_timeout=interval,
+        yield_on_timeout=True,
+        recursive=False,
+    ):
+        if not started:
+            # Catch up with the files modified while the watcher was starting
+            await _update_flows_from_fs(flow_paths, flow_mtimes)
+            started = True
+        elif changes:
+            changed = {path for _change, path in changes}
+            await _update_flows_from_fs({path: flow_paths[path] for path in changed}, flow_mtimes)
+        if await _get_fs_flow_paths() != flow_paths:
+            return
+
+
 async def sync_flows_from_fs():
-    flow_mtimes = {}
-    fs_flows_polling_interval = get_settings_service().settings.fs_flows_polling_interval / 1000
+    """Keep the flows saved to the file system up to date with their files.
+
+    The files are watched with watchfiles, and polled every `fs_flows_polling_interval` if it is
+    missing or cannot watch them. Either way only the IDs and paths of the flows are read from the
+    database to find the files, and a flow is only written when its file changed.
+    """
+    flow_mtimes: dict[str, float] = {}
+    fs_flows_polling_interval = get_settings_service().settings.fs_flows_polling_interval
+    watch_files = awatch is not None
+    if not watch_files:
+        await logger.awarning("watchfiles is not installed, polling the flow files instead of watching them")
     try:
         while True:
             try:
-                async with session_scope() as session:
-                    stmt = select(Flow).where(col(Flow.fs_path).is_not(None))
-                    flows = (await session.exec(stmt)).all()
-                    for flow in flows:
-                        mtime = flow_mtimes.setdefault(flow.id, 0)
-                        path = anyio.Path(flow.fs_path)
-                        try:
-                            if await path.exists():
-                                new_mtime = (await path.stat()).st_mtime
-                                if new_mtime > mtime:
-                                    update_data = orjson.loads(await path.read_text(encoding="utf-8"))
-                                    try:
-                                        for field_name in ("name", "description", "data", "locked"):
-                                            if new_value := update_data.get(field_name):
-                                                setattr(flow, field_name, new_value)
-                                        if folder_id := update_data.get("folder_id"):
-                                            flow.folder_id = UUID(folder_id)
-                                        await session.commit()
-                                        await session.refresh(flow)
-                                    except Exception:  # noqa: BLE001
-                                        await logger.aexception(
-                                            f"Couldn't update flow {flow.id} in database from path {path}"
-                                        )
-                                    flow_mtimes[flow.id] = new_mtime
-                        except Exception:  # noqa: BLE001
-                            await logger.aexception(f"Error while handling flow file {path}")
+                flow_paths = await _get_fs_flow_paths()
+                if watch_files and flow_paths:
+                    try:
+                        await _watch_flow_files(flow_paths, flow_mtimes, fs_flows_polling_interval)
+                        continue
+                    except OSError:
+                        await logger.aexception("Couldn't watch the flow files, polling them instead")
+                        watch_files = False
+                await _update_flows_from_fs(flow_paths, flow_mtimes)
             except asyncio.CancelledError:
                 await logger.adebug("Flow sync cancelled")
                 break
@@ -1139,6 +1223,6 @@ async def sync_flows_from_fs():
                 await logger.aexception("Error while syncing flows from database")
                 break
 
-            await asyncio.sleep(fs_flows_polling_interval)
+            await asyncio.sleep(fs_flows_polling_interval / 1000)
     except asyncio.CancelledError:
         await logger.adebug("Flow sync task cancelled")
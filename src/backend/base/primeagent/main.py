@@ -34,6 +34,11 @@ from primeagent.initial_setup.setup import (
     sync_flows_from_fs,
 )
 from primeagent.middleware import ContentSizeLimitMiddleware
+from primeagent.services.database.models.api_key.crud import (
+    flush_api_key_uses,
+    flush_api_key_uses_periodically,
+    invalidate_verified_api_keys,
+)
 from primeagent.services.deps import get_queue_service, get_service, get_settings_service, get_telemetry_service
 from primeagent.services.schema import ServiceType
 from primeagent.services.utils import initialize_services, initialize_settings_service, teardown_services
@@ -157,6 +162,7 @@ def get_lifespan(*, fix_migration=False, version=None):
         temp_dirs: list[TemporaryDirectory] = []
         sync_flows_from_fs_task = None
         mcp_init_task = None
+        api_key_uses_flush_task = None
 
         try:
             start_time = asyncio.get_event_loop().time()
@@ -236,6 +242,7 @@ def get_lifespan(*, fix_migration=False, version=None):
             await logger.adebug("Loading flows")
             await load_flows_from_directory()
             sync_flows_from_fs_task = asyncio.create_task(sync_flows_from_fs())
+            api_key_uses_flush_task = asyncio.create_task(flush_api_key_uses_periodically())
             queue_service = get_queue_service()
             if not queue_service.is_started():  # Start if not already started
                 queue_service.start()
@@ -306,6 +313,9 @@ def get_lifespan(*, fix_migration=False, version=None):
                     if mcp_init_task and not mcp_init_task.done():
                         mcp_init_task.cancel()
                         tasks_to_cancel.append(mcp_init_task)
+                    if api_key_uses_flush_task:
+                        api_key_uses_flush_task.cancel()
+                        tasks_to_cancel.append(api_key_uses_flush_task)
                     if tasks_to_cancel:
                         # Wait for all tasks to complete, capturing exceptions
                         results = await asyncio.gather(*tasks_to_cancel, return_exceptions=True)
@@ -316,6 +326,9 @@ def get_lifespan(*, fix_migration=False, version=None):
 
                 # Step 2: Cleaning Up Services
                 with shutdown_progress.step(2):
+                    # API key uses aggregated since the last write
+                    await flush_api_key_uses()
+                    invalidate_verified_api_keys()
                     try:
                         await asyncio.wait_for(teardown_services(), timeout=30)
                     except asyncio.TimeoutError:
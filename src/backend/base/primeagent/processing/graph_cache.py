@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from cachetools import LRUCache
+
+from primeagent.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from wfx.graph.graph.base import Graph
+
+    from primeagent.schema.graph import Tweaks
+
+PreparedGraphKey = tuple[str, str, str, bool, str]
+
+
+@dataclass(frozen=True)
+class PreparedGraphCacheInfo:
+    """Snapshot of the prepared graph cache counters."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PreparedGraphCache:
+    """LRU cache of prepared flow graphs used as templates by the run endpoints.
+
+    Each entry is a graph built with `Graph.from_payload` that is never run itself: callers run a
+    `Graph.fork()` of it, which skips rebuilding vertices, edges and graph maps on every request.
+    Keys include the flow `updated_at` timestamp, so edited flows never hit stale templates, and
+    `invalidate` drops every template of a flow once it is saved or deleted.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._cache: LRUCache[PreparedGraphKey, Graph] = LRUCache(maxsize=max(maxsize, 1))
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    @staticmethod
+    def make_key(
+        flow_id: str,
+        updated_at: datetime | None,
+        tweaks: Tweaks | dict[str, Any] | None,
+        *,
+        stream: bool,
+        user_id: str,
+    ) -> PreparedGraphKey:
+        tweaks_dict = tweaks.model_dump() if tweaks is not None and not isinstance(tweaks, dict) else tweaks or {}
+        tweaks_hash = hashlib.sha256(orjson.dumps(tweaks_dict, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+        return flow_id, updated_at.isoformat() if updated_at else "", tweaks_hash, stream, user_id
+
+    def get(self, key: PreparedGraphKey) -> Graph | None:
+        with self._lock:
+            graph = self._cache.get(key)
+            if graph is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return graph
+
+    def set(self, key: PreparedGraphKey, graph: Graph) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._cache[key] = graph
+
+    def invalidate(self, flow_id: str) -> int:
+        """Removes every template of `flow_id` and returns how many were removed."""
+        with self._lock:
+            keys = [key for key in self._cache if key[0] == flow_id]
+            for key in keys:
+                del self._cache[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> PreparedGraphCacheInfo:
+        with self._lock:
+            return PreparedGraphCacheInfo(
+                hits=self._hits, misses=self._misses, size=len(self._cache), maxsize=self.maxsize
+            )
+
+
+_prepared_graph_cache: PreparedGraphCache | None = None
+
+
+def get_prepared_graph_cache() -> PreparedGraphCache:
+    """Returns the process-wide prepared graph cache, sized by the `graph_template_cache_size` setting."""
+    global _prepared_graph_cache  # noqa: PLW0603
+    if _prepared_graph_cache is None:
+        _prepared_graph_cache = PreparedGraphCache(get_settings_service().settings.graph_template_cache_size)
+    return _prepared_graph_cache
+
+
+def invalidate_prepared_graphs(flow_id: str | Any) -> None:
+    """Drops the cached templates of a flow after it is saved or deleted."""
+    if _prepared_graph_cache is not None:
+        _prepared_graph_cache.invalidate(str(flow_id))
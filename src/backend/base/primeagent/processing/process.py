@@ -32,8 +32,12 @@ async def run_graph_internal(
     inputs: list[InputValueRequest] | None = None,
     outputs: list[str] | None = None,
     event_manager: EventManager | None = None,
+    batch_concurrency: int | None = None,
 ) -> tuple[list[RunOutputs], str]:
-    """Run the graph and generate the result."""
+    """Run the graph and generate the result.
+
+    With a `batch_concurrency`, each input runs on its own fork of the graph, see `Graph.arun`.
+    """
     inputs = inputs or []
     effective_session_id = session_id or flow_id
     components = []
@@ -58,6 +62,7 @@ async def run_graph_internal(
         session_id=effective_session_id or "",
         fallback_to_env_vars=fallback_to_env_vars,
         event_manager=event_manager,
+        batch_concurrency=batch_concurrency,
     )
     return run_outputs, effective_session_id
 
@@ -1,11 +1,18 @@
+import asyncio
 import datetime
+import hashlib
 import secrets
+import threading
+import time
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from cachetools import TTLCache
+from sqlalchemy import case
 from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlmodel import col, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
+from wfx.log.logger import logger
 
 from primeagent.services.database.models.api_key.model import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
 from primeagent.services.database.models.user.model import User
@@ -14,8 +21,19 @@ from primeagent.services.deps import get_settings_service, session_scope
 if TYPE_CHECKING:
     from sqlmodel.sql.expression import SelectOfScalar
 
+# Verified API keys by the SHA-256 hash of the key, with the id of the key and of its user
+_verified_keys: TTLCache[str, tuple[UUID, UUID]] | None = None
+_verified_keys_lock = threading.Lock()
+# Uses of API keys not written to the database yet, by key id
+_pending_uses: dict[UUID, int] = {}
+_pending_last_used_at: dict[UUID, datetime.datetime] = {}
+_last_uses_flush = time.monotonic()
+# Whether `flush_api_key_uses_periodically` is running
+_periodic_uses_flush = False
+
 
 async def get_api_keys(session: AsyncSession, user_id: UUID) -> list[ApiKeyRead]:
+    await flush_api_key_uses()
     query: SelectOfScalar = select(ApiKey).where(ApiKey.user_id == user_id)
     api_keys = (await session.exec(query)).all()
     return [ApiKeyRead.model_validate(api_key) for api_key in api_keys]
@@ -47,28 +65,113 @@ async def delete_api_key(session: AsyncSession, api_key_id: UUID) -> None:
         raise ValueError(msg)
     await session.delete(api_key)
     await session.commit()
+    invalidate_verified_api_keys(api_key_id=api_key_id)
+
+
+def _get_verified_keys() -> TTLCache[str, tuple[UUID, UUID]] | None:
+    global _verified_keys  # noqa: PLW0603
+    ttl = get_settings_service().settings.api_key_cache_ttl
+    if ttl <= 0:
+        return None
+    if _verified_keys is None or _verified_keys.ttl != ttl:
+        _verified_keys = TTLCache(maxsize=10_000, ttl=ttl)
+    return _verified_keys
+
+
+def invalidate_verified_api_keys(*, api_key_id: UUID | None = None, user_id: UUID | None = None) -> None:
+    """Drops the cached verification of an API key, of all the keys of a user, or of every key."""
+    if _verified_keys is None:
+        return
+    with _verified_keys_lock:
+        if api_key_id is None and user_id is None:
+            _verified_keys.clear()
+            return
+        for key_hash, (cached_key_id, cached_user_id) in list(_verified_keys.items()):
+            if cached_key_id == api_key_id or cached_user_id == user_id:
+                _verified_keys.pop(key_hash, None)
 
 
 async def check_key(session: AsyncSession, api_key: str) -> User | None:
-    """Check if the API key is valid."""
-    query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
-    api_key_object: ApiKey | None = (await session.exec(query)).first()
-    if api_key_object is not None:
-        settings_service = get_settings_service()
-        if settings_service.settings.disable_track_apikey_usage is not True:
-            await update_total_uses(api_key_object.id)
-        return api_key_object.user
-    return None
+    """Check if the API key is valid.
+
+    Valid keys are cached for `api_key_cache_ttl` seconds with the id of their user, so checking them again
+    only loads the user, in the session of the caller.
+    """
+    verified_keys = _get_verified_keys()
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+    verified = None
+    if verified_keys is not None:
+        with _verified_keys_lock:
+            verified = verified_keys.get(key_hash)
+    if verified is None:
+        query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
+        api_key_object: ApiKey | None = (await session.exec(query)).first()
+        if api_key_object is None:
+            return None
+        api_key_id, user = api_key_object.id, api_key_object.user
+        if verified_keys is not None and user is not None:
+            with _verified_keys_lock:
+                verified_keys[key_hash] = (api_key_id, user.id)
+    else:
+        api_key_id, user_id = verified
+        user = await session.get(User, user_id)
+        if user is None:
+            invalidate_verified_api_keys(user_id=user_id)
+
+    settings_service = get_settings_service()
+    if settings_service.settings.disable_track_apikey_usage is not True:
+        await update_total_uses(api_key_id)
+    return user
 
 
 async def update_total_uses(api_key_id: UUID):
-    """Update the total uses and last used at."""
-    async with session_scope() as session:
-        new_api_key = await session.get(ApiKey, api_key_id)
-        if new_api_key is None:
-            msg = "API Key not found"
-            raise ValueError(msg)
-        new_api_key.total_uses += 1
-        new_api_key.last_used_at = datetime.datetime.now(datetime.timezone.utc)
-        session.add(new_api_key)
-        await session.commit()
+    """Count a use of an API key.
+
+    Uses are aggregated in memory and written every `api_key_usage_flush_interval` seconds by
+    `flush_api_key_uses_periodically`. Without it, they are written by the first use once the interval has passed.
+    """
+    _pending_uses[api_key_id] = _pending_uses.get(api_key_id, 0) + 1
+    _pending_last_used_at[api_key_id] = datetime.datetime.now(datetime.timezone.utc)
+    flush_interval = get_settings_service().settings.api_key_usage_flush_interval
+    if flush_interval <= 0 or (not _periodic_uses_flush and time.monotonic() - _last_uses_flush >= flush_interval):
+        await flush_api_key_uses()
+
+
+async def flush_api_key_uses_periodically() -> None:
+    """Write the uses of API keys every `api_key_usage_flush_interval` seconds, until cancelled."""
+    global _periodic_uses_flush  # noqa: PLW0603
+    _periodic_uses_flush = True
+    try:
+        while True:
+            await asyncio.sleep(max(get_settings_service().settings.api_key_usage_flush_interval, 0.1))
+            await flush_api_key_uses()
+    finally:
+        _periodic_uses_flush = False
+
+
+async def flush_api_key_uses() -> None:
+    """Add the uses of API keys aggregated in memory to their total uses, in one UPDATE."""
+    global _last_uses_flush  # noqa: PLW0603
+    _last_uses_flush = time.monotonic()
+    if not _pending_uses:
+        return
+    uses = dict(_pending_uses)
+    last_used_at = dict(_pending_last_used_at)
+    _pending_uses.clear()
+    _pending_last_used_at.clear()
+    try:
+        async with session_scope() as session:
+            await session.exec(
+                update(ApiKey)
+                .where(col(ApiKey.id).in_(list(uses)))
+                .values(
+                    total_uses=ApiKey.total_uses + case(uses, value=ApiKey.id, else_=0),
+                    last_used_at=case(last_used_at, value=ApiKey.id, else_=ApiKey.last_used_at),
+                )
+            )
+    except Exception:  # noqa: BLE001
+        # Written with the next uses
+        for api_key_id, count in uses.items():
+            _pending_uses[api_key_id] = _pending_uses.get(api_key_id, 0) + count
+            _pending_last_used_at.setdefault(api_key_id, last_used_at[api_key_id])
+        await logger.aexception("Error writing the uses of API keys")
@@ -11,7 +11,8 @@ from emoji import purely_emoji
 from fastapi import HTTPException, status
 from pydantic import BaseModel, ValidationInfo, field_serializer, field_validator
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Text, UniqueConstraint, text
+from sqlalchemy import Index, Text, UniqueConstraint, event, text
+from sqlalchemy import inspect as sa_inspect
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 from wfx.log.logger import logger
 
@@ -193,6 +194,11 @@ class Flow(FlowBase, table=True):  # type: ignore[call-arg]
     locked: bool | None = Field(default=False, nullable=True)
     folder_id: UUID | None = Field(default=None, foreign_key="folder.id", nullable=True, index=True)
     fs_path: str | None = Field(default=None, nullable=True)
+    # Input schema served to MCP clients listing tools, computed when the data of the flow is saved
+    mcp_tool_schema: dict | None = Field(default=None, sa_column=Column(JSON, nullable=True), exclude=True)
+    # Sanitized names MCP tool calls look the flow up by, as a tool and as an action of its project
+    mcp_tool_name: str | None = Field(default=None, nullable=True, exclude=True)
+    mcp_action_name: str | None = Field(default=None, nullable=True, exclude=True)
     folder: Optional["Folder"] = Relationship(back_populates="flows")
 
     def to_data(self):
@@ -209,9 +215,43 @@ class Flow(FlowBase, table=True):  # type: ignore[call-arg]
     __table_args__ = (
         UniqueConstraint("user_id", "name", name="unique_flow_name"),
         UniqueConstraint("user_id", "endpoint_name", name="unique_flow_endpoint_name"),
+        Index("ix_flow_user_id_mcp_tool_name", "user_id", "mcp_tool_name"),
+        Index("ix_flow_user_id_mcp_action_name", "user_id", "mcp_action_name"),
     )
 
 
+def _set_mcp_tool_names(flow: Flow) -> None:
+    from primeagent.services.database.models.flow.utils import get_mcp_tool_names
+
+    flow.mcp_tool_name, flow.mcp_action_name = get_mcp_tool_names(flow.name, flow.action_name)
+
+
+def _set_mcp_tool_schema(flow: Flow) -> None:
+    from primeagent.services.database.models.flow.utils import build_mcp_tool_schema
+
+    try:
+        flow.mcp_tool_schema = build_mcp_tool_schema(flow.data)
+    except Exception:  # noqa: BLE001
+        # Computed again when tools are listed
+        logger.debug(f"Error building the MCP tool schema of flow {flow.name}", exc_info=True)
+        flow.mcp_tool_schema = None
+
+
+@event.listens_for(Flow, "before_insert")
+def _set_mcp_columns(_mapper, _connection, flow: Flow) -> None:
+    _set_mcp_tool_names(flow)
+    _set_mcp_tool_schema(flow)
+
+
+@event.listens_for(Flow, "before_update")
+def _update_mcp_columns(_mapper, _connection, flow: Flow) -> None:
+    attrs = sa_inspect(flow).attrs
+    if attrs.name.history.has_changes() or attrs.action_name.history.has_changes():
+        _set_mcp_tool_names(flow)
+    if attrs.data.history.has_changes():
+        _set_mcp_tool_schema(flow)
+
+
 class FlowCreate(FlowBase):
     user_id: UUID | None = None
     folder_id: UUID | None = None
@@ -1,7 +1,12 @@
+from wfx.log.logger import logger
+
 from primeagent.utils.version import get_version_info
 
 from .model import Flow
 
+# Stored MCP tool schemas with another version are computed again, bump it when their format changes
+MCP_TOOL_SCHEMA_VERSION = 1
+
 
 def get_webhook_component_in_flow(flow_data: dict):
     """Get webhook component in flow data."""
@@ -40,3 +45,79 @@ def get_outdated_components(flow: Flow):
         if value != lf_version:
             outdated_components.append(key)
     return outdated_components
+
+
+def _is_input_node(node: dict) -> bool:
+    from wfx.graph.schema import INPUT_COMPONENTS
+
+    type_strings = [node["id"].split("-")[0], node["data"]["type"]]
+    if any(input_component_name in type_strings for input_component_name in INPUT_COMPONENTS):
+        return True
+    return bool(node["data"]["node"].get("is_input"))
+
+
+def get_input_schema_from_flow_data(flow_data: dict | None) -> dict:
+    """Generate JSON schema from flow input nodes.
+
+    The schema is read from the templates of the input nodes, once group nodes are expanded, without
+    building a graph of the flow.
+    """
+    from wfx.graph.graph.utils import process_flow
+
+    flow_data = flow_data or {}
+    if "data" in flow_data:
+        flow_data = flow_data["data"]
+    nodes = process_flow({"nodes": flow_data.get("nodes", []), "edges": flow_data.get("edges", [])})["nodes"]
+
+    properties = {}
+    required = []
+    for node in nodes:
+        if not _is_input_node(node):
+            continue
+        template = node["data"]["node"]["template"]
+
+        for field_name, field_data in template.items():
+            if isinstance(field_data, dict) and field_data.get("show", False) and not field_data.get("advanced", False):
+                field_type = field_data.get("type", "string")
+                properties[field_name] = {
+                    "type": field_type,
+                    "description": field_data.get("info", f"Input for {field_name}"),
+                }
+                # Update field_type in properties after determining the JSON Schema type
+                if field_type == "str":
+                    field_type = "string"
+                elif field_type == "int":
+                    field_type = "integer"
+                elif field_type == "float":
+                    field_type = "number"
+                elif field_type == "bool":
+                    field_type = "boolean"
+                else:
+                    logger.warning(f"Unknown field type: {field_type} defaulting to string")
+                    field_type = "string"
+                properties[field_name]["type"] = field_type
+
+                if field_data.get("required", False):
+                    required.append(field_name)
+
+    return {"type": "object", "properties": properties, "required": required}
+
+
+def build_mcp_tool_schema(flow_data: dict | None) -> dict:
+    """Returns the MCP tool schema stored with a flow, its input schema stamped with its version."""
+    return {"version": MCP_TOOL_SCHEMA_VERSION, "input_schema": get_input_schema_from_flow_data(flow_data)}
+
+
+def get_stored_input_schema(mcp_tool_schema: dict | None) -> dict | None:
+    """Returns the input schema of a stored MCP tool schema, or None if it is missing or outdated."""
+    if not mcp_tool_schema or mcp_tool_schema.get("version") != MCP_TOOL_SCHEMA_VERSION:
+        return None
+    return mcp_tool_schema.get("input_schema")
+
+
+def get_mcp_tool_names(name: str, action_name: str | None) -> tuple[str, str]:
+    """Returns the names MCP tool calls look a flow up by, as a tool and as an action of its project."""
+    from wfx.base.mcp.util import sanitize_mcp_name
+
+    tool_name = sanitize_mcp_name(name)
+    return tool_name, sanitize_mcp_name(action_name) if action_name else tool_name
@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Sequence
 from uuid import UUID
 
 from sqlmodel import col, delete, select
@@ -26,6 +27,19 @@ async def get_transactions_by_flow_id(
     return list(transactions)
 
 
+def _delete_older_transactions(flow_id: UUID, keep: int):
+    """Builds the statement deleting the transactions of a flow beyond its newest `keep` ones."""
+    return delete(TransactionTable).where(
+        TransactionTable.flow_id == flow_id,
+        col(TransactionTable.id).in_(
+            select(TransactionTable.id)
+            .where(TransactionTable.flow_id == flow_id)
+            .order_by(col(TransactionTable.timestamp).desc())
+            .offset(keep)
+        ),
+    )
+
+
 async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> TransactionTable | None:
     """Log a transaction and maintain a maximum number of transactions in the database.
 
@@ -53,15 +67,8 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
         max_entries = get_settings_service().settings.max_transactions_to_keep
 
         # Delete older entries in a single transaction
-        delete_older = delete(TransactionTable).where(
-            TransactionTable.flow_id == transaction.flow_id,
-            col(TransactionTable.id).in_(
-                select(TransactionTable.id)
-                .where(TransactionTable.flow_id == transaction.flow_id)
-                .order_by(col(TransactionTable.timestamp).desc())
-                .offset(max_entries - 1)  # Keep newest max_entries-1 plus the one we're adding
-            ),
-        )
+        # Keep newest max_entries-1 plus the one we're adding
+        delete_older = _delete_older_transactions(transaction.flow_id, keep=max_entries - 1)
 
         # Add new entry and execute delete in same transaction
         db.add(table)
@@ -74,6 +81,43 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
     return table
 
 
+async def log_transactions(db: AsyncSession, transactions: Sequence[TransactionTable]) -> None:
+    """Insert many transactions in a single commit, without enforcing the retention limit.
+
+    Used by the execution log service, which trims the tables later with `compact_transactions`.
+
+    Args:
+        db: Database session
+        transactions: Transaction rows to insert
+    """
+    if not transactions:
+        return
+    try:
+        db.add_all(transactions)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
+async def compact_transactions(db: AsyncSession, flow_ids: Iterable[UUID], max_entries: int | None = None) -> None:
+    """Delete the oldest transactions of each flow so that at most `max_entries` remain per flow.
+
+    Args:
+        db: Database session
+        flow_ids: Flows to compact
+        max_entries: Transactions to keep per flow. If None, uses system settings.
+    """
+    max_entries = max_entries or get_settings_service().settings.max_transactions_to_keep
+    try:
+        for flow_id in flow_ids:
+            await db.exec(_delete_older_transactions(flow_id, keep=max_entries))
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
 def transform_transaction_table(
     transaction: list[TransactionTable] | TransactionTable,
 ) -> list[TransactionReadResponse]:
@@ -8,6 +8,7 @@ from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from wfx.log.logger import logger
 
+from primeagent.services.database.models.api_key.crud import invalidate_verified_api_keys
 from primeagent.services.database.models.user.model import User, UserUpdate
 
 
@@ -50,6 +51,8 @@ async def update_user(user_db: User | None, user: UserUpdate, db: AsyncSession)
         await db.rollback()
         raise HTTPException(status_code=400, detail=str(e)) from e
 
+    # Deactivated users must not be authenticated by their cached API keys
+    invalidate_verified_api_keys(user_id=user_db.id)
     return user_db
 
 
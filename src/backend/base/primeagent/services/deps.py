@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     from primeagent.services.cache.service import AsyncBaseCacheService, CacheService
     from primeagent.services.chat.service import ChatService
     from primeagent.services.database.service import DatabaseService
+    from primeagent.services.execution_log.service import ExecutionLogService
     from primeagent.services.job_queue.service import JobQueueService
     from primeagent.services.session.service import SessionService
     from primeagent.services.state.service import StateService
@@ -241,3 +242,10 @@ def get_queue_service() -> JobQueueService:
     from primeagent.services.job_queue.factory import JobQueueServiceFactory
 
     return get_service(ServiceType.JOB_QUEUE_SERVICE, JobQueueServiceFactory())
+
+
+def get_execution_log_service() -> ExecutionLogService:
+    """Retrieves the ExecutionLogService instance from the service manager."""
+    from primeagent.services.execution_log.factory import ExecutionLogServiceFactory
+
+    return get_service(ServiceType.EXECUTION_LOG_SERVICE, ExecutionLogServiceFactory())
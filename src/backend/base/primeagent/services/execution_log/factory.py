@@ -0,0 +1,14 @@
+from typing_extensions import override
+from wfx.services.settings.service import SettingsService
+
+from primeagent.services.execution_log.service import ExecutionLogService
+from primeagent.services.factory import ServiceFactory
+
+
+class ExecutionLogServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(ExecutionLogService)
+
+    @override
+    def create(self, settings_service: SettingsService):
+        return ExecutionLogService(settings_service)
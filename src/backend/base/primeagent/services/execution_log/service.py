@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+from wfx.log.logger import logger
+
+from primeagent.services.base import Service
+from primeagent.services.database.models.transactions.crud import compact_transactions, log_transactions
+from primeagent.services.database.models.transactions.model import TransactionBase, TransactionTable
+from primeagent.services.database.models.vertex_builds.crud import compact_vertex_builds, log_vertex_builds
+from primeagent.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+from primeagent.services.deps import session_scope
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from wfx.services.settings.service import SettingsService
+
+
+class ExecutionLogService(Service):
+    """Write-behind queue for the transactions and vertex builds logged while flows run.
+
+    Records are queued and written by a background task in bulk inserts of up to
+    `execution_log_batch_size` rows, at least every `execution_log_flush_interval` seconds. The
+    retention limits (`max_transactions_to_keep`, `max_vertex_builds_to_keep` and
+    `max_vertex_builds_per_vertex`) are applied every `execution_log_compaction_interval` seconds
+    to the flows written since the previous compaction, instead of on every insert.
+
+    The queue holds at most `execution_log_queue_size` records; when it is full, callers wait for
+    the writer to catch up. Queued records are written and compacted on teardown.
+    """
+
+    name = "execution_log_service"
+
+    def __init__(self, settings_service: SettingsService) -> None:
+        self.settings_service = settings_service
+        settings = settings_service.settings
+        self.batch_size = max(settings.execution_log_batch_size, 1)
+        self.flush_interval = settings.execution_log_flush_interval
+        self.compaction_interval = settings.execution_log_compaction_interval
+        self._queue: asyncio.Queue[TransactionTable | VertexBuildTable] = asyncio.Queue(
+            maxsize=settings.execution_log_queue_size
+        )
+        self._worker: asyncio.Task | None = None
+        # Flows and (flow, vertex) pairs written since the last compaction
+        self._transaction_flows: set[UUID] = set()
+        self._build_vertices: set[tuple[UUID, str]] = set()
+        self._last_compaction = time.monotonic()
+
+    async def add_transaction(self, transaction: TransactionBase | dict[str, Any]) -> None:
+        """Queues a transaction to be written, waiting if the queue is full."""
+        if isinstance(transaction, dict):
+            transaction = TransactionBase.model_validate(transaction)
+        if not transaction.flow_id:
+            await logger.adebug("Transaction flow_id is None")
+            return
+        await self._put(TransactionTable(**transaction.model_dump()))
+
+    async def add_vertex_build(self, vertex_build: VertexBuildBase | dict[str, Any]) -> None:
+        """Queues a vertex build to be written, waiting if the queue is full."""
+        if isinstance(vertex_build, dict):
+            if isinstance(data := vertex_build.get("data"), BaseModel):
+                vertex_build = {**vertex_build, "data": data.model_dump()}
+            vertex_build = VertexBuildBase.model_validate(vertex_build)
+        await self._put(VertexBuildTable(**vertex_build.model_dump()))
+
+    async def _put(self, record: TransactionTable | VertexBuildTable) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        await self._queue.put(record)
+
+    async def flush(self) -> None:
+        """Writes every queued record and waits for the writes in progress to finish."""
+        while not self._queue.empty():
+            batch = self._take(self.batch_size)
+            await self._write(batch)
+        await self._queue.join()
+
+    async def compact(self) -> None:
+        """Trims the flows written since the last compaction to the configured retention limits."""
+        self._last_compaction = time.monotonic()
+        transaction_flows, self._transaction_flows = self._transaction_flows, set()
+        build_vertices, self._build_vertices = self._build_vertices, set()
+        if not transaction_flows and not build_vertices:
+            return
+        try:
+            async with session_scope() as session:
+                if transaction_flows:
+                    await compact_transactions(session, transaction_flows)
+                if build_vertices:
+                    await compact_vertex_builds(session, build_vertices)
+        except Exception as exc:  # noqa: BLE001
+            await logger.aerror(f"Error compacting transactions and vertex builds: {exc!s}")
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            if batch:
+                await self._write(batch)
+            if time.monotonic() - self._last_compaction >= self.compaction_interval:
+                await self.compact()
+
+    async def _next_batch(self) -> list[TransactionTable | VertexBuildTable]:
+        """Waits up to `flush_interval` seconds for a full batch, returning what arrived in that time."""
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            batch.extend(self._take(self.batch_size - len(batch)))
+            timeout = deadline - time.monotonic()
+            if len(batch) >= self.batch_size or timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    def _take(self, limit: int) -> list[TransactionTable | VertexBuildTable]:
+        records = []
+        while len(records) < limit and not self._queue.empty():
+            records.append(self._queue.get_nowait())
+        return records
+
+    async def _write(self, batch: list[TransactionTable | VertexBuildTable]) -> None:
+        transactions = [record for record in batch if isinstance(record, TransactionTable)]
+        vertex_builds = [record for record in batch if isinstance(record, VertexBuildTable)]
+        try:
+            async with session_scope() as session:
+                await log_transactions(session, transactions)
+                await log_vertex_builds(session, vertex_builds)
+        except Exception as exc:  # noqa: BLE001
+            # Like the retention cleanups, losing log records must not break flow runs
+            await logger.aerror(f"Error writing {len(batch)} transactions and vertex builds: {exc!s}")
+        else:
+            self._transaction_flows.update(transaction.flow_id for transaction in transactions)
+            self._build_vertices.update((build.flow_id, build.id) for build in vertex_builds)
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    async def teardown(self) -> None:
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        await self.compact()
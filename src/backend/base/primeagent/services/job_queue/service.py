@@ -315,6 +315,7 @@ class JobQueueService(Service):
         # Registering predefined events
         event_names_types = [
             ("on_token", "token"),
+            ("on_content_block_delta", "content_block_delta"),
             ("on_vertices_sorted", "vertices_sorted"),
             ("on_error", "error"),
             ("on_end", "end"),
@@ -1,8 +1,15 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import anyio
 from aiofile import async_open
 from wfx.log.logger import logger
 
-from .service import StorageService
+from .service import STREAM_CHUNK_SIZE, StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 
 class LocalStorageService(StorageService):
@@ -67,6 +74,46 @@ class LocalStorageService(StorageService):
         logger.debug(f"File {file_name} retrieved successfully from flow {flow_id}.")
         return content
 
+    async def stream_file(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        byte_range: tuple[int, int] | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream a file from the local storage in chunks.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be streamed.
+            chunk_size: The maximum size of the yielded chunks.
+            byte_range: The first and last (inclusive) byte offsets to read, or None for the whole file.
+
+        Yields:
+            The content of the file, in chunks.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            await logger.awarning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+
+        start, end = byte_range if byte_range is not None else (0, None)
+        async with async_open(str(file_path), "rb") as f:
+            f.seek(start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                chunk = await f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
     async def list_files(self, flow_id: str):
         """List all files in a specified flow.
 
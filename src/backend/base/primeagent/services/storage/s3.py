@@ -1,46 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import io
+from typing import TYPE_CHECKING
+
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from wfx.log.logger import logger
 
-from .service import StorageService
+from .service import STREAM_CHUNK_SIZE, StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 
 class S3StorageService(StorageService):
-    """A service class for handling operations with AWS S3 storage."""
+    """A service class for handling operations with AWS S3 storage.
+
+    boto3 calls are blocking, so they run in worker threads sharing one client, whose connection
+    pool is sized for `MAX_CONCURRENCY` requests at once. Large uploads are sent as concurrent
+    multipart uploads and downloads can be streamed chunk by chunk, whole or as a byte range.
+    """
+
+    # Connections kept open to S3, shared by every request of the service
+    MAX_POOL_CONNECTIONS = 50
+    # Uploads larger than this are split into parts of `MULTIPART_CHUNK_SIZE` bytes
+    MULTIPART_THRESHOLD = 8 * 1024 * 1024
+    MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+    # Parts uploaded at the same time for one file
+    MAX_CONCURRENCY = 10
 
     def __init__(self, session_service, settings_service) -> None:
         """Initialize the S3 storage service with session and settings services."""
         super().__init__(session_service, settings_service)
         self.bucket = "primeagent"
-        self.s3_client = boto3.client("s3")
+        self.s3_client = boto3.client("s3", config=Config(max_pool_connections=self.MAX_POOL_CONNECTIONS))
+        self.transfer_config = TransferConfig(
+            multipart_threshold=self.MULTIPART_THRESHOLD,
+            multipart_chunksize=self.MULTIPART_CHUNK_SIZE,
+            max_concurrency=self.MAX_CONCURRENCY,
+        )
         self.set_ready()
 
-    async def save_file(self, folder: str, file_name: str, data) -> None:
+    async def save_file(self, flow_id: str, file_name: str, data) -> None:
         """Save a file to the S3 bucket.
 
         Args:
-            folder: The folder in the bucket to save the file.
+            flow_id: The folder in the bucket to save the file.
             file_name: The name of the file to be saved.
-            data: The byte content of the file.
+            data: The byte content of the file, or a binary file object to read it from.
 
         Raises:
             Exception: If an error occurs during file saving.
         """
+        fileobj = io.BytesIO(data) if isinstance(data, bytes | bytearray) else data
         try:
-            self.s3_client.put_object(Bucket=self.bucket, Key=f"{folder}/{file_name}", Body=data)
-            await logger.ainfo(f"File {file_name} saved successfully in folder {folder}.")
+            await asyncio.to_thread(
+                self.s3_client.upload_fileobj,
+                fileobj,
+                self.bucket,
+                f"{flow_id}/{file_name}",
+                Config=self.transfer_config,
+            )
+            await logger.ainfo(f"File {file_name} saved successfully in folder {flow_id}.")
         except NoCredentialsError:
             await logger.aexception("Credentials not available for AWS S3.")
             raise
         except ClientError:
-            await logger.aexception(f"Error saving file {file_name} in folder {folder}")
+            await logger.aexception(f"Error saving file {file_name} in folder {flow_id}")
             raise
 
-    async def get_file(self, folder: str, file_name: str):
+    async def get_file(self, flow_id: str, file_name: str):
         """Retrieve a file from the S3 bucket.
 
         Args:
-            folder: The folder in the bucket where the file is stored.
+            flow_id: The folder in the bucket where the file is stored.
             file_name: The name of the file to be retrieved.
 
         Returns:
@@ -50,18 +86,60 @@ class S3StorageService(StorageService):
             Exception: If an error occurs during file retrieval.
         """
         try:
-            response = self.s3_client.get_object(Bucket=self.bucket, Key=f"{folder}/{file_name}")
-            await logger.ainfo(f"File {file_name} retrieved successfully from folder {folder}.")
-            return response["Body"].read()
+            response = await asyncio.to_thread(
+                self.s3_client.get_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}"
+            )
+            content = await asyncio.to_thread(response["Body"].read)
+        except ClientError:
+            await logger.aexception(f"Error retrieving file {file_name} from folder {flow_id}")
+            raise
+        await logger.ainfo(f"File {file_name} retrieved successfully from folder {flow_id}.")
+        return content
+
+    async def stream_file(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        byte_range: tuple[int, int] | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream a file from the S3 bucket without loading it in memory.
+
+        Args:
+            flow_id: The folder in the bucket where the file is stored.
+            file_name: The name of the file to be streamed.
+            chunk_size: The maximum size of the yielded chunks.
+            byte_range: The first and last (inclusive) byte offsets to read, or None for the whole file.
+
+        Yields:
+            The content of the file, in chunks.
+
+        Raises:
+            Exception: If an error occurs during file retrieval.
+        """
+        request = {"Bucket": self.bucket, "Key": f"{flow_id}/{file_name}"}
+        if byte_range is not None:
+            request["Range"] = f"bytes={byte_range[0]}-{byte_range[1]}"
+        try:
+            response = await asyncio.to_thread(self.s3_client.get_object, **request)
         except ClientError:
-            await logger.aexception(f"Error retrieving file {file_name} from folder {folder}")
+            await logger.aexception(f"Error retrieving file {file_name} from folder {flow_id}")
             raise
 
-    async def list_files(self, folder: str):
+        body = response["Body"]
+        chunks = body.iter_chunks(chunk_size)
+        try:
+            while chunk := await asyncio.to_thread(next, chunks, b""):
+                yield chunk
+        finally:
+            body.close()
+
+    async def list_files(self, flow_id: str):
         """List all files in a specified folder of the S3 bucket.
 
         Args:
-            folder: The folder in the bucket to list files from.
+            flow_id: The folder in the bucket to list files from.
 
         Returns:
             A list of file names.
@@ -69,36 +147,55 @@ class S3StorageService(StorageService):
         Raises:
             Exception: If an error occurs during file listing.
         """
+        prefix = f"{flow_id}/"
+
+        def list_keys() -> list[str]:
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            return [
+                item["Key"]
+                for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix)
+                for item in page.get("Contents", [])
+            ]
+
         try:
-            response = self.s3_client.list_objects_v2(Bucket=self.bucket, Prefix=folder)
+            keys = await asyncio.to_thread(list_keys)
         except ClientError:
-            await logger.aexception(f"Error listing files in folder {folder}")
+            await logger.aexception(f"Error listing files in folder {flow_id}")
             raise
 
-        files = [item["Key"] for item in response.get("Contents", []) if "/" not in item["Key"][len(folder) :]]
-        await logger.ainfo(f"{len(files)} files listed in folder {folder}.")
+        # The names of the files stored directly under the flow, not in nested folders
+        files = [key.removeprefix(prefix) for key in keys if "/" not in key.removeprefix(prefix)]
+        await logger.ainfo(f"{len(files)} files listed in folder {flow_id}.")
         return files
 
-    async def delete_file(self, folder: str, file_name: str) -> None:
+    async def delete_file(self, flow_id: str, file_name: str) -> None:
         """Delete a file from the S3 bucket.
 
         Args:
-            folder: The folder in the bucket where the file is stored.
+            flow_id: The folder in the bucket where the file is stored.
             file_name: The name of the file to be deleted.
 
         Raises:
             Exception: If an error occurs during file deletion.
         """
         try:
-            self.s3_client.delete_object(Bucket=self.bucket, Key=f"{folder}/{file_name}")
-            await logger.ainfo(f"File {file_name} deleted successfully from folder {folder}.")
+            await asyncio.to_thread(self.s3_client.delete_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}")
+            await logger.ainfo(f"File {file_name} deleted successfully from folder {flow_id}.")
         except ClientError:
-            await logger.aexception(f"Error deleting file {file_name} from folder {folder}")
+            await logger.aexception(f"Error deleting file {file_name} from folder {flow_id}")
             raise
 
     async def teardown(self) -> None:
-        """Perform any cleanup operations when the service is being torn down."""
-        # No specific teardown actions required for S3 storage at the moment.
+        """Close the connections of the S3 client."""
+        self.s3_client.close()
 
     async def get_file_size(self, flow_id: str, file_name: str):
-        raise NotImplementedError
+        """Get the size of a file in the S3 bucket, without downloading it."""
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}"
+            )
+        except ClientError:
+            await logger.aexception(f"Error getting the size of file {file_name} in folder {flow_id}")
+            raise
+        return response["ContentLength"]
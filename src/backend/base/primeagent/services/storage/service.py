@@ -8,10 +8,15 @@ import anyio
 from primeagent.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from wfx.services.settings.service import SettingsService
 
     from primeagent.services.session.service import SessionService
 
+# Default size of the chunks yielded by `StorageService.stream_file`
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 class StorageService(Service):
     name = "storage_service"
@@ -36,6 +41,24 @@ class StorageService(Service):
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         raise NotImplementedError
 
+    async def stream_file(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        byte_range: tuple[int, int] | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Yield the content of a file in chunks, or only the bytes from `byte_range[0]` to `byte_range[1]`.
+
+        This default reads the whole file with `get_file`; backends override it to stream from storage.
+        """
+        content = await self.get_file(flow_id, file_name)
+        if byte_range is not None:
+            content = content[byte_range[0] : byte_range[1] + 1]
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
+
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
         raise NotImplementedError
@@ -140,6 +140,20 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             metric_type=MetricType.COUNTER,
             labels={"flow_id": mandatory_label},
         )
+        self._add_metric(
+            name="graph_template_cache_hits",
+            description="The number of flow runs that forked a cached graph template",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"flow_id": mandatory_label},
+        )
+        self._add_metric(
+            name="graph_template_cache_misses",
+            description="The number of flow runs that built their graph from the flow data",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"flow_id": mandatory_label},
+        )
 
     def __init__(self, *, prometheus_enabled: bool = True):
         # Only initialize once
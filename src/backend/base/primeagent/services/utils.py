@@ -236,6 +236,7 @@ def register_all_service_factories() -> None:
     from primeagent.services.cache import factory as cache_factory
     from primeagent.services.chat import factory as chat_factory
     from primeagent.services.database import factory as database_factory
+    from primeagent.services.execution_log import factory as execution_log_factory
     from primeagent.services.job_queue import factory as job_queue_factory
     from primeagent.services.session import factory as session_factory
     from primeagent.services.shared_component_cache import factory as shared_component_cache_factory
@@ -264,6 +265,7 @@ def register_all_service_factories() -> None:
     service_manager.register_factory(shared_component_cache_factory.SharedComponentCacheServiceFactory())
     service_manager.register_factory(auth_factory.AuthServiceFactory())
     service_manager.register_factory(mcp_composer_factory.MCPComposerServiceFactory())
+    service_manager.register_factory(execution_log_factory.ExecutionLogServiceFactory())
     service_manager.set_factory_registered()
 
 
@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Collection
 from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -35,6 +36,27 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    async def get_variables(
+        self, user_id: UUID | str, fields: Collection[tuple[str, str]], session: AsyncSession
+    ) -> dict[tuple[str, str], str | Exception]:
+        """Async get the values of several variables at once.
+
+        Args:
+            user_id: The user ID.
+            fields: The (variable name, field) pairs to resolve.
+            session: The database session.
+
+        Returns:
+            The value of each pair, or the error `get_variable` raises for it.
+        """
+        values: dict[tuple[str, str], str | Exception] = {}
+        for name, field in fields:
+            try:
+                values[name, field] = await self.get_variable(user_id, name, field, session)
+            except (ValueError, TypeError) as e:
+                values[name, field] = e
+        return values
+
     @abc.abstractmethod
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
         """List all variables.
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import os
+import threading
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
-from sqlmodel import select
+from cachetools import TTLCache
+from sqlmodel import col, select
 from typing_extensions import override
 from wfx.log.logger import logger
 
@@ -15,16 +17,78 @@ from primeagent.services.variable.base import VariableService
 from primeagent.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Collection, Sequence
     from uuid import UUID
 
     from sqlmodel.ext.asyncio.session import AsyncSession
     from wfx.services.settings.service import SettingsService
 
 
+class CachedVariable(NamedTuple):
+    """A variable with its value already decrypted."""
+
+    type: str | None
+    value: str
+
+
 class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        ttl = settings_service.settings.variable_cache_ttl
+        # Decrypted values by (user id, name), kept for a few seconds when enabled and dropped on every change
+        self._cache: TTLCache[tuple[str, str], CachedVariable] | None = (
+            TTLCache(maxsize=10_000, ttl=ttl) if ttl > 0 else None
+        )
+        self._cache_lock = threading.Lock()
+
+    def invalidate_cache(self, user_id: UUID | str) -> None:
+        """Drops the cached values of a user's variables."""
+        if self._cache is None:
+            return
+        user_key = str(user_id)
+        with self._cache_lock:
+            for key in [key for key in self._cache if key[0] == user_key]:
+                self._cache.pop(key, None)
+
+    async def _get_cached_variables(
+        self, user_id: UUID | str, names: Collection[str], session: AsyncSession
+    ) -> dict[str, CachedVariable]:
+        """Returns the decrypted variables of `names` that exist, querying the database once for the uncached ones."""
+        user_key = str(user_id)
+        found: dict[str, CachedVariable] = {}
+        if self._cache is not None:
+            with self._cache_lock:
+                for name in names:
+                    if (cached := self._cache.get((user_key, name))) is not None:
+                        found[name] = cached
+        missing = [name for name in names if name not in found]
+        if not missing:
+            return found
+
+        stmt = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(missing))
+        for variable in (await session.exec(stmt)).all():
+            if variable.name in found or not variable.value:
+                continue
+            value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+            found[variable.name] = CachedVariable(type=variable.type, value=value)
+            if self._cache is not None:
+                with self._cache_lock:
+                    self._cache[user_key, variable.name] = found[variable.name]
+        return found
+
+    @staticmethod
+    def _value_for_field(name: str, variable: CachedVariable | None, field: str) -> str:
+        if variable is None:
+            msg = f"{name} variable not found."
+            raise ValueError(msg)
+
+        if variable.type == CREDENTIAL_TYPE and field == "session_id":
+            msg = (
+                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
+                "because its purpose is to prevent the exposure of values."
+            )
+            raise TypeError(msg)
+        return variable.value
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -59,24 +123,21 @@ class DatabaseVariableService(VariableService, Service):
         field: str,
         session: AsyncSession,
     ) -> str:
-        # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
-        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
-        variable = (await session.exec(stmt)).first()
+        variables = await self._get_cached_variables(user_id, [name], session)
+        return self._value_for_field(name, variables.get(name), field)
 
-        if not variable or not variable.value:
-            msg = f"{name} variable not found."
-            raise ValueError(msg)
-
-        if variable.type == CREDENTIAL_TYPE and field == "session_id":
-            msg = (
-                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
-                "because its purpose is to prevent the exposure of values."
-            )
-            raise TypeError(msg)
-
-        # we decrypt the value
-        return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+    @override
+    async def get_variables(
+        self, user_id: UUID | str, fields: Collection[tuple[str, str]], session: AsyncSession
+    ) -> dict[tuple[str, str], str | Exception]:
+        variables = await self._get_cached_variables(user_id, {name for name, _ in fields}, session)
+        values: dict[tuple[str, str], str | Exception] = {}
+        for name, field in fields:
+            try:
+                values[name, field] = self._value_for_field(name, variables.get(name), field)
+            except (ValueError, TypeError) as e:
+                values[name, field] = e
+        return values
 
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
@@ -119,6 +180,7 @@ class DatabaseVariableService(VariableService, Service):
         variable.value = encrypted
         session.add(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
         await session.refresh(variable)
         return variable
 
@@ -143,6 +205,7 @@ class DatabaseVariableService(VariableService, Service):
 
         session.add(db_variable)
         await session.commit()
+        self.invalidate_cache(user_id)
         await session.refresh(db_variable)
         return db_variable
 
@@ -160,6 +223,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
 
     @override
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
@@ -170,6 +234,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
 
     async def create_variable(
         self,
@@ -190,5 +255,6 @@ class DatabaseVariableService(VariableService, Service):
         variable = Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
         session.add(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
         await session.refresh(variable)
         return variable
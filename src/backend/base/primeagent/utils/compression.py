@@ -1,10 +1,28 @@
+from __future__ import annotations
+
 import gzip
+import hashlib
 import json
-from typing import Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
-from fastapi import Response
+import orjson
+from fastapi import Response, status
 from fastapi.encoders import jsonable_encoder
 
+if TYPE_CHECKING:
+    from starlette.datastructures import Headers
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 
 def compress_response(data: Any) -> Response:
     """Compress data and return it as a FastAPI Response with appropriate headers."""
@@ -17,3 +35,67 @@ def compress_response(data: Any) -> Response:
         media_type="application/json",
         headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding", "Content-Length": str(len(compressed_data))},
     )
+
+
+def _accepted_encodings(accept_encoding: str | None) -> set[str]:
+    """Returns the content codings accepted by an `Accept-Encoding` header, ignoring the ones with q=0."""
+    if accept_encoding is None:
+        # No header means any coding is acceptable; keep answering with gzip as before
+        return {"gzip"}
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        if coding and quality not in {"0", "0.0", "0.00", "0.000"}:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+@dataclass(frozen=True)
+class PrecompressedJSON:
+    """A JSON document serialized and compressed once, then served to many requests.
+
+    Responses carry a weak ETag of the uncompressed document, so clients revalidating with
+    `If-None-Match` get an empty 304, and the body is picked by `Accept-Encoding` among the
+    codings built up front: zstd and Brotli when their packages are installed, gzip and identity.
+    The ETag is weak because it is shared by these representations, whose bytes differ.
+    """
+
+    etag: str
+    bodies: dict[str, bytes]
+
+    # Preferred content codings, best first
+    PREFERENCE = ("zstd", "br", "gzip")
+
+    @classmethod
+    def from_data(cls, data: Any) -> PrecompressedJSON:
+        json_data = orjson.dumps(jsonable_encoder(data))
+        bodies = {"identity": json_data, "gzip": gzip.compress(json_data, compresslevel=9)}
+        if brotli is not None:
+            bodies["br"] = brotli.compress(json_data, quality=7)
+        if zstandard is not None:
+            bodies["zstd"] = zstandard.ZstdCompressor(level=10).compress(json_data)
+        return cls(etag=f'W/"{hashlib.sha256(json_data).hexdigest()}"', bodies=bodies)
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """Whether an `If-None-Match` header already names this document, using the weak comparison."""
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or self.etag.removeprefix("W/") in tags
+
+    def response(self, request_headers: Headers) -> Response:
+        headers = {"ETag": self.etag, "Vary": "Accept-Encoding", "Cache-Control": "private, no-cache"}
+        if self.matches(request_headers.get("if-none-match")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        accepted = _accepted_encodings(request_headers.get("accept-encoding"))
+        accept_any = "*" in accepted
+        encoding = next(
+            (coding for coding in self.PREFERENCE if (accept_any or coding in accepted) and coding in self.bodies), None
+        )
+        body = self.bodies[encoding or "identity"]
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        headers["Content-Length"] = str(len(body))
+        return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,107 @@
+"""ZIP archives generated while they are sent."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import time
+import zipfile
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Sequence
+
+# Marks the end of a prefetched file
+_END = object()
+
+
+@dataclass(frozen=True)
+class ZipEntry:
+    """A file of a streamed ZIP archive.
+
+    `open_stream` is called when the file starts being prefetched and returns its content in chunks.
+    `size`, when known, lets small archives skip the ZIP64 extensions.
+    """
+
+    name: str
+    open_stream: Callable[[], AsyncIterator[bytes]]
+    size: int | None = None
+
+
+class _ChunkSink(io.RawIOBase):
+    """Unseekable output collecting what `zipfile` writes until it is taken."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _prefetch(entry: ZipEntry, queue: asyncio.Queue) -> None:
+    try:
+        async for chunk in entry.open_stream():
+            await queue.put(chunk)
+    except Exception as exc:  # noqa: BLE001
+        # Raised again by the consumer, when it reaches this entry
+        await queue.put(exc)
+    else:
+        await queue.put(_END)
+
+
+async def stream_zip(entries: Sequence[ZipEntry], *, prefetch: int = 4, queue_size: int = 4) -> AsyncIterator[bytes]:
+    """Yields a ZIP archive of `entries` as it is written, without holding whole files in memory.
+
+    Entries are written in order while the next `prefetch - 1` ones are already being read, each
+    buffering at most `queue_size` chunks, so memory use is bounded by `prefetch * queue_size`
+    chunks whatever the size of the archive. Files are stored uncompressed, with data descriptors
+    since their CRC is only known once they have been streamed.
+    """
+    prefetch = max(prefetch, 1)
+    queues: list[asyncio.Queue] = [asyncio.Queue(maxsize=queue_size) for _ in entries]
+    tasks: list[asyncio.Task] = []
+
+    def start_prefetch(index: int) -> None:
+        if index < len(entries):
+            tasks.append(asyncio.create_task(_prefetch(entries[index], queues[index])))
+
+    sink = _ChunkSink()
+    try:
+        for index in range(prefetch):
+            start_prefetch(index)
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as zip_file:
+            for index, entry in enumerate(entries):
+                info = zipfile.ZipInfo(entry.name, date_time=time.localtime()[:6])
+                info.compress_type = zipfile.ZIP_STORED
+                if entry.size is not None:
+                    info.file_size = entry.size
+                with zip_file.open(info, "w", force_zip64=entry.size is None) as zip_entry:
+                    while (chunk := await queues[index].get()) is not _END:
+                        if isinstance(chunk, Exception):
+                            raise chunk
+                        zip_entry.write(chunk)
+                        if data := sink.take():
+                            yield data
+                start_prefetch(index + prefetch)
+                if data := sink.take():
+                    yield data
+        # The central directory, written when the archive is closed
+        yield sink.take()
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
@@ -1,5 +1,16 @@
+import asyncio
+import contextlib
+
 from fastapi import status
 from httpx import AsyncClient
+from primeagent.services.database.models.api_key import crud as api_key_crud
+from primeagent.services.database.models.api_key.crud import (
+    check_key,
+    flush_api_key_uses,
+    flush_api_key_uses_periodically,
+)
+from primeagent.services.database.models.api_key.model import ApiKey
+from primeagent.services.deps import get_settings_service, session_scope
 
 
 async def test_create_folder(client: AsyncClient, logged_in_headers):
@@ -62,3 +73,66 @@ async def test_save_store_api_key(client: AsyncClient, logged_in_headers):
     assert response.status_code == status.HTTP_200_OK
     assert isinstance(result, dict), "The result must be a dictionary"
     assert "detail" in result, "The dictionary must contain a key called 'detail'"
+
+
+async def test_check_key_caches_verified_keys_and_aggregates_uses(
+    client: AsyncClient, logged_in_headers, created_api_key, active_user, monkeypatch
+):
+    settings = get_settings_service().settings
+    monkeypatch.setattr(settings, "api_key_cache_ttl", 60)
+    monkeypatch.setattr(settings, "api_key_usage_flush_interval", 3600)
+
+    async with session_scope() as session:
+        user = await check_key(session, created_api_key.api_key)
+    assert user.id == active_user.id
+
+    # Verified keys are not looked up in the database again, only their user is loaded in each session
+    def fail_select(*_args, **_kwargs):
+        msg = "The API key was looked up again"
+        raise AssertionError(msg)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(api_key_crud, "select", fail_select)
+        for _ in range(2):
+            async with session_scope() as session:
+                cached_user = await check_key(session, created_api_key.api_key)
+                assert cached_user.id == active_user.id
+                assert cached_user is not user
+
+    async with session_scope() as session:
+        api_key = await session.get(ApiKey, created_api_key.id)
+        assert api_key.total_uses == 0
+    await flush_api_key_uses()
+    async with session_scope() as session:
+        api_key = await session.get(ApiKey, created_api_key.id)
+        assert api_key.total_uses == 3
+        assert api_key.last_used_at is not None
+
+    response = await client.delete(f"api/v1/api_key/{created_api_key.id}", headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK
+    async with session_scope() as session:
+        assert await check_key(session, created_api_key.api_key) is None
+
+
+async def test_api_key_uses_are_flushed_periodically(created_api_key, monkeypatch):
+    settings = get_settings_service().settings
+    monkeypatch.setattr(settings, "api_key_cache_ttl", 0)
+    monkeypatch.setattr(settings, "api_key_usage_flush_interval", 0.1)
+    await flush_api_key_uses()
+
+    flush_task = asyncio.create_task(flush_api_key_uses_periodically())
+    try:
+        async with session_scope() as session:
+            await check_key(session, created_api_key.api_key)
+        # Written without any other use of the key
+        for _ in range(50):
+            await asyncio.sleep(0.1)
+            async with session_scope() as session:
+                api_key = await session.get(ApiKey, created_api_key.id)
+                if api_key.total_uses:
+                    break
+        assert api_key.total_uses == 1
+    finally:
+        flush_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await flush_task
@@ -5,6 +5,7 @@ from anyio import Path
 from fastapi import status
 from httpx import AsyncClient
 from primeagent.services.database.models import Flow
+from sqlalchemy import update
 
 
 async def test_create_flow(client: AsyncClient, logged_in_headers):
@@ -66,6 +67,45 @@ async def test_read_flows(client: AsyncClient, logged_in_headers):
     assert isinstance(result, list), "The result must be a list"
 
 
+async def test_read_flows_headers_only_include_component_data(client: AsyncClient, logged_in_headers, active_user):
+    from primeagent.services.deps import session_scope
+
+    data = {"nodes": [{"id": "node-1", "data": {}}], "edges": []}
+    ids = {}
+    for name, is_component in (("component", True), ("flow", False)):
+        response = await client.post(
+            "api/v1/flows/",
+            json={"name": name, "data": data, "is_component": is_component},
+            headers=logged_in_headers,
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        ids[response.json()["id"]] = name
+    # Flows saved by older versions may have no `is_component` flag
+    async with session_scope() as session:
+        flow = Flow(name="unflagged", data=data, user_id=active_user.id)
+        session.add(flow)
+        await session.commit()
+        # The column default is applied on insert, so the flag is cleared afterwards
+        await session.exec(update(Flow).where(Flow.id == flow.id).values(is_component=None))
+        await session.commit()
+        ids[str(flow.id)] = "unflagged"
+
+    response = await client.get("api/v1/flows/", params={"header_flows": True}, headers=logged_in_headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    headers = {header["id"]: header for header in response.json() if header["id"] in ids}
+    assert len(headers) == len(ids)
+    for id_, header in headers.items():
+        assert "user_id" not in header
+        if ids[id_] == "flow":
+            assert header["is_component"] is False
+            assert header["data"] is None
+        else:
+            # A single node flow saved without the flag is inferred to be a component
+            assert header["is_component"] is True
+            assert header["data"] == data
+
+
 async def test_read_flow(client: AsyncClient, logged_in_headers):
     basic_case = {
         "name": "string",
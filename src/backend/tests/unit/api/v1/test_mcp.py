@@ -1,11 +1,17 @@
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from primeagent.api.v1.mcp_utils import handle_list_tools
 from primeagent.services.auth.utils import get_password_hash
+from primeagent.services.database.models.flow.model import Flow
+from primeagent.services.database.models.flow.utils import build_mcp_tool_schema
 from primeagent.services.database.models.user import User
+from primeagent.services.deps import session_scope
+from sqlmodel import select, update
+from wfx.base.mcp.util import get_flow_snake_case
 
 # Mark all tests in this module as asyncio
 pytestmark = pytest.mark.asyncio
@@ -111,3 +117,53 @@ async def test_mcp_post_endpoint_server_error(client: AsyncClient, logged_in_hea
 
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
     assert "Internal server error" in response.json()["detail"]
+
+
+async def test_list_tools_serves_stored_input_schemas(added_flow_chat_input, monkeypatch):
+    flow_id = UUID(added_flow_chat_input["id"])
+    async with session_scope() as session:
+        stored = (await session.exec(select(Flow.mcp_tool_schema).where(Flow.id == flow_id))).first()
+    assert stored == build_mcp_tool_schema(added_flow_chat_input["data"])
+    assert stored["input_schema"]["properties"]
+
+    def fail(_flow_data):
+        msg = "The input schema should have been read from the flow"
+        raise AssertionError(msg)
+
+    with monkeypatch.context() as m:
+        m.setattr("primeagent.api.v1.mcp_utils.build_mcp_tool_schema", fail)
+        tools = await handle_list_tools()
+    tool = next(tool for tool in tools if tool.description.startswith(str(flow_id)))
+    assert tool.inputSchema == stored["input_schema"]
+
+    # Missing or outdated schemas are computed from the data of the flow and stored again
+    async with session_scope() as session:
+        await session.exec(update(Flow).where(Flow.id == flow_id).values(mcp_tool_schema={"version": 0}))
+    tools = await handle_list_tools()
+    tool = next(tool for tool in tools if tool.description.startswith(str(flow_id)))
+    assert tool.inputSchema == stored["input_schema"]
+    async with session_scope() as session:
+        assert (await session.exec(select(Flow.mcp_tool_schema).where(Flow.id == flow_id))).first() == stored
+
+
+async def test_tool_calls_look_flows_up_by_stored_tool_name(
+    client: AsyncClient, added_flow_chat_input, logged_in_headers, active_user
+):
+    flow_id = UUID(added_flow_chat_input["id"])
+    response = await client.patch(
+        f"api/v1/flows/{flow_id}", json={"name": "Renamed Flow!", "action_name": "Do It"}, headers=logged_in_headers
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    async with session_scope() as session:
+        flow = await get_flow_snake_case("renamed_flow", active_user.id, session)
+        assert flow.id == flow_id
+        assert (flow.mcp_tool_name, flow.mcp_action_name) == ("renamed_flow", "do_it")
+        assert (await get_flow_snake_case("do_it", active_user.id, session, is_action=True)).id == flow_id
+        assert await get_flow_snake_case("chat_input", active_user.id, session) is None
+
+    # Flows whose tool names were not stored are still found
+    async with session_scope() as session:
+        await session.exec(update(Flow).where(Flow.id == flow_id).values(mcp_tool_name=None, mcp_action_name=None))
+    async with session_scope() as session:
+        assert (await get_flow_snake_case("do_it", active_user.id, session, is_action=True)).id == flow_id
@@ -1,5 +1,7 @@
 import asyncio
+import io
 import tempfile
+import zipfile
 from contextlib import suppress
 from pathlib import Path
 
@@ -156,6 +158,48 @@ async def test_download_file(files_client, files_created_api_key):
     assert response.content == b"test content"
 
 
+async def test_download_file_range(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+    response = await files_client.post(
+        "api/v2/files",
+        files={"file": ("test.txt", b"0123456789")},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    file_id = response.json()["id"]
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers={**headers, "Range": "bytes=2-5"})
+    assert response.status_code == 206
+    assert response.content == b"2345"
+    assert response.headers["content-range"] == "bytes 2-5/10"
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers={**headers, "Range": "bytes=-3"})
+    assert response.status_code == 206
+    assert response.content == b"789"
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers={**headers, "Range": "bytes=20-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */10"
+
+
+async def test_download_files_batch(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+    contents = {"first": b"first content", "second": b"second content" * 1000}
+    file_ids = []
+    for name, content in contents.items():
+        response = await files_client.post("api/v2/files", files={"file": (f"{name}.txt", content)}, headers=headers)
+        assert response.status_code == 201
+        file_ids.append(response.json()["id"])
+
+    response = await files_client.post("api/v2/files/batch/", json=file_ids, headers=headers)
+
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
+        assert {name: zip_file.read(name) for name in zip_file.namelist()} == {
+            f"{name}.txt": content for name, content in contents.items()
+        }
+
+
 async def test_list_files(files_client, files_created_api_key):
     headers = {"x-api-key": files_created_api_key.api_key}
 
@@ -1253,71 +1253,7 @@ class TestMCPStructuredTool:
     @pytest.fixture
     def mcp_tool(self, test_schema, mock_client):
         """Create an MCPStructuredTool instance for testing."""
-        import json
-
-        # Import the MCPStructuredTool class from the actual code
-        # We need to recreate it here since it's defined inline in the update_tools function
-        from langchain_core.tools import StructuredTool
-        from wfx.base.mcp.util import create_tool_coroutine, create_tool_func
-
-        class MCPStructuredTool(StructuredTool):
-            def run(self, tool_input: str | dict, config=None, **kwargs):
-                """Override the main run method to handle parameter conversion before validation."""
-                # Parse tool_input if it's a string
-                if isinstance(tool_input, str):
-                    try:
-                        parsed_input = json.loads(tool_input)
-                    except json.JSONDecodeError:
-                        parsed_input = {"input": tool_input}
-                else:
-                    parsed_input = tool_input or {}
-
-                # Convert camelCase parameters to snake_case
-                converted_input = self._convert_parameters(parsed_input)
-
-                # Call the parent run method with converted parameters
-                return super().run(converted_input, config=config, **kwargs)
-
-            async def arun(self, tool_input: str | dict, config=None, **kwargs):
-                """Override the main arun method to handle parameter conversion before validation."""
-                # Parse tool_input if it's a string
-                if isinstance(tool_input, str):
-                    try:
-                        parsed_input = json.loads(tool_input)
-                    except json.JSONDecodeError:
-                        parsed_input = {"input": tool_input}
-                else:
-                    parsed_input = tool_input or {}
-
-                # Convert camelCase parameters to snake_case
-                converted_input = self._convert_parameters(parsed_input)
-
-                # Call the parent arun method with converted parameters
-                return await super().arun(converted_input, config=config, **kwargs)
-
-            def _convert_parameters(self, input_dict):
-                if not input_dict or not isinstance(input_dict, dict):
-                    return input_dict
-
-                from wfx.base.mcp.util import _camel_to_snake
-
-                converted_dict = {}
-                original_fields = set(self.args_schema.model_fields.keys())
-
-                for key, value in input_dict.items():
-                    if key in original_fields:
-                        # Field exists as-is
-                        converted_dict[key] = value
-                    else:
-                        # Try to convert camelCase to snake_case
-                        snake_key = _camel_to_snake(key)
-                        if snake_key in original_fields:
-                            converted_dict[snake_key] = value
-                        else:
-                            # Keep original key
-                            converted_dict[key] = value
-
-                return converted_dict
+        from wfx.base.mcp.util import MCPStructuredTool, create_tool_coroutine, create_tool_func
 
         return MCPStructuredTool(
             name="test_tool",
@@ -1514,6 +1450,66 @@ class TestMCPStructuredTool:
             await mcp_tool.arun(input_data)
 
 
+class TestToolCatalogCache:
+    """Test the reuse of tool catalogs and argument models across builds."""
+
+    @pytest.fixture(autouse=True)
+    def clear_tool_catalogs(self):
+        util.invalidate_tool_catalog()
+        yield
+        util.invalidate_tool_catalog()
+
+    @pytest.fixture
+    def mcp_tools(self):
+        from mcp import types
+
+        schema = {"type": "object", "properties": {"query": {"type": "string"}}, "required": ["query"]}
+        return [types.Tool(name=f"tool_{i}", description="A tool", inputSchema=schema) for i in range(3)]
+
+    def test_get_input_schema_reuses_models(self):
+        schema = {"type": "object", "properties": {"query": {"type": "string"}, "limit": {"type": "integer"}}}
+        reordered = {"properties": {"limit": {"type": "integer"}, "query": {"type": "string"}}, "type": "object"}
+
+        args_schema = util.get_input_schema(schema)
+
+        assert util.get_input_schema(reordered) is args_schema
+        assert util.get_input_schema({"type": "object", "properties": {}}) is not args_schema
+
+    async def test_update_tools_reuses_listed_tools(self, mcp_tools):
+        server_config = {"url": "http://test.url/mcp", "headers": {"x-api-key": "secret"}}
+        session = AsyncMock()
+        session.list_tools = AsyncMock(return_value=MagicMock(tools=mcp_tools))
+        first_client = MCPStreamableHttpClient()
+        second_client = MCPStreamableHttpClient()
+
+        with patch.object(MCPStreamableHttpClient, "_get_or_create_session", AsyncMock(return_value=session)):
+            _, first_tools, _ = await util.update_tools(
+                "server", server_config, mcp_streamable_http_client=first_client
+            )
+            _, second_tools, _ = await util.update_tools(
+                "server", server_config, mcp_streamable_http_client=second_client
+            )
+
+        session.list_tools.assert_awaited_once()
+        assert [tool.name for tool in second_tools] == ["tool_0", "tool_1", "tool_2"]
+        assert second_client._connected
+        # Tools sharing an input schema share their arguments model
+        assert {tool.args_schema for tool in first_tools + second_tools} == {first_tools[0].args_schema}
+
+    async def test_tools_list_changed_notification_drops_catalog(self, mcp_tools):
+        from mcp import types
+
+        connection_params = {"url": "http://test.url/mcp", "headers": {}}
+        util.cache_tools(connection_params, "streamable_http", mcp_tools)
+        handler = util._tools_changed_handler(util._server_key(connection_params, "streamable_http"))
+
+        await handler(
+            types.ServerNotification(types.ToolListChangedNotification(method="notifications/tools/list_changed"))
+        )
+
+        assert util.get_cached_tools(connection_params, "streamable_http") is None
+
+
 class TestSnakeToCamelConversion:
     """Test the _snake_to_camel function from json_schema module."""
 
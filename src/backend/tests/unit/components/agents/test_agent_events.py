@@ -1,10 +1,16 @@
+import asyncio
+import json
 from collections.abc import AsyncIterator
 from typing import Any
 from unittest.mock import AsyncMock
+from uuid import uuid4
 
+import pytest
 from langchain_core.agents import AgentFinish
+from langchain_core.messages import AIMessageChunk
 from wfx.base.agents.agent import process_agent_events
 from wfx.base.agents.events import (
+    MessageDeltaSender,
     _extract_output_text,
     handle_on_chain_end,
     handle_on_chain_start,
@@ -13,6 +19,8 @@ from wfx.base.agents.events import (
     handle_on_tool_error,
     handle_on_tool_start,
 )
+from wfx.events.event_manager import create_default_event_manager
+from wfx.events.token_buffer import TokenBuffer
 from wfx.schema.content_block import ContentBlock
 from wfx.schema.content_types import ToolContent
 from wfx.schema.message import Message
@@ -729,3 +737,135 @@ def test_extract_output_text_chatbedrockconverse_compatibility():
 
     # Mixed with text
     assert _extract_output_text([{"text": "Hello"}, {"index": 0}]) == "Hello"
+
+
+def _streamed_agent_run(chunks: list[str]) -> list[dict[str, Any]]:
+    """Events of an agent calling one tool, then streaming its answer in `chunks`."""
+    tool_events = [
+        {"event": "on_tool_start", "name": "search", "run_id": "run", "data": {"input": {"query": "weather"}}},
+        {"event": "on_tool_end", "name": "search", "run_id": "run", "data": {"output": "sunny"}},
+    ]
+    stream_events = [{"event": "on_chat_model_stream", "data": {"chunk": AIMessageChunk(content=c)}} for c in chunks]
+    return [*tool_events, *stream_events]
+
+
+async def _run_agent_events(events: list[dict[str, Any]], *, deltas: bool) -> tuple[Message, list[dict[str, Any]]]:
+    """Runs agent events like an agent component would, returning the result and the events sent to the client."""
+    queue: asyncio.Queue = asyncio.Queue()
+    event_manager = create_default_event_manager(queue)
+
+    async def send_message(message, id_=None, *, skip_db_update=False):  # noqa: ARG001
+        # Like Component.send_message: the message is copied and sent whole as an add_message event
+        stored_message = await Message.create(**message.model_dump())
+        if not getattr(stored_message, "id", None):
+            stored_message.id = str(uuid4())
+        event_manager.on_message(data=stored_message.model_dump()["data"])
+        return stored_message
+
+    agent_message = Message(
+        sender=MESSAGE_SENDER_AI,
+        sender_name="Agent",
+        properties={"icon": "Bot", "state": "partial"},
+        content_blocks=[ContentBlock(title="Agent Steps", contents=[])],
+        session_id="test_session_id",
+    )
+    result = await process_agent_events(
+        create_event_iterator(events), agent_message, send_message, event_manager if deltas else None
+    )
+    sent_events = []
+    while not queue.empty():
+        _, data, _ = queue.get_nowait()
+        sent_events.append(json.loads(data))
+    return result, sent_events
+
+
+async def test_process_agent_events_streams_deltas():
+    chunks = [f"word{i} " for i in range(50)]
+
+    result, sent_events = await _run_agent_events(_streamed_agent_run(chunks), deltas=True)
+
+    assert result.text == "".join(chunks)
+    # The whole message is only sent at the start and at the end of the run
+    messages = [event["data"] for event in sent_events if event["event"] == "add_message"]
+    assert len(messages) == 2
+    assert messages[0]["text"] == ""
+    assert messages[-1]["text"] == result.text
+    # In between, the streamed text is sent as appended chunks of the same message, the ones still
+    # pending at the end being part of the final message
+    tokens = [event["data"] for event in sent_events if event["event"] == "token"]
+    assert tokens
+    assert result.text.startswith("".join(token["chunk"] for token in tokens))
+    assert {token["id"] for token in tokens} == {str(messages[0]["id"])}
+    # and the tool step as the contents added and updated
+    deltas = [event["data"] for event in sent_events if event["event"] == "content_block_delta"]
+    assert [(delta["block_index"], delta["content_index"]) for delta in deltas] == [(0, 0), (0, 0)]
+    assert deltas[0]["content"]["output"] is None
+    assert deltas[-1]["content"]["output"] == "sunny"
+
+
+async def test_process_agent_events_sends_replaced_text_in_full():
+    events = [
+        {"event": "on_chat_model_stream", "data": {"chunk": AIMessageChunk(content="draft")}},
+        {"event": "on_chain_stream", "data": {"chunk": {"output": "final answer"}}},
+    ]
+
+    result, sent_events = await _run_agent_events(events, deltas=True)
+
+    assert result.text == "final answer"
+    messages = [event["data"] for event in sent_events if event["event"] == "add_message"]
+    assert [message["text"] for message in messages] == ["", "final answer", "final answer"]
+
+
+async def test_message_delta_sender_sends_due_text_with_new_contents():
+    queue: asyncio.Queue = asyncio.Queue()
+    event_manager = create_default_event_manager(queue)
+
+    async def send_message(message, id_=None, *, skip_db_update=False):  # noqa: ARG001
+        if not getattr(message, "id", None):
+            message.id = str(uuid4())
+        return message
+
+    sender = MessageDeltaSender(send_message, event_manager)
+    block = ContentBlock(title="Agent Steps", contents=[])
+    message = Message(sender=MESSAGE_SENDER_AI, text="", content_blocks=[block], session_id="test_session_id")
+    message = await sender(message)
+    # Every batch is due as soon as text is added
+    sender._buffer = TokenBuffer()
+
+    message.text = "hello "
+    await sender(message, skip_db_update=True)
+    # The appended text comes with a new step
+    message.text = "hello world"
+    block.contents.append(ToolContent(type="tool_use", name="search", tool_input={"query": "weather"}))
+    await sender(message, skip_db_update=True)
+
+    sent_events = []
+    while not queue.empty():
+        _, data, _ = queue.get_nowait()
+        sent_events.append(json.loads(data))
+    assert [(event["event"], event["data"].get("chunk")) for event in sent_events] == [
+        ("token", "hello "),
+        ("token", "world"),
+        ("content_block_delta", None),
+    ]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("length", [100, 1000])
+async def test_benchmark_agent_event_volume(length):
+    """Compares the events sent for an agent answer of `length` chunks, whole messages against deltas."""
+    events = _streamed_agent_run([f"token{i} " for i in range(length)])
+
+    volumes = {}
+    for deltas in (False, True):
+        result, sent_events = await _run_agent_events(events, deltas=deltas)
+        assert result.text.endswith(f"token{length - 1} ")
+        volumes[deltas] = (len(sent_events), sum(len(json.dumps(event)) for event in sent_events))
+
+    (full_count, full_bytes), (delta_count, delta_bytes) = volumes[False], volumes[True]
+    print(  # noqa: T201
+        f"chunks={length}: full messages={full_count} events/{full_bytes / 1024:.0f}KiB "
+        f"deltas={delta_count} events/{delta_bytes / 1024:.0f}KiB ratio={full_bytes / delta_bytes:.0f}x"
+    )
+    assert delta_count <= full_count
+    assert delta_bytes * 10 < full_bytes
@@ -258,6 +258,23 @@ class TestKnowledgeIngestionComponent(ComponentTestBaseWithClient):
         # Should only return one object (second row) since first is duplicate
         assert len(data_objects) == 1
 
+    def test_iter_data_batches_only_looks_up_batch_hashes(self, component_class, default_kwargs):
+        """Test that rows are converted in batches, checked against their own hashes only."""
+        component = component_class(**default_kwargs)
+        data_df = DataFrame({"text": ["a", "b", "a", "c"], "title": ["1", "2", "3", "4"]})
+        config_list = [{"column_name": "text", "vectorize": True, "identifier": False}]
+
+        mock_chroma = MagicMock()
+        mock_chroma.get.return_value = {"metadatas": []}
+
+        batches = list(component._iter_data_batches(data_df, config_list, mock_chroma, batch_size=2))
+
+        # The repeated "a" row is skipped
+        assert [[data_obj.data["text"] for data_obj in batch] for batch in batches] == [["a", "b"], ["c"]]
+        assert mock_chroma.get.call_count == 2
+        for call, batch in zip(mock_chroma.get.call_args_list, batches, strict=True):
+            assert set(call.kwargs["where"]["_id"]["$in"]) == {data_obj.data["_id"] for data_obj in batch}
+
     def test_is_valid_collection_name(self, component_class, default_kwargs):
         """Test collection name validation."""
         component = component_class(**default_kwargs)
@@ -2,12 +2,67 @@ from pathlib import Path
 from typing import Any
 
 import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
 from wfx.components.chroma import ChromaVectorStoreComponent
 from wfx.schema.data import Data
 
 from tests.base import ComponentTestBaseWithoutClient, VersionComponentMapping, DID_NOT_EXIST
 
 
+class CountingEmbeddings(DeterministicFakeEmbedding):
+    """Fake embeddings counting the documents they embed."""
+
+    embedded_documents: int = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded_documents += len(texts)
+        return super().embed_documents(texts)
+
+
+def test_build_vector_store_only_embeds_new_documents(tmp_path: Path) -> None:
+    embedding = CountingEmbeddings(size=8)
+    kwargs = {"embedding": embedding, "collection_name": "incremental", "persist_directory": str(tmp_path)}
+
+    ChromaVectorStoreComponent().set(
+        ingest_data=[Data(text="first"), Data(text="second")], **kwargs
+    ).build_vector_store()
+    assert embedding.embedded_documents == 2
+
+    # Running the same ingestion again embeds nothing
+    vector_store = (
+        ChromaVectorStoreComponent()
+        .set(ingest_data=[Data(text="first"), Data(text="second")], **kwargs)
+        .build_vector_store()
+    )
+    assert embedding.embedded_documents == 2
+    assert vector_store._collection.count() == 2
+
+    vector_store = (
+        ChromaVectorStoreComponent()
+        .set(ingest_data=[Data(text="first"), Data(text="second"), Data(text="third")], **kwargs)
+        .build_vector_store()
+    )
+    assert embedding.embedded_documents == 3
+    assert vector_store._collection.count() == 3
+
+
+def test_build_vector_store_skips_documents_stored_without_content_hash(tmp_path: Path) -> None:
+    embedding = CountingEmbeddings(size=8)
+    kwargs = {"embedding": embedding, "collection_name": "legacy", "persist_directory": str(tmp_path)}
+    vector_store = ChromaVectorStoreComponent().set(**kwargs).build_vector_store()
+    vector_store.add_texts(["first", "unrelated"], ids=["legacy-1", "legacy-2"])
+    embedding.embedded_documents = 0
+
+    vector_store = (
+        ChromaVectorStoreComponent()
+        .set(ingest_data=[Data(text="first"), Data(text="second")], **kwargs)
+        .build_vector_store()
+    )
+
+    assert embedding.embedded_documents == 1
+    assert sorted(vector_store.get()["documents"]) == ["first", "second", "unrelated"]
+
+
 @pytest.mark.api_key_required
 class TestChromaVectorStoreComponent(ComponentTestBaseWithoutClient):
     @pytest.fixture
@@ -217,12 +272,9 @@ class TestChromaVectorStoreComponent(ComponentTestBaseWithoutClient):
 
         documents = results["documents"]
 
-        # The documents are returned in a list structure
-        assert len(documents) == 3  # All documents are added, even duplicates
-
-        # Count unique texts
-        unique_texts = set(documents)
-        assert len(unique_texts) == 2  # Should have 2 unique texts
+        # Documents with the same content are only added once
+        assert len(documents) == 2
+        assert set(documents) == {"This is a test document", "This is another document"}
 
         # Test with allow_duplicates=True
         test_data = [
@@ -0,0 +1,80 @@
+from pathlib import Path
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from wfx.components.FAISS import FaissVectorStoreComponent
+from wfx.schema.data import Data
+
+pytest.importorskip("faiss")
+
+
+class CountingEmbeddings(DeterministicFakeEmbedding):
+    """Fake embeddings counting the documents they embed."""
+
+    embedded_documents: int = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded_documents += len(texts)
+        return super().embed_documents(texts)
+
+
+def build(tmp_path: Path, embedding: CountingEmbeddings, texts: list[str]):
+    return (
+        FaissVectorStoreComponent()
+        .set(
+            embedding=embedding,
+            index_name="incremental",
+            persist_directory=str(tmp_path),
+            ingest_data=[Data(text=text) for text in texts],
+        )
+        .build_vector_store()
+    )
+
+
+def test_build_vector_store_only_embeds_new_documents(tmp_path: Path) -> None:
+    embedding = CountingEmbeddings(size=8)
+
+    build(tmp_path, embedding, ["first", "second"])
+    assert embedding.embedded_documents == 2
+
+    # Running the same ingestion again embeds nothing and reuses the loaded index
+    vector_store = build(tmp_path, embedding, ["first", "second"])
+    assert embedding.embedded_documents == 2
+    assert build(tmp_path, embedding, ["first", "second"]) is vector_store
+
+    # New documents are added, the documents missing from the ingest data are deleted
+    vector_store = build(tmp_path, embedding, ["second", "third"])
+    assert embedding.embedded_documents == 3
+    assert sorted(document.page_content for document in vector_store.docstore._dict.values()) == ["second", "third"]
+    assert vector_store.index.ntotal == 2
+
+
+def test_deleted_documents_are_deleted_from_the_saved_index(tmp_path: Path) -> None:
+    from langchain_community.vectorstores import FAISS
+
+    embedding = CountingEmbeddings(size=8)
+    # An index saved without content hashes as ids
+    FAISS.from_documents([Document(page_content="first"), Document(page_content="second")], embedding).save_local(
+        str(tmp_path), "incremental"
+    )
+
+    build(tmp_path, embedding, ["second"])
+
+    saved = FAISS.load_local(str(tmp_path), embedding, "incremental", allow_dangerous_deserialization=True)
+    assert [document.page_content for document in saved.docstore._dict.values()] == ["second"]
+    assert saved.index.ntotal == 1
+
+
+def test_index_rewritten_on_disk_is_loaded_again(tmp_path: Path) -> None:
+    from langchain_community.vectorstores import FAISS
+
+    embedding = CountingEmbeddings(size=8)
+    vector_store = build(tmp_path, embedding, ["first", "second"])
+
+    # Another process replaces the index
+    FAISS.from_documents([Document(page_content="other")], embedding).save_local(str(tmp_path), "incremental")
+
+    reloaded = build(tmp_path, embedding, ["other"])
+    assert reloaded is not vector_store
+    assert [document.page_content for document in reloaded.docstore._dict.values()] == ["other"]
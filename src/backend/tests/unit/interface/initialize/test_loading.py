@@ -1,8 +1,12 @@
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
+from wfx.custom.custom_component.component import Component
+from wfx.graph.graph.base import Graph
 from wfx.interface.initialize.loading import (
+    prefetch_graph_variables,
     update_params_with_load_from_db_fields,
     update_table_params_with_load_from_db_fields,
 )
@@ -523,3 +527,53 @@ async def test_update_table_params_handles_user_id_not_set_error():
             await update_table_params_with_load_from_db_fields(
                 custom_component, params, "table_data", fallback_to_env_vars=True
             )
+
+
+@pytest.mark.asyncio
+async def test_prefetch_graph_variables_fetches_every_vertex_at_once():
+    """Test that the load_from_db variables of all vertices are fetched with one call and served from the graph."""
+    graph = Graph(user_id=str(uuid4()), context={"request_variables": {"OVERRIDDEN": "from-request"}})
+    graph.vertices = [
+        MagicMock(params={"api_key": "OPENAI_KEY"}, load_from_db_fields=["api_key"]),
+        MagicMock(
+            params={
+                "token": "",
+                "headers": [{"key": "auth", "value": "HEADER_VAR"}],
+                "headers_load_from_db_columns": ["value"],
+            },
+            load_from_db_fields=["token", "table:headers"],
+        ),
+        MagicMock(params={"api_key": "OVERRIDDEN"}, load_from_db_fields=["api_key"]),
+    ]
+    variable_service = MagicMock()
+    variable_service.get_variables = AsyncMock(
+        return_value={
+            ("OPENAI_KEY", "api_key"): "sk-test",
+            ("HEADER_VAR", "headers.value"): ValueError("HEADER_VAR variable not found."),
+        }
+    )
+
+    with (
+        patch("wfx.interface.initialize.loading.get_variable_service", return_value=variable_service),
+        patch("wfx.interface.initialize.loading.session_scope") as mock_session_scope,
+    ):
+        mock_session_scope.return_value.__aenter__.return_value = MagicMock()
+        await prefetch_graph_variables(graph)
+        await prefetch_graph_variables(graph)
+
+    variable_service.get_variables.assert_awaited_once()
+    assert variable_service.get_variables.await_args.kwargs["fields"] == {
+        ("OPENAI_KEY", "api_key"),
+        ("HEADER_VAR", "headers.value"),
+    }
+
+    component = Component(_vertex=MagicMock(graph=graph))
+    with patch("wfx.custom.custom_component.custom_component.get_variable_service") as get_service:
+        assert await component.get_variable("OPENAI_KEY", "api_key", session=None) == "sk-test"
+        assert await component.get_variable("OVERRIDDEN", "api_key", session=None) == "from-request"
+        with pytest.raises(ValueError, match="HEADER_VAR variable not found"):
+            await component.get_variable("HEADER_VAR", "headers.value", session=None)
+    get_service.assert_not_called()
+
+    graph.initialize()
+    assert graph.prefetched_variables is None
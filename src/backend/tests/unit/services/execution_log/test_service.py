@@ -0,0 +1,121 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from primeagent.services.database.models.transactions import crud as transactions_crud
+from primeagent.services.database.models.transactions.model import TransactionTable
+from primeagent.services.database.models.vertex_builds.model import VertexBuildTable
+from primeagent.services.execution_log.service import ExecutionLogService
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from wfx.services.settings.base import Settings
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def settings():
+    return Settings().model_copy(
+        update={
+            "max_transactions_to_keep": 3,
+            "max_vertex_builds_to_keep": 5,
+            "max_vertex_builds_per_vertex": 2,
+            "execution_log_batch_size": 100,
+            "execution_log_flush_interval": 0.01,
+            "execution_log_queue_size": 100,
+            "execution_log_compaction_interval": 3600,
+        }
+    )
+
+
+@pytest.fixture
+def service(async_session: AsyncSession, settings):
+    @asynccontextmanager
+    async def session_scope():
+        yield async_session
+
+    with (
+        patch("primeagent.services.execution_log.service.session_scope", session_scope),
+        patch("primeagent.services.database.models.transactions.crud.get_settings_service") as transaction_settings,
+        patch("primeagent.services.database.models.vertex_builds.crud.get_settings_service") as build_settings,
+    ):
+        transaction_settings.return_value.settings = settings
+        build_settings.return_value.settings = settings
+        yield ExecutionLogService(SimpleNamespace(settings=settings))
+
+
+def transaction(flow_id, offset: int) -> dict:
+    return {
+        "vertex_id": "vertex",
+        "status": "success",
+        "flow_id": flow_id,
+        "timestamp": BASE_TIME + timedelta(seconds=offset),
+    }
+
+
+def vertex_build(flow_id, vertex_id: str, offset: int) -> dict:
+    return {"id": vertex_id, "flow_id": flow_id, "valid": True, "timestamp": BASE_TIME + timedelta(seconds=offset)}
+
+
+async def test_records_are_written_in_one_batch_without_per_row_retention(async_session: AsyncSession, service):
+    flow_id = uuid4()
+    with patch(
+        "primeagent.services.execution_log.service.log_transactions", wraps=transactions_crud.log_transactions
+    ) as log_transactions:
+        for offset in range(5):
+            await service.add_transaction(transaction(flow_id, offset))
+        await service.flush()
+
+    log_transactions.assert_awaited_once()
+    rows = (await async_session.exec(select(TransactionTable))).all()
+    assert len(rows) == 5
+    await service.teardown()
+
+
+async def test_compaction_applies_retention_per_flow(async_session: AsyncSession, service):
+    first_flow, second_flow = uuid4(), uuid4()
+    for offset in range(5):
+        await service.add_transaction(transaction(first_flow, offset))
+        await service.add_transaction(transaction(second_flow, offset))
+        await service.add_vertex_build(vertex_build(first_flow, "a", offset))
+        await service.add_vertex_build(vertex_build(first_flow, "b", offset))
+    await service.flush()
+    await service.compact()
+
+    for flow_id in (first_flow, second_flow):
+        timestamps = (
+            await async_session.exec(
+                select(TransactionTable.timestamp)
+                .where(TransactionTable.flow_id == flow_id)
+                .order_by(col(TransactionTable.timestamp))
+            )
+        ).all()
+        assert [timestamp.replace(tzinfo=timezone.utc) for timestamp in timestamps] == [
+            BASE_TIME + timedelta(seconds=offset) for offset in (2, 3, 4)
+        ]
+    builds = (await async_session.exec(select(VertexBuildTable))).all()
+    assert sorted(build.id for build in builds) == ["a", "a", "b", "b"]
+    await service.teardown()
+
+
+async def test_teardown_writes_queued_records(async_session: AsyncSession, service):
+    flow_id = uuid4()
+    await service.add_vertex_build(vertex_build(flow_id, "a", 0))
+    await service.teardown()
+
+    assert len((await async_session.exec(select(VertexBuildTable))).all()) == 1
+
+
+async def test_full_queue_makes_callers_wait(service):
+    service._queue = asyncio.Queue(maxsize=1)
+    # A writer that never finishes leaves the queue full
+    service._worker = asyncio.get_running_loop().create_future()
+    await service.add_transaction(transaction(uuid4(), 0))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(service.add_transaction(transaction(uuid4(), 1)), timeout=0.05)
+    service._worker.cancel()
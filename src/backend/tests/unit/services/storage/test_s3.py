@@ -0,0 +1,84 @@
+import inspect
+from types import SimpleNamespace
+
+import pytest
+
+boto3 = pytest.importorskip("boto3")
+
+from primeagent.services.storage.s3 import S3StorageService  # noqa: E402
+from primeagent.services.storage.service import StorageService  # noqa: E402
+
+
+@pytest.fixture
+def s3_service(monkeypatch, tmp_path):
+    moto = pytest.importorskip("moto")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_aws():
+        boto3.client("s3").create_bucket(Bucket="primeagent")
+        settings_service = SimpleNamespace(settings=SimpleNamespace(config_dir=str(tmp_path)))
+        yield S3StorageService(session_service=None, settings_service=settings_service)
+
+
+async def collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+async def test_save_and_get_file(s3_service):
+    await s3_service.save_file("flow", "file.txt", b"content")
+
+    assert await s3_service.get_file("flow", "file.txt") == b"content"
+    assert await s3_service.get_file_size("flow", "file.txt") == len(b"content")
+    assert await s3_service.list_files("flow") == ["file.txt"]
+
+
+async def test_list_files_only_lists_the_files_of_the_flow(s3_service):
+    await s3_service.save_file("flow", "b.txt", b"b")
+    await s3_service.save_file("flow", "a.txt", b"a")
+    await s3_service.save_file("flow", "nested/c.txt", b"c")
+    await s3_service.save_file("flow-2", "d.txt", b"d")
+
+    assert sorted(await s3_service.list_files("flow")) == ["a.txt", "b.txt"]
+
+
+async def test_large_files_use_multipart_upload(s3_service, monkeypatch):
+    monkeypatch.setattr(s3_service.transfer_config, "multipart_threshold", 5 * 1024 * 1024)
+    monkeypatch.setattr(s3_service.transfer_config, "multipart_chunksize", 5 * 1024 * 1024)
+    data = bytes(range(256)) * (48 * 1024)  # 12 MiB
+
+    await s3_service.save_file("flow", "large.bin", data)
+
+    head = s3_service.s3_client.head_object(Bucket="primeagent", Key="flow/large.bin")
+    # Multipart uploads get an ETag suffixed with the number of parts
+    assert head["ETag"].strip('"').endswith("-3")
+    assert await collect(s3_service.stream_file("flow", "large.bin", chunk_size=1024 * 1024)) == data
+
+
+async def test_stream_file_in_chunks_and_ranges(s3_service):
+    await s3_service.save_file("flow", "file.txt", b"0123456789")
+
+    chunks = [chunk async for chunk in s3_service.stream_file("flow", "file.txt", chunk_size=4)]
+    assert chunks == [b"0123", b"4567", b"89"]
+    assert await collect(s3_service.stream_file("flow", "file.txt", byte_range=(3, 6))) == b"3456"
+
+
+@pytest.mark.parametrize(
+    "method", ["save_file", "get_file", "stream_file", "list_files", "get_file_size", "delete_file"]
+)
+def test_methods_match_the_storage_service_signature(method):
+    # Callers pass the arguments by keyword
+    assert list(inspect.signature(getattr(S3StorageService, method)).parameters) == list(
+        inspect.signature(getattr(StorageService, method)).parameters
+    )
+
+
+async def test_methods_accept_keyword_arguments(s3_service):
+    await s3_service.save_file(flow_id="flow", file_name="file.txt", data=b"0123456789")
+
+    assert await s3_service.get_file(flow_id="flow", file_name="file.txt") == b"0123456789"
+    assert await s3_service.get_file_size(flow_id="flow", file_name="file.txt") == 10
+    assert await collect(s3_service.stream_file(flow_id="flow", file_name="file.txt", byte_range=(0, 3))) == b"0123"
+    assert await s3_service.list_files(flow_id="flow") == ["file.txt"]
+    await s3_service.delete_file(flow_id="flow", file_name="file.txt")
+    assert await s3_service.list_files(flow_id="flow") == []
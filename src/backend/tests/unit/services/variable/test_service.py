@@ -240,3 +240,42 @@ async def test_create_variable(service, session: AsyncSession):
     assert result.type == CREDENTIAL_TYPE
     assert isinstance(result.created_at, datetime)
     assert isinstance(result.updated_at, datetime)
+
+
+async def test_get_variables(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "api_key", "secret", session=session)
+    await service.create_variable(user_id, "model", "gpt", session=session)
+
+    with patch.object(session, "exec", wraps=session.exec) as exec_spy:
+        result = await service.get_variables(
+            user_id,
+            [("api_key", "api_key"), ("api_key", "session_id"), ("model", "model_name"), ("missing", "api_key")],
+            session=session,
+        )
+
+    assert exec_spy.call_count == 1
+    assert result["api_key", "api_key"] == "secret"
+    assert result["model", "model_name"] == "gpt"
+    assert isinstance(result["api_key", "session_id"], TypeError)
+    assert isinstance(result["missing", "api_key"], ValueError)
+
+
+async def test_get_variable__cached_until_changed(session: AsyncSession):
+    settings_service = get_settings_service()
+    with patch.object(settings_service.settings, "variable_cache_ttl", 60):
+        service = DatabaseVariableService(settings_service)
+    user_id = uuid4()
+    saved = await service.create_variable(user_id, "name", "value", session=session)
+    assert await service.get_variable(user_id, "name", "", session=session) == "value"
+
+    with patch.object(session, "exec", wraps=session.exec) as exec_spy:
+        assert await service.get_variable(user_id, "name", "", session=session) == "value"
+    assert exec_spy.call_count == 0
+
+    await service.update_variable(user_id, "name", "new_value", session=session)
+    assert await service.get_variable(user_id, "name", "", session=session) == "new_value"
+
+    await service.delete_variable_by_id(user_id, saved.id, session=session)
+    with pytest.raises(ValueError, match="name variable not found"):
+        await service.get_variable(user_id, "name", "", session=session)
@@ -80,6 +80,43 @@ async def test_build_flow_with_frozen_path(client, json_memory_chatbot_no_llm, l
     await check_messages(flow_id)
 
 
+async def test_build_flow_caches_the_graph_after_streaming_vertices(
+    client, json_memory_chatbot_no_llm, logged_in_headers, monkeypatch
+):
+    """The stream endpoint reads streaming vertices back from the cached graph, so it is cached once they are built."""
+    from primeagent.services.chat.service import ChatService
+    from wfx.graph.graph.base import Graph
+    from wfx.graph.vertex.base import Vertex
+
+    # Make the chat output stream, without needing an LLM
+    monkeypatch.setattr(
+        Vertex,
+        "will_stream",
+        property(lambda self: self.id.startswith("ChatOutput"), lambda _self, _value: None),
+        raising=False,
+    )
+    cached_chat_outputs_built = []
+    set_cache = ChatService.set_cache
+
+    async def record_set_cache(self, key, data, lock=None):
+        if isinstance(data, Graph):
+            chat_output = next(vertex for vertex in data.vertices if vertex.id.startswith("ChatOutput"))
+            cached_chat_outputs_built.append(chat_output.built)
+        return await set_cache(self, key, data, lock)
+
+    monkeypatch.setattr(ChatService, "set_cache", record_set_cache)
+    flow_id = await create_flow(client, json_memory_chatbot_no_llm, logged_in_headers)
+
+    build_response = await build_flow(client, flow_id, logged_in_headers)
+    events_response = await get_build_events(client, build_response["job_id"], logged_in_headers)
+    assert events_response.status_code == codes.OK
+    assert '"end"' in events_response.text
+
+    # The graph cached last holds the built chat output
+    assert cached_chat_outputs_built
+    assert cached_chat_outputs_built[-1] is True
+
+
 async def check_messages(flow_id):
     if isinstance(flow_id, str):
         flow_id = UUID(flow_id)
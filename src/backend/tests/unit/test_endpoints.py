@@ -6,8 +6,11 @@ import orjson
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from primeagent.processing.graph_cache import get_prepared_graph_cache
 from primeagent.services.database.models.flow.model import FlowCreate
+from primeagent.services.deps import get_chat_service
 from wfx.custom.directory_reader.directory_reader import DirectoryReader
+from wfx.services.cache.utils import CacheMiss
 from wfx.services.settings.base import BASE_COMPONENTS_PATH
 
 
@@ -149,6 +152,23 @@ async def test_get_all(client: AsyncClient, logged_in_headers):
     assert "ChatOutput" in json_response["input_output"]
 
 
+async def test_get_all_supports_etag_revalidation(client: AsyncClient, logged_in_headers):
+    """Tests that the component catalog is served with an ETag and revalidated with 304 Not Modified."""
+    response = await client.get("api/v1/all", headers=logged_in_headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Content-Encoding"] in {"gzip", "br", "zstd"}
+
+    again = await client.get("api/v1/all", headers={**logged_in_headers, "If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+
+    identity = await client.get("api/v1/all", headers={**logged_in_headers, "Accept-Encoding": "identity"})
+    assert identity.headers["ETag"] == etag
+    assert "Content-Encoding" not in identity.headers
+    assert identity.json() == response.json()
+
+
 @pytest.mark.usefixtures("active_user")
 async def test_post_validate_code(client: AsyncClient, logged_in_headers):
     # Test case with a valid import and function
@@ -502,6 +522,45 @@ async def test_invalid_run_with_input_type_chat(client, simple_api_test, created
     assert "If you pass an input_value to the chat input, you cannot pass a tweak with the same name." in response.text
 
 
+async def test_successful_run_with_input_values_batch(client: AsyncClient, simple_api_test, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    input_values = [f"value{i}" for i in range(5)]
+    payload = {
+        "input_type": "chat",
+        "output_type": "debug",
+        "input_values": input_values,
+    }
+    response = await client.post(f"/api/v1/run/{flow_id}", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    outer_outputs = response.json()["outputs"]
+    # One output per input value, in the same order
+    assert [outputs_dict["inputs"] for outputs_dict in outer_outputs] == [
+        {"input_value": input_value} for input_value in input_values
+    ]
+    for input_value, outputs_dict in zip(input_values, outer_outputs, strict=True):
+        chat_input_outputs = [output for output in outputs_dict["outputs"] if "ChatInput" in output["component_id"]]
+        assert [output["results"]["message"]["text"] for output in chat_input_outputs] == [input_value]
+
+
+async def test_run_does_not_cache_the_graph(client: AsyncClient, simple_api_test, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    payload = {"input_type": "chat", "output_type": "debug", "input_value": "value1"}
+    response = await client.post(f"/api/v1/run/{flow_id}", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert isinstance(await get_chat_service().get_cache(str(flow_id)), CacheMiss)
+
+
+async def test_invalid_run_with_input_value_and_input_values(client, simple_api_test, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    payload = {"input_value": "value1", "input_values": ["value2"]}
+    response = await client.post(f"/api/v1/run/{flow_id}", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+    assert "You cannot pass both an input_value and input_values." in response.text
+
+
 @pytest.mark.benchmark
 async def test_successful_run_with_input_type_any(client, simple_api_test, created_api_key):
     headers = {"x-api-key": created_api_key.api_key}
@@ -549,6 +608,38 @@ async def test_successful_run_with_input_type_any(client, simple_api_test, creat
     )
 
 
+async def test_run_reuses_prepared_graph_until_flow_is_saved(
+    client, simple_api_test, created_api_key, logged_in_headers
+):
+    cache = get_prepared_graph_cache()
+    cache.clear()
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    payload = {"input_type": "chat", "input_value": "value1"}
+
+    for _ in range(3):
+        response = await client.post(f"/api/v1/run/{flow_id}", headers=headers, json=payload)
+        assert response.status_code == status.HTTP_200_OK, response.text
+    assert (cache.info().hits, cache.info().misses) == (2, 1)
+
+    # Different tweaks need their own template
+    response = await client.post(
+        f"/api/v1/run/{flow_id}",
+        headers=headers,
+        json={**payload, "tweaks": {"ChatInput-3OQi9": {"sender_name": "Tester"}}},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert (cache.info().misses, cache.info().size) == (2, 2)
+
+    response = await client.patch(f"api/v1/flows/{flow_id}", json={"description": "updated"}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert cache.info().size == 0
+
+    response = await client.post(f"/api/v1/run/{flow_id}", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert cache.info().misses == 3
+
+
 async def test_invalid_flow_id(client, created_api_key):
     headers = {"x-api-key": created_api_key.api_key}
     flow_id = "invalid-flow-id"
@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+
+from primeagent.processing.graph_cache import PreparedGraphCache
+from primeagent.schema.graph import Tweaks
+
+UPDATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_key(flow_id="flow", updated_at=UPDATED_AT, tweaks=None, *, stream=False, user_id="user"):
+    return PreparedGraphCache.make_key(flow_id, updated_at, tweaks, stream=stream, user_id=user_id)
+
+
+def test_key_depends_on_every_part():
+    key = make_key(tweaks={"a": {"b": 1}})
+
+    assert key == make_key(tweaks={"a": {"b": 1}})
+    assert key != make_key(flow_id="other", tweaks={"a": {"b": 1}})
+    assert key != make_key(updated_at=datetime.now(timezone.utc), tweaks={"a": {"b": 1}})
+    assert key != make_key(tweaks={"a": {"b": 2}})
+    assert key != make_key(tweaks={"a": {"b": 1}}, stream=True)
+    assert key != make_key(tweaks={"a": {"b": 1}}, user_id="other")
+
+
+def test_key_ignores_tweak_order_and_accepts_models():
+    assert make_key(tweaks={"a": 1, "b": 2}) == make_key(tweaks={"b": 2, "a": 1})
+    assert make_key(tweaks=Tweaks(root={"a": {"b": 1}})) == make_key(tweaks={"a": {"b": 1}})
+    assert make_key(tweaks=None) == make_key(tweaks={})
+
+
+def test_hits_misses_and_invalidation():
+    cache = PreparedGraphCache(maxsize=4)
+    graph = object()
+    assert cache.get(make_key()) is None
+    cache.set(make_key(), graph)
+    cache.set(make_key(tweaks={"a": 1}), graph)
+    cache.set(make_key(flow_id="other"), graph)
+
+    assert cache.get(make_key()) is graph
+    assert cache.invalidate("flow") == 2
+    assert cache.get(make_key()) is None
+    info = cache.info()
+    assert (info.hits, info.misses, info.size) == (1, 2, 1)
+    assert info.hit_rate == 1 / 3
+
+
+def test_disabled_cache_stores_nothing():
+    cache = PreparedGraphCache(maxsize=0)
+    cache.set(make_key(), object())
+
+    assert not cache.enabled
+    assert cache.get(make_key()) is None
+    assert cache.info().size == 0
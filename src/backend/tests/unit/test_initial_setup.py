@@ -280,7 +280,15 @@ def set_fs_flows_polling_interval():
     os.unsetenv("PRIMEAGENT_FS_FLOWS_POLLING_INTERVAL")
 
 
-@pytest.mark.usefixtures("set_fs_flows_polling_interval")
+@pytest.fixture(params=["watch", "poll"])
+def fs_flows_sync_mode(request, monkeypatch):
+    if request.param == "poll":
+        # Without watchfiles, the flow files are polled
+        monkeypatch.setattr("primeagent.initial_setup.setup.awatch", None)
+    return request.param
+
+
+@pytest.mark.usefixtures("set_fs_flows_polling_interval", "fs_flows_sync_mode")
 async def test_sync_flows_from_fs(client: AsyncClient, logged_in_headers):
     flow_file = Path(tempfile.tempdir) / f"{uuid.uuid4()}.json"
     try:
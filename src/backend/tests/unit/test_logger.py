@@ -15,6 +15,7 @@ import json
 import logging
 import os
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -23,6 +24,7 @@ import structlog
 from wfx.log.logger import (
     LOG_LEVEL_MAP,
     VALID_LOG_LEVELS,
+    AsyncLogSink,
     InterceptHandler,
     SizedLogBuffer,
     add_serialized,
@@ -551,15 +553,12 @@ class TestLogProcessors:
 
         with (
             patch.object(log_buffer, "enabled", return_value=True),
-            patch.object(log_buffer, "write") as mock_write,
+            patch.object(log_buffer, "write_event") as mock_write,
         ):
             result = buffer_writer(None, "info", event_dict)
 
-        # Should write to buffer when enabled
-        mock_write.assert_called_once()
-        call_args = mock_write.call_args[0]
-        written_data = json.loads(call_args[0])
-        assert written_data["event"] == "Test message"
+        # Should write the event dict to the buffer when enabled, without serializing it
+        mock_write.assert_called_once_with(event_dict)
         assert result == event_dict
 
 
@@ -949,3 +948,76 @@ def test_max_size(sized_log_buffer):
     assert sized_log_buffer.max_size() == 0
     sized_log_buffer.max = 100
     assert sized_log_buffer.max_size() == 100
+
+
+def test_write_event_stores_numeric_timestamp_without_serializing(sized_log_buffer):
+    sized_log_buffer.max = 5
+    sized_log_buffer.write_event({"event": "Direct", "timestamp": 1625097600.5})
+
+    assert sized_log_buffer.buffer == [(1625097600500, "Direct")]
+
+
+def test_ring_wraps_around_and_keeps_timestamp_queries(sized_log_buffer):
+    sized_log_buffer.max = 4
+    for i in range(10):
+        sized_log_buffer.append(1000 + i, f"Log {i}")
+
+    assert [msg for _, msg in sized_log_buffer.buffer] == ["Log 6", "Log 7", "Log 8", "Log 9"]
+    assert sized_log_buffer.get_after_timestamp(1007, lines=2) == {1007: "Log 7", 1008: "Log 8"}
+    assert sized_log_buffer.get_before_timestamp(1009, lines=5) == {1006: "Log 6", 1007: "Log 7", 1008: "Log 8"}
+    assert sized_log_buffer.get_after_timestamp(2000) == {}
+    assert sized_log_buffer.get_before_timestamp(2000, lines=1) == {1009: "Log 9"}
+
+
+def test_get_after_sequence_returns_only_new_entries(sized_log_buffer):
+    sized_log_buffer.max = 3
+    sized_log_buffer.append(1, "old")
+    sequence, entries = sized_log_buffer.get_after_sequence(None)
+    assert entries == []
+
+    sized_log_buffer.append(2, "new")
+    sequence, entries = sized_log_buffer.get_after_sequence(sequence)
+    assert entries == [(2, "new")]
+
+    # Entries dropped before being read are skipped
+    for i in range(5):
+        sized_log_buffer.append(10 + i, f"burst {i}")
+    _, entries = sized_log_buffer.get_after_sequence(sequence)
+    assert entries == [(12, "burst 2"), (13, "burst 3"), (14, "burst 4")]
+
+
+def test_async_log_sink_writes_in_background():
+    stream = Mock()
+    sink = AsyncLogSink(stream)
+    sink.write("first\n")
+    sink.write("second\n")
+    sink.close()
+
+    written = "".join(call.args[0] for call in stream.write.call_args_list)
+    assert written == "first\nsecond\n"
+    stream.flush.assert_called()
+
+
+def test_async_log_sink_drops_writes_instead_of_blocking():
+    class SlowStream:
+        def __init__(self):
+            self.release = threading.Event()
+            self.chunks = []
+
+        def write(self, text):
+            self.release.wait()
+            self.chunks.append(text)
+
+        def flush(self):
+            pass
+
+    stream = SlowStream()
+    sink = AsyncLogSink(stream, max_pending=2)
+    for i in range(10):
+        sink.write(f"line {i}\n")
+    stream.release.set()
+    sink.close()
+
+    written = "".join(stream.chunks)
+    assert "line 0" in written
+    assert "log writes dropped" in written
@@ -235,3 +235,52 @@ async def test_get_messages_empty_result_with_encoded_nonexistent_session(client
     assert response.status_code == 200, response.text
     messages = response.json()
     assert len(messages) == 0
+
+
+@pytest.mark.usefixtures("session")
+@pytest.mark.parametrize("order", ["ASC", "DESC"])
+async def test_get_messages_keyset_pagination(client: AsyncClient, logged_in_headers, order):
+    session_id = "paginated_session"
+    timestamps = [datetime(2024, 1, 1, 10, minute, tzinfo=timezone.utc) for minute in (0, 1, 1, 1, 2)]
+    async with session_scope() as session:
+        messagetables = [
+            MessageTable.model_validate(
+                MessageCreate(
+                    text=f"Message {index}",
+                    sender="User",
+                    sender_name="User",
+                    session_id=session_id,
+                    timestamp=timestamp,
+                ),
+                from_attributes=True,
+            )
+            for index, timestamp in enumerate(timestamps)
+        ]
+        created = await aadd_messagetables(messagetables, session)
+    # Messages with the same timestamp are ordered by ID
+    expected = [str(message.id) for message in sorted(created, key=lambda message: (message.timestamp, message.id))]
+    if order == "DESC":
+        expected.reverse()
+
+    pages = []
+    params = {"session_id": session_id, "order": order, "limit": 2}
+    while True:
+        response = await client.get("api/v1/monitor/messages", params=params, headers=logged_in_headers)
+        assert response.status_code == 200, response.text
+        if not (page := response.json()):
+            break
+        assert len(page) <= 2
+        pages.append([message["id"] for message in page])
+        params["after"] = page[-1]["id"]
+
+    assert [message_id for page in pages for message_id in page] == expected
+    assert len(pages) == 3
+
+
+async def test_get_messages_unknown_cursor(client: AsyncClient, logged_in_headers):
+    response = await client.get(
+        "api/v1/monitor/messages",
+        params={"after": "00000000-0000-0000-0000-000000000000", "limit": 2},
+        headers=logged_in_headers,
+    )
+    assert response.status_code == 404, response.text
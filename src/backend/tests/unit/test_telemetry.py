@@ -16,8 +16,10 @@ def opentelemetry_instance():
 def test_init(opentelemetry_instance):
     assert isinstance(opentelemetry_instance, OpenTelemetry)
     assert len(opentelemetry_instance._metrics) > 1
-    assert len(opentelemetry_instance._metrics) == len(opentelemetry_instance._metrics_registry) == 2
+    assert len(opentelemetry_instance._metrics) == len(opentelemetry_instance._metrics_registry) == 4
     assert "file_uploads" in opentelemetry_instance._metrics
+    assert "graph_template_cache_hits" in opentelemetry_instance._metrics
+    assert "graph_template_cache_misses" in opentelemetry_instance._metrics
 
 
 def test_gauge(opentelemetry_instance):
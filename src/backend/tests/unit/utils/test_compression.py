@@ -3,8 +3,10 @@ import json
 from datetime import date, datetime, timezone
 from unittest.mock import patch
 
+import pytest
 from fastapi import Response
-from primeagent.utils.compression import compress_response
+from primeagent.utils.compression import PrecompressedJSON, compress_response
+from starlette.datastructures import Headers
 
 
 class TestCompressResponse:
@@ -286,3 +288,63 @@ class TestCompressResponse:
         except (TypeError, ValueError):
             # Expected behavior if jsonable_encoder can't handle the object
             pass
+
+
+class TestPrecompressedJSON:
+    """Test cases for the PrecompressedJSON catalog responses."""
+
+    data = {"components": {"ChatInput": {"display_name": "Chat Input"}}, "count": 1}
+
+    def test_from_data_builds_etag_and_bodies(self):
+        """Test that the document is serialized once into every available coding."""
+        catalog = PrecompressedJSON.from_data(self.data)
+
+        # Weak, as it is shared by the differently encoded bodies
+        assert catalog.etag.startswith('W/"')
+        assert catalog.etag.endswith('"')
+        assert json.loads(catalog.bodies["identity"]) == self.data
+        assert json.loads(gzip.decompress(catalog.bodies["gzip"])) == self.data
+        assert PrecompressedJSON.from_data(dict(self.data)).etag == catalog.etag
+        assert PrecompressedJSON.from_data({**self.data, "count": 2}).etag != catalog.etag
+
+    @pytest.mark.parametrize(
+        ("accept_encoding", "expected"),
+        [
+            (None, "gzip"),
+            ("gzip, deflate", "gzip"),
+            ("gzip;q=0, deflate", None),
+            ("identity", None),
+            ("*", "gzip"),
+        ],
+    )
+    def test_response_negotiates_encoding(self, accept_encoding, expected):
+        """Test that the body coding follows the Accept-Encoding header."""
+        catalog = PrecompressedJSON(etag='"tag"', bodies={"identity": b"{}", "gzip": gzip.compress(b"{}")})
+        headers = Headers({"accept-encoding": accept_encoding} if accept_encoding is not None else {})
+
+        response = catalog.response(headers)
+
+        assert response.status_code == 200
+        assert response.headers.get("Content-Encoding") == expected
+        assert response.headers["ETag"] == '"tag"'
+        assert response.headers["Content-Length"] == str(len(response.body))
+
+    def test_response_prefers_best_available_encoding(self):
+        """Test that zstd and Brotli bodies are preferred when both sides support them."""
+        catalog = PrecompressedJSON(etag='"tag"', bodies={"identity": b"{}", "gzip": b"g", "br": b"b", "zstd": b"z"})
+
+        assert catalog.response(Headers({"accept-encoding": "gzip, br, zstd"})).body == b"z"
+        assert catalog.response(Headers({"accept-encoding": "gzip, br"})).body == b"b"
+
+    @pytest.mark.parametrize("etag", ['"tag"', 'W/"tag"'])
+    @pytest.mark.parametrize("if_none_match", ['"tag"', 'W/"tag"', '"other", "tag"', "*"])
+    def test_matching_etag_returns_not_modified(self, etag, if_none_match):
+        """Test that revalidation with a matching ETag returns an empty 304."""
+        catalog = PrecompressedJSON(etag=etag, bodies={"identity": b"{}"})
+
+        response = catalog.response(Headers({"if-none-match": if_none_match}))
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["ETag"] == etag
+        assert catalog.response(Headers({"if-none-match": '"other"'})).status_code == 200
@@ -0,0 +1,66 @@
+import asyncio
+import io
+import zipfile
+
+import pytest
+from primeagent.utils.zip_stream import ZipEntry, stream_zip
+
+
+def chunks_of(data: bytes, size: int):
+    async def stream():
+        for start in range(0, len(data), size):
+            yield data[start : start + size]
+
+    return stream
+
+
+async def collect(stream) -> list[bytes]:
+    return [chunk async for chunk in stream]
+
+
+async def test_stream_zip_builds_a_valid_archive():
+    files = {"a.txt": b"a" * 10_000, "b.bin": bytes(range(256)) * 10, "empty.txt": b""}
+    entries = [ZipEntry(name, chunks_of(data, 1000), size=len(data)) for name, data in files.items()]
+
+    archive = b"".join(await collect(stream_zip(entries, prefetch=2)))
+
+    with zipfile.ZipFile(io.BytesIO(archive)) as zip_file:
+        assert zip_file.namelist() == list(files)
+        assert {name: zip_file.read(name) for name in files} == files
+
+
+async def test_stream_zip_emits_output_before_reading_every_file():
+    started = []
+    release_last = asyncio.Event()
+
+    def tracked(name: str, *, wait: bool = False):
+        async def stream():
+            started.append(name)
+            if wait:
+                await release_last.wait()
+            yield name.encode()
+
+        return stream
+
+    entries = [ZipEntry(f"{i}.txt", tracked(f"{i}.txt", wait=i == 4)) for i in range(5)]
+    stream = stream_zip(entries, prefetch=2)
+
+    first = await anext(stream)
+    assert first.startswith(b"PK")
+    # Only the files within the prefetch window have been opened so far
+    assert started == ["0.txt", "1.txt"]
+
+    release_last.set()
+    archive = first + b"".join(await collect(stream))
+    with zipfile.ZipFile(io.BytesIO(archive)) as zip_file:
+        assert zip_file.read("4.txt") == b"4.txt"
+
+
+async def test_stream_zip_raises_storage_errors():
+    async def failing():
+        msg = "missing"
+        raise FileNotFoundError(msg)
+        yield b""
+
+    with pytest.raises(FileNotFoundError, match="missing"):
+        await collect(stream_zip([ZipEntry("ok.txt", chunks_of(b"ok", 1)), ZipEntry("bad.txt", failing)]))
@@ -471,6 +471,81 @@ describe("useMessagesStore", () => {
     });
   });
 
+  describe("updateMessageContent", () => {
+    const agentMessage: Message = {
+      ...mockMachineMessage,
+      content_blocks: [
+        {
+          title: "Agent Steps",
+          contents: [{ type: "text", text: "Input" }],
+          allow_markdown: true,
+          component: "",
+        },
+      ],
+    };
+
+    it("should append a new content to the block", () => {
+      const { result } = renderHook(() => useMessagesStore());
+
+      act(() => {
+        result.current.setMessages([agentMessage]);
+      });
+
+      act(() => {
+        result.current.updateMessageContent(agentMessage.id, 0, 1, {
+          type: "tool_use",
+          name: "search",
+          tool_input: { query: "weather" },
+        });
+      });
+
+      const contents = result.current.messages[0].content_blocks![0].contents;
+      expect(contents).toHaveLength(2);
+      expect(contents[1]).toMatchObject({ type: "tool_use", name: "search" });
+      expect(agentMessage.content_blocks![0].contents).toHaveLength(1);
+    });
+
+    it("should replace an existing content", () => {
+      const { result } = renderHook(() => useMessagesStore());
+
+      act(() => {
+        result.current.setMessages([agentMessage]);
+      });
+
+      act(() => {
+        result.current.updateMessageContent(agentMessage.id, 0, 0, {
+          type: "text",
+          text: "Updated input",
+        });
+      });
+
+      expect(result.current.messages[0].content_blocks![0].contents).toEqual([
+        { type: "text", text: "Updated input" },
+      ]);
+    });
+
+    it("should ignore unknown messages and blocks", () => {
+      const { result } = renderHook(() => useMessagesStore());
+
+      act(() => {
+        result.current.setMessages([agentMessage]);
+      });
+
+      act(() => {
+        result.current.updateMessageContent("non-existent", 0, 0, {
+          type: "text",
+          text: "ignored",
+        });
+        result.current.updateMessageContent(agentMessage.id, 3, 0, {
+          type: "text",
+          text: "ignored",
+        });
+      });
+
+      expect(result.current.messages[0]).toEqual(agentMessage);
+    });
+  });
+
   describe("clearMessages", () => {
     it("should clear all messages", () => {
       const { result } = renderHook(() => useMessagesStore());
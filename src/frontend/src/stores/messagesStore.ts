@@ -67,6 +67,27 @@ export const useMessagesStore = create<MessagesStoreType>((set, get) => ({
       return { messages: updatedMessages };
     });
   },
+  updateMessageContent: (id, blockIndex, contentIndex, content) => {
+    set((state) => {
+      const updatedMessages = [...state.messages];
+      for (let i = state.messages.length - 1; i >= 0; i--) {
+        if (state.messages[i].id === id) {
+          const contentBlocks = [...(updatedMessages[i].content_blocks ?? [])];
+          const block = contentBlocks[blockIndex];
+          if (!block) break;
+          const contents = [...block.contents];
+          contents[contentIndex] = content;
+          contentBlocks[blockIndex] = { ...block, contents };
+          updatedMessages[i] = {
+            ...updatedMessages[i],
+            content_blocks: contentBlocks,
+          };
+          break;
+        }
+      }
+      return { messages: updatedMessages };
+    });
+  },
   clearMessages: () => {
     set(() => ({ messages: [] }));
   },
@@ -1,3 +1,4 @@
+import type { ContentType } from "../../chat";
 import type { Message } from "../../messages";
 
 export type MessagesStoreType = {
@@ -8,6 +9,12 @@ export type MessagesStoreType = {
   updateMessage: (message: Message) => void;
   updateMessagePartial: (message: Partial<Message>) => void;
   updateMessageText: (id: string, chunk: string) => void;
+  updateMessageContent: (
+    id: string,
+    blockIndex: number,
+    contentIndex: number,
+    content: ContentType,
+  ) => void;
   clearMessages: () => void;
   removeMessages: (ids: string[]) => void;
   deleteSession: (id: string) => void;
@@ -611,7 +611,19 @@ async function onEvent(
     }
     case "add_message": {
       // Add a message to the messages store.
-      useMessagesStore.getState().addMessage(data);
+      const messageExists = useMessagesStore
+        .getState()
+        .messages.some((message) => message.id === data.id);
+      if (messageExists) {
+        // Replace the message after the tokens already streamed for it.
+        setTimeout(() => {
+          flushSync(() => {
+            useMessagesStore.getState().addMessage(data);
+          });
+        }, 10);
+      } else {
+        useMessagesStore.getState().addMessage(data);
+      }
       return true;
     }
     case "token": {
@@ -623,6 +635,22 @@ async function onEvent(
       }, 10);
       return true;
     }
+    case "content_block_delta": {
+      // Add or replace one content of a streamed message.
+      setTimeout(() => {
+        flushSync(() => {
+          useMessagesStore
+            .getState()
+            .updateMessageContent(
+              data.id,
+              data.block_index,
+              data.content_index,
+              data.content,
+            );
+        });
+      }, 10);
+      return true;
+    }
     case "remove_message": {
       useMessagesStore.getState().removeMessage(data);
       return true;
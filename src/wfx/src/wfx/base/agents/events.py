@@ -1,16 +1,21 @@
 # Add helper functions for each event type
 from collections.abc import AsyncIterator
 from time import perf_counter
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
 from langchain_core.agents import AgentFinish
 from langchain_core.messages import AIMessageChunk, BaseMessage
 from typing_extensions import TypedDict
 
+from wfx.events.token_buffer import TokenBuffer
 from wfx.schema.content_block import ContentBlock
 from wfx.schema.content_types import TextContent, ToolContent
 from wfx.schema.log import SendMessageFunctionType
 from wfx.schema.message import Message
+from wfx.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from wfx.events.event_manager import EventManager
 
 
 class ExceptionWithMessageError(Exception):
@@ -288,6 +293,108 @@ async def handle_on_chain_stream(
     return agent_message, start_time
 
 
+class MessageDeltaSender:
+    """Sends the updates of a streamed agent message as deltas once it has been sent in full.
+
+    Wraps a `send_message` method: the message goes through it whole when it is first sent or stored,
+    and whenever a change cannot be expressed as a delta (text replaced, properties or blocks changed).
+    Streaming updates (`skip_db_update=True`) otherwise only emit the text appended since the last
+    update, as batched `token` events, and the contents added or changed since then, as
+    `content_block_delta` events, so the events of a run grow linearly with the length of the answer.
+    """
+
+    def __init__(self, send_message_method: SendMessageFunctionType, event_manager: "EventManager") -> None:
+        self.send_message_method = send_message_method
+        self.event_manager = event_manager
+        self._message_id: str | None = None
+        self._text = ""
+        self._properties: dict[str, Any] = {}
+        self._blocks: list[tuple[ContentBlock, list[tuple[Any, dict[str, Any]]]]] = []
+        self._buffer = self._create_token_buffer()
+
+    @staticmethod
+    def _create_token_buffer() -> TokenBuffer:
+        settings_service = get_settings_service()
+        if settings_service is None:
+            return TokenBuffer()
+        settings = settings_service.settings
+        return TokenBuffer(settings.stream_token_flush_interval, settings.stream_token_flush_size)
+
+    async def __call__(self, message: Message, id_: str | None = None, *, skip_db_update: bool = False) -> Message:
+        if skip_db_update and self._message_id is not None and getattr(message, "id", None) == self._message_id:
+            deltas = self._get_deltas(message)
+            if deltas is not None:
+                self._send_deltas(message, *deltas)
+                return message
+
+        # The whole message replaces the text still waiting to be sent
+        self._buffer = self._create_token_buffer()
+        if id_ is None:
+            message = await self.send_message_method(message=message, skip_db_update=skip_db_update)
+        else:
+            message = await self.send_message_method(message=message, id_=id_, skip_db_update=skip_db_update)
+        self._remember(message)
+        return message
+
+    def _remember(self, message: Message) -> None:
+        """Records the state of the message as sent."""
+        self._message_id = getattr(message, "id", None)
+        self._text = message.text if isinstance(message.text, str) else ""
+        self._properties = dict(message.properties.__dict__)
+        self._blocks = [
+            (block, [(content, dict(content.__dict__)) for content in block.contents])
+            for block in message.content_blocks or []
+        ]
+
+    def _get_deltas(self, message: Message) -> tuple[str, list[tuple[int, int, Any]]] | None:
+        """Returns the appended text and the new or changed contents, or None if the change is not a delta."""
+        text = message.text
+        if not isinstance(text, str) or not text.startswith(self._text):
+            return None
+        if dict(message.properties.__dict__) != self._properties:
+            return None
+        blocks = message.content_blocks or []
+        if len(blocks) != len(self._blocks):
+            return None
+
+        changed_contents = []
+        for block_index, (block, (sent_block, sent_contents)) in enumerate(zip(blocks, self._blocks, strict=True)):
+            if block is not sent_block or len(block.contents) < len(sent_contents):
+                return None
+            for content_index, content in enumerate(block.contents):
+                if content_index < len(sent_contents):
+                    sent_content, sent_fields = sent_contents[content_index]
+                    # Fields are compared by identity first, so unchanged contents are cheap to check
+                    if content is sent_content and content.__dict__ == sent_fields:
+                        continue
+                    if content is not sent_content:
+                        return None
+                    sent_contents[content_index] = (content, dict(content.__dict__))
+                else:
+                    sent_contents.append((content, dict(content.__dict__)))
+                changed_contents.append((block_index, content_index, content))
+        return text[len(self._text) :], changed_contents
+
+    def _send_deltas(self, message: Message, text: str, changed_contents: list[tuple[int, int, Any]]) -> None:
+        message_id = str(message.id)
+        self._text = message.text
+        batch = self._buffer.add(text)
+        if changed_contents and batch is None:
+            # Keep the text and the contents in the order they were produced
+            batch = self._buffer.flush()
+        if batch is not None:
+            self.event_manager.on_token(data={"chunk": batch, "id": message_id})
+        for block_index, content_index, content in changed_contents:
+            self.event_manager.on_content_block_delta(
+                data={
+                    "id": message_id,
+                    "block_index": block_index,
+                    "content_index": content_index,
+                    "content": content.model_dump(),
+                }
+            )
+
+
 class ToolEventHandler(Protocol):
     async def __call__(
         self,
@@ -330,8 +437,15 @@ async def process_agent_events(
     agent_executor: AsyncIterator[dict[str, Any]],
     agent_message: Message,
     send_message_method: SendMessageFunctionType,
+    event_manager: "EventManager | None" = None,
 ) -> Message:
-    """Process agent events and return the final output."""
+    """Process agent events and return the final output.
+
+    With an `event_manager`, the message is only sent in full at the start and the end of the run and
+    streamed in between as deltas (see `MessageDeltaSender`).
+    """
+    if event_manager is not None:
+        send_message_method = cast("SendMessageFunctionType", MessageDeltaSender(send_message_method, event_manager))
     if isinstance(agent_message.properties, dict):
         agent_message.properties.update({"icon": "Bot", "state": "partial"})
     else:
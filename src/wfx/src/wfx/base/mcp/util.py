@@ -1,11 +1,13 @@
 import asyncio
 import contextlib
+import hashlib
 import inspect
 import json
 import os
 import platform
 import re
 import shutil
+import threading
 import unicodedata
 from collections.abc import Awaitable, Callable
 from typing import Any
@@ -14,9 +16,10 @@ from uuid import UUID
 
 import httpx
 from anyio import ClosedResourceError
+from cachetools import LRUCache, TTLCache
 from httpx import codes as httpx_codes
 from langchain_core.tools import StructuredTool
-from mcp import ClientSession
+from mcp import ClientSession, types
 from mcp.shared.exceptions import McpError
 from pydantic import BaseModel
 
@@ -42,6 +45,15 @@ MAX_SESSIONS_PER_SERVER = (
 )  # Maximum number of sessions per server to prevent resource exhaustion
 SESSION_IDLE_TIMEOUT = settings.mcp_session_idle_timeout  # 5 minutes idle timeout for sessions
 SESSION_CLEANUP_INTERVAL = settings.mcp_session_cleanup_interval  # Cleanup interval in seconds
+TOOL_CACHE_TTL = settings.mcp_tool_cache_ttl  # How long listed tools are reused, in seconds
+
+# Tools listed by MCP servers, by hash of the server config
+_tool_catalogs: TTLCache[str, list[types.Tool]] = TTLCache(maxsize=256, ttl=max(TOOL_CACHE_TTL, 1))
+_tool_catalogs_lock = threading.Lock()
+# Argument models built from tool input schemas, by hash of the JSON schema
+_input_schemas: LRUCache[str, type[BaseModel]] = LRUCache(maxsize=1024)
+_input_schemas_lock = threading.Lock()
+
 # RFC 7230 compliant header name pattern: token = 1*tchar
 # tchar = "!" / "#" / "$" / "%" / "&" / "'" / "*" / "+" / "-" / "." /
 #         "^" / "_" / "`" / "|" / "~" / DIGIT / ALPHA
@@ -327,16 +339,20 @@ async def get_flow_snake_case(flow_name: str, user_id: str, session, *, is_actio
     uuid_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
 
     stmt = select(Flow).where(Flow.user_id == uuid_user_id).where(Flow.is_component == False)  # noqa: E712
-    flows = (await session.exec(stmt)).all()
-
-    for flow in flows:
-        if is_action and flow.action_name:
-            this_flow_name = sanitize_mcp_name(flow.action_name)
-        else:
-            this_flow_name = sanitize_mcp_name(flow.name)
+    name_column = Flow.mcp_action_name if is_action else Flow.mcp_tool_name
+    # Flows are looked up by their indexed tool name. The ones whose name was not stored yet are then
+    # checked one by one.
+    for candidates_stmt in (stmt.where(name_column == flow_name), stmt.where(name_column == None)):  # noqa: E711
+        flows = (await session.exec(candidates_stmt)).all()
+
+        for flow in flows:
+            if is_action and flow.action_name:
+                this_flow_name = sanitize_mcp_name(flow.action_name)
+            else:
+                this_flow_name = sanitize_mcp_name(flow.name)
 
-        if this_flow_name == flow_name:
-            return flow
+            if this_flow_name == flow_name:
+                return flow
     return None
 
 
@@ -396,6 +412,76 @@ async def _validate_connection_params(mode: str, command: str | None = None, url
         raise ValueError(msg)
 
 
+def _server_key(connection_params, transport_type: str) -> str:
+    """Generate a consistent server key based on connection parameters."""
+    if transport_type == "stdio":
+        if hasattr(connection_params, "command"):
+            # Include command, args, and environment for uniqueness
+            command_str = f"{connection_params.command} {' '.join(connection_params.args or [])}"
+            env_str = str(sorted((connection_params.env or {}).items()))
+            key_input = f"{command_str}|{env_str}"
+            return f"stdio_{hash(key_input)}"
+    elif transport_type == "streamable_http" and (isinstance(connection_params, dict) and "url" in connection_params):
+        # Include URL and headers for uniqueness
+        url = connection_params["url"]
+        headers = str(sorted((connection_params.get("headers", {})).items()))
+        key_input = f"{url}|{headers}"
+        return f"streamable_http_{hash(key_input)}"
+
+    # Fallback to a generic key
+    return f"{transport_type}_{hash(str(connection_params))}"
+
+
+def get_cached_tools(connection_params, transport_type: str) -> list[types.Tool] | None:
+    """Return the tools a server listed in the last `mcp_tool_cache_ttl` seconds, if any."""
+    if TOOL_CACHE_TTL <= 0:
+        return None
+    with _tool_catalogs_lock:
+        return _tool_catalogs.get(_server_key(connection_params, transport_type))
+
+
+def cache_tools(connection_params, transport_type: str, tools: list[types.Tool]) -> None:
+    """Remember the tools listed by a server, for `get_cached_tools`."""
+    if TOOL_CACHE_TTL <= 0:
+        return
+    with _tool_catalogs_lock:
+        _tool_catalogs[_server_key(connection_params, transport_type)] = list(tools)
+
+
+def invalidate_tool_catalog(server_key: str | None = None) -> None:
+    """Forget the tools listed by one server, or by all of them when no key is given."""
+    with _tool_catalogs_lock:
+        if server_key is None:
+            _tool_catalogs.clear()
+        else:
+            _tool_catalogs.pop(server_key, None)
+
+
+def _tools_changed_handler(server_key: str):
+    """Build a session message handler dropping the cached tools of the server when they change."""
+
+    async def message_handler(message) -> None:
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ToolListChangedNotification
+        ):
+            await logger.adebug(f"Tools of MCP server {server_key} changed, dropping the cached tools")
+            invalidate_tool_catalog(server_key)
+
+    return message_handler
+
+
+def get_input_schema(json_schema: dict[str, Any]) -> type[BaseModel]:
+    """Build the arguments model of a tool input schema, reusing the model built for an identical schema."""
+    key = hashlib.sha256(json.dumps(json_schema, sort_keys=True, default=str).encode()).hexdigest()
+    with _input_schemas_lock:
+        args_schema = _input_schemas.get(key)
+    if args_schema is None:
+        args_schema = create_input_schema_from_json_schema(json_schema)
+        with _input_schemas_lock:
+            _input_schemas[key] = args_schema
+    return args_schema
+
+
 class MCPSessionManager:
     """Manages persistent MCP sessions with proper context manager lifecycle.
 
@@ -468,24 +554,7 @@ class MCPSessionManager:
 
     def _get_server_key(self, connection_params, transport_type: str) -> str:
         """Generate a consistent server key based on connection parameters."""
-        if transport_type == "stdio":
-            if hasattr(connection_params, "command"):
-                # Include command, args, and environment for uniqueness
-                command_str = f"{connection_params.command} {' '.join(connection_params.args or [])}"
-                env_str = str(sorted((connection_params.env or {}).items()))
-                key_input = f"{command_str}|{env_str}"
-                return f"stdio_{hash(key_input)}"
-        elif transport_type == "streamable_http" and (
-            isinstance(connection_params, dict) and "url" in connection_params
-        ):
-            # Include URL and headers for uniqueness
-            url = connection_params["url"]
-            headers = str(sorted((connection_params.get("headers", {})).items()))
-            key_input = f"{url}|{headers}"
-            return f"streamable_http_{hash(key_input)}"
-
-        # Fallback to a generic key
-        return f"{transport_type}_{hash(str(connection_params))}"
+        return _server_key(connection_params, transport_type)
 
     async def _validate_session_connectivity(self, session) -> bool:
         """Validate that the session is actually usable by testing a simple operation."""
@@ -622,12 +691,13 @@ class MCPSessionManager:
 
         # Create a future to get the session
         session_future: asyncio.Future[ClientSession] = asyncio.Future()
+        message_handler = _tools_changed_handler(self._get_server_key(connection_params, "stdio"))
 
         async def session_task():
             """Background task that keeps the session alive."""
             try:
                 async with stdio_client(connection_params) as (read, write):
-                    session = ClientSession(read, write)
+                    session = ClientSession(read, write, message_handler=message_handler)
                     async with session:
                         await session.initialize()
                         # Signal that session is ready
@@ -690,6 +760,7 @@ class MCPSessionManager:
         session_future: asyncio.Future[ClientSession] = asyncio.Future()
         # Track which transport succeeded
         used_transport: list[str] = []
+        message_handler = _tools_changed_handler(self._get_server_key(connection_params, "streamable_http"))
 
         async def session_task():
             """Background task that keeps the session alive."""
@@ -706,7 +777,7 @@ class MCPSessionManager:
                         headers=connection_params["headers"],
                         timeout=connection_params["timeout_seconds"],
                     ) as (read, write, _):
-                        session = ClientSession(read, write)
+                        session = ClientSession(read, write, message_handler=message_handler)
                         async with session:
                             # Initialize with a timeout to fail fast
                             await asyncio.wait_for(session.initialize(), timeout=2.0)
@@ -746,7 +817,7 @@ class MCPSessionManager:
                         connection_params["timeout_seconds"],
                         sse_read_timeout,
                     ) as (read, write):
-                        session = ClientSession(read, write)
+                        session = ClientSession(read, write, message_handler=message_handler)
                         async with session:
                             await session.initialize()
                             used_transport.append("sse")
@@ -951,8 +1022,8 @@ class MCPStdioClient:
         self._session_context: str | None = None
         self._component_cache = component_cache
 
-    async def _connect_to_server(self, command_str: str, env: dict[str, str] | None = None) -> list[StructuredTool]:
-        """Connect to MCP server using stdio transport (SDK style)."""
+    def _set_connection_params(self, command_str: str, env: dict[str, str] | None = None) -> None:
+        """Build the stdio server parameters, used to open sessions."""
         from mcp import StdioServerParameters
 
         command = command_str.split(" ")
@@ -985,14 +1056,31 @@ class MCPStdioClient:
             param_hash = uuid.uuid4().hex[:8]
             self._session_context = f"default_{param_hash}"
 
+    async def _connect_to_server(self, command_str: str, env: dict[str, str] | None = None) -> list[StructuredTool]:
+        """Connect to MCP server using stdio transport (SDK style)."""
+        self._set_connection_params(command_str, env)
+
         # Get or create a persistent session
         session = await self._get_or_create_session()
         response = await session.list_tools()
         self._connected = True
+        cache_tools(self._connection_params, "stdio", response.tools)
         return response.tools
 
-    async def connect_to_server(self, command_str: str, env: dict[str, str] | None = None) -> list[StructuredTool]:
-        """Connect to MCP server using stdio transport (SDK style)."""
+    async def connect_to_server(
+        self, command_str: str, env: dict[str, str] | None = None, *, use_cache: bool = False
+    ) -> list[StructuredTool]:
+        """Connect to MCP server using stdio transport (SDK style).
+
+        With `use_cache`, the tools the same server listed in the last `mcp_tool_cache_ttl` seconds are
+        returned without starting it; the first tool call starts the session instead.
+        """
+        if use_cache:
+            self._set_connection_params(command_str, env)
+            tools = get_cached_tools(self._connection_params, "stdio")
+            if tools is not None:
+                self._connected = True
+                return tools
         return await asyncio.wait_for(
             self._connect_to_server(command_str, env), timeout=get_settings_service().settings.mcp_server_timeout
         )
@@ -1190,14 +1278,14 @@ class MCPStreamableHttpClient:
             return False, f"URL validation error: {e!s}"
         return True, ""
 
-    async def _connect_to_server(
+    async def _set_connection_params(
         self,
         url: str | None,
         headers: dict[str, str] | None = None,
         timeout_seconds: int = 30,
         sse_read_timeout_seconds: int = 30,
-    ) -> list[StructuredTool]:
-        """Connect to MCP server using Streamable HTTP transport with SSE fallback (SDK style)."""
+    ) -> None:
+        """Validate the URL and headers, and store them to open sessions."""
         # Validate and sanitize headers early
         validated_headers = _process_headers(headers)
 
@@ -1231,16 +1319,42 @@ class MCPStreamableHttpClient:
             param_hash = uuid.uuid4().hex[:8]
             self._session_context = f"default_http_{param_hash}"
 
+    async def _connect_to_server(
+        self,
+        url: str | None,
+        headers: dict[str, str] | None = None,
+        timeout_seconds: int = 30,
+        sse_read_timeout_seconds: int = 30,
+    ) -> list[StructuredTool]:
+        """Connect to MCP server using Streamable HTTP transport with SSE fallback (SDK style)."""
+        await self._set_connection_params(url, headers, timeout_seconds, sse_read_timeout_seconds)
+
         # Get or create a persistent session (will try Streamable HTTP, then SSE fallback)
         session = await self._get_or_create_session()
         response = await session.list_tools()
         self._connected = True
+        cache_tools(self._connection_params, "streamable_http", response.tools)
         return response.tools
 
     async def connect_to_server(
-        self, url: str, headers: dict[str, str] | None = None, sse_read_timeout_seconds: int = 30
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        sse_read_timeout_seconds: int = 30,
+        *,
+        use_cache: bool = False,
     ) -> list[StructuredTool]:
-        """Connect to MCP server using Streamable HTTP with SSE fallback transport (SDK style)."""
+        """Connect to MCP server using Streamable HTTP with SSE fallback transport (SDK style).
+
+        With `use_cache`, the tools the same server listed in the last `mcp_tool_cache_ttl` seconds are
+        returned without connecting; the first tool call opens the session instead.
+        """
+        if use_cache:
+            await self._set_connection_params(url, headers, sse_read_timeout_seconds=sse_read_timeout_seconds)
+            tools = get_cached_tools(self._connection_params, "streamable_http")
+            if tools is not None:
+                self._connected = True
+                return tools
         return await asyncio.wait_for(
             self._connect_to_server(url, headers, sse_read_timeout_seconds=sse_read_timeout_seconds),
             timeout=get_settings_service().settings.mcp_server_timeout,
@@ -1426,6 +1540,66 @@ class MCPStreamableHttpClient:
 MCPSseClient = MCPStreamableHttpClient
 
 
+class MCPStructuredTool(StructuredTool):
+    """StructuredTool of an MCP server tool, accepting camelCase arguments for snake_case fields."""
+
+    def run(self, tool_input: str | dict, config=None, **kwargs):
+        """Override the main run method to handle parameter conversion before validation."""
+        # Parse tool_input if it's a string
+        if isinstance(tool_input, str):
+            try:
+                parsed_input = json.loads(tool_input)
+            except json.JSONDecodeError:
+                parsed_input = {"input": tool_input}
+        else:
+            parsed_input = tool_input or {}
+
+        # Convert camelCase parameters to snake_case
+        converted_input = self._convert_parameters(parsed_input)
+
+        # Call the parent run method with converted parameters
+        return super().run(converted_input, config=config, **kwargs)
+
+    async def arun(self, tool_input: str | dict, config=None, **kwargs):
+        """Override the main arun method to handle parameter conversion before validation."""
+        # Parse tool_input if it's a string
+        if isinstance(tool_input, str):
+            try:
+                parsed_input = json.loads(tool_input)
+            except json.JSONDecodeError:
+                parsed_input = {"input": tool_input}
+        else:
+            parsed_input = tool_input or {}
+
+        # Convert camelCase parameters to snake_case
+        converted_input = self._convert_parameters(parsed_input)
+
+        # Call the parent arun method with converted parameters
+        return await super().arun(converted_input, config=config, **kwargs)
+
+    def _convert_parameters(self, input_dict):
+        if not input_dict or not isinstance(input_dict, dict):
+            return input_dict
+
+        converted_dict = {}
+        original_fields = set(self.args_schema.model_fields.keys())
+
+        for key, value in input_dict.items():
+            if key in original_fields:
+                # Field exists as-is
+                converted_dict[key] = value
+            else:
+                # Try to convert camelCase to snake_case
+                snake_key = _camel_to_snake(key)
+                if snake_key in original_fields:
+                    converted_dict[snake_key] = value
+                else:
+                    # Keep original key
+                    converted_dict[key] = value
+
+        return converted_dict
+
+
 async def update_tools(
     server_name: str,
     server_config: dict,
@@ -1433,7 +1607,11 @@ async def update_tools(
     mcp_streamable_http_client: MCPStreamableHttpClient | None = None,
     mcp_sse_client: MCPStreamableHttpClient | None = None,  # Backward compatibility
 ) -> tuple[str, list[StructuredTool], dict[str, StructuredTool]]:
-    """Fetch server config and update available tools."""
+    """Fetch server config and update available tools.
+
+    The tools listed by the same server in the last `mcp_tool_cache_ttl` seconds are reused, and tools
+    sharing an input schema share its arguments model.
+    """
     if server_config is None:
         server_config = {}
     if not server_name:
@@ -1469,11 +1647,11 @@ async def update_tools(
         args = server_config.get("args", [])
         env = server_config.get("env", {})
         full_command = " ".join([command, *args])
-        tools = await mcp_stdio_client.connect_to_server(full_command, env)
+        tools = await mcp_stdio_client.connect_to_server(full_command, env, use_cache=True)
         client = mcp_stdio_client
     elif mode in ["Streamable_HTTP", "SSE"]:
         # Streamable HTTP connection with SSE fallback
-        tools = await mcp_streamable_http_client.connect_to_server(url, headers=headers)
+        tools = await mcp_streamable_http_client.connect_to_server(url, headers=headers, use_cache=True)
         client = mcp_streamable_http_client
     else:
         logger.error(f"Invalid MCP server mode for '{server_name}': {mode}")
@@ -1489,69 +1667,11 @@ async def update_tools(
         if not tool or not hasattr(tool, "name"):
             continue
         try:
-            args_schema = create_input_schema_from_json_schema(tool.inputSchema)
+            args_schema = get_input_schema(tool.inputSchema)
             if not args_schema:
                 logger.warning(f"Could not create schema for tool '{tool.name}' from server '{server_name}'")
                 continue
 
-            # Create a custom StructuredTool that bypasses schema validation
-            class MCPStructuredTool(StructuredTool):
-                def run(self, tool_input: str | dict, config=None, **kwargs):
-                    """Override the main run method to handle parameter conversion before validation."""
-                    # Parse tool_input if it's a string
-                    if isinstance(tool_input, str):
-                        try:
-                            parsed_input = json.loads(tool_input)
-                        except json.JSONDecodeError:
-                            parsed_input = {"input": tool_input}
-                    else:
-                        parsed_input = tool_input or {}
-
-                    # Convert camelCase parameters to snake_case
-                    converted_input = self._convert_parameters(parsed_input)
-
-                    # Call the parent run method with converted parameters
-                    return super().run(converted_input, config=config, **kwargs)
-
-                async def arun(self, tool_input: str | dict, config=None, **kwargs):
-                    """Override the main arun method to handle parameter conversion before validation."""
-                    # Parse tool_input if it's a string
-                    if isinstance(tool_input, str):
-                        try:
-                            parsed_input = json.loads(tool_input)
-                        except json.JSONDecodeError:
-                            parsed_input = {"input": tool_input}
-                    else:
-                        parsed_input = tool_input or {}
-
-                    # Convert camelCase parameters to snake_case
-                    converted_input = self._convert_parameters(parsed_input)
-
-                    # Call the parent arun method with converted parameters
-                    return await super().arun(converted_input, config=config, **kwargs)
-
-                def _convert_parameters(self, input_dict):
-                    if not input_dict or not isinstance(input_dict, dict):
-                        return input_dict
-
-                    converted_dict = {}
-                    original_fields = set(self.args_schema.model_fields.keys())
-
-                    for key, value in input_dict.items():
-                        if key in original_fields:
-                            # Field exists as-is
-                            converted_dict[key] = value
-                        else:
-                            # Try to convert camelCase to snake_case
-                            snake_key = _camel_to_snake(key)
-                            if snake_key in original_fields:
-                                converted_dict[snake_key] = value
-                            else:
-                                # Keep original key
-                                converted_dict[key] = value
-
-                    return converted_dict
-
             tool_obj = MCPStructuredTool(
                 name=tool.name,
                 description=tool.description or "",
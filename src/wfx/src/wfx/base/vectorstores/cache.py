@@ -0,0 +1,85 @@
+"""Vector store handles shared by every run of the process."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from cachetools import LRUCache
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from langchain_core.documents import Document
+
+VECTOR_STORE_CACHE_SIZE = 32
+
+
+def document_content_hash(document: Document) -> str:
+    """Returns the SHA-256 digest of the content and metadata of a document.
+
+    Identical documents always get the same digest, so it is used as their id in the vector stores
+    to only embed the documents that are not stored yet.
+    """
+    content = json.dumps(
+        {"page_content": document.page_content, "metadata": document.metadata}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedVectorStore:
+    """An opened vector store, with the ids of its documents keyed by their content hash.
+
+    `version` identifies the files the store was loaded from, so that a store changed by another
+    process is loaded again. `lock` must be held while the store is read or written.
+    """
+
+    vector_store: Any
+    document_ids: dict[str, list[str]] = field(default_factory=dict)
+    version: Hashable | None = None
+    lock: threading.RLock = field(default_factory=threading.RLock)
+
+
+class VectorStoreCache:
+    """Process-wide LRU cache of opened vector stores, keyed by their location and name."""
+
+    def __init__(self, maxsize: int = VECTOR_STORE_CACHE_SIZE) -> None:
+        self._cache: LRUCache[Hashable, CachedVectorStore] = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, *, version: Hashable | None = None) -> CachedVectorStore | None:
+        """Returns the store cached under `key`, unless it was loaded from another `version`."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry.version != version:
+                del self._cache[key]
+                return None
+            return entry
+
+    def set(
+        self,
+        key: Hashable,
+        vector_store: Any,
+        *,
+        document_ids: dict[str, list[str]] | None = None,
+        version: Hashable | None = None,
+    ) -> CachedVectorStore:
+        entry = CachedVectorStore(vector_store, document_ids=document_ids or {}, version=version)
+        with self._lock:
+            self._cache[key] = entry
+        return entry
+
+    def pop(self, key: Hashable) -> CachedVectorStore | None:
+        with self._lock:
+            return self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+vector_store_cache = VectorStoreCache()
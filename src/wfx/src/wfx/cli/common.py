@@ -14,7 +14,6 @@ import sys
 import tempfile
 import uuid
 import zipfile
-from io import StringIO
 from pathlib import Path
 from shutil import which
 from typing import TYPE_CHECKING
@@ -29,6 +28,7 @@ from wfx.cli.script_loader import (
     load_graph_from_script,
 )
 from wfx.load import load_flow_from_json
+from wfx.log.capture import capture_output
 from wfx.schema.schema import InputValueRequest
 
 if TYPE_CHECKING:
@@ -293,12 +293,16 @@ def prepare_graph(graph, verbose_print):
         raise typer.Exit(1) from e
 
 
-async def execute_graph_with_capture(graph, input_value: str | None):
+async def execute_graph_with_capture(graph, input_value: str | None, *, concurrent: bool = False):
     """Execute a graph and capture output.
 
+    Only output printed or logged by this execution is captured, so concurrent calls in the same
+    process each get their own logs.
+
     Args:
         graph: Graph object to execute
         input_value: Input value to pass to the graph
+        concurrent: Build independent vertices concurrently instead of one at a time
 
     Returns:
         Tuple of (results, captured_logs)
@@ -309,32 +313,20 @@ async def execute_graph_with_capture(graph, input_value: str | None):
     # Create input request
     inputs = InputValueRequest(input_value=input_value) if input_value else None
 
-    # Capture output during execution
-    captured_stdout = StringIO()
-    captured_stderr = StringIO()
-
-    # Redirect stdout and stderr during graph execution
-    original_stdout = sys.stdout
-    original_stderr = sys.stderr
-
-    try:
-        sys.stdout = captured_stdout
-        sys.stderr = captured_stderr
-        results = [result async for result in graph.async_start(inputs)]
-    except Exception as exc:
-        # Capture any error output that was written to stderr
-        error_output = captured_stderr.getvalue()
-        if error_output:
-            # Add error output to the exception for better debugging
-            exc.args = (f"{exc.args[0] if exc.args else str(exc)}\n\nCaptured stderr:\n{error_output}",)
-        raise
-    finally:
-        # Restore original stdout/stderr
-        sys.stdout = original_stdout
-        sys.stderr = original_stderr
+    # Capture output of this execution only, so concurrent executions keep their logs apart
+    with capture_output() as captured:
+        try:
+            results = [result async for result in graph.async_start(inputs, concurrent=concurrent)]
+        except Exception as exc:
+            # Capture any error output that was written to stderr
+            error_output = captured.stderr.getvalue()
+            if error_output:
+                # Add error output to the exception for better debugging
+                exc.args = (f"{exc.args[0] if exc.args else str(exc)}\n\nCaptured stderr:\n{error_output}",)
+            raise
 
     # Get captured logs
-    captured_logs = captured_stdout.getvalue() + captured_stderr.getvalue()
+    captured_logs = captured.getvalue()
 
     return results, captured_logs
 
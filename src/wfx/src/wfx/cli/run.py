@@ -98,6 +98,11 @@ async def run(
         show_default=True,
         help="Include detailed timing information in output",
     ),
+    concurrent: bool = typer.Option(
+        default=False,
+        show_default=True,
+        help="Build independent components concurrently instead of one at a time",
+    ),
 ) -> None:
     """Execute a Primeagent graph script or JSON flow and return the result.
 
@@ -117,6 +122,7 @@ async def run(
         stdin: Read JSON flow content from stdin
         check_variables: Check global variables for environment compatibility
         timing: Include detailed timing information in output
+        concurrent: Build independent components concurrently instead of one at a time
     """
     # Start timing if requested
     import time
@@ -353,7 +359,7 @@ async def run(
         logger.info("Starting graph execution...", level="DEBUG")
         result_count = 0
 
-        async for result in graph.async_start(inputs):
+        async for result in graph.async_start(inputs, concurrent=concurrent):
             result_count += 1
             if verbosity > 0:
                 logger.debug(f"Processing result #{result_count}")
@@ -19,7 +19,6 @@ from __future__ import annotations
 
 import asyncio
 import time
-from copy import deepcopy
 from typing import TYPE_CHECKING, Annotated, Any
 
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Security
@@ -328,7 +327,7 @@ async def run_flow_generator_for_serve(
         # For the serve app, we'll use execute_graph_with_capture with streaming
         # Note: This is a simplified version. In a full implementation, you might want
         # to integrate with the full WFX streaming pipeline from endpoints.py
-        results, logs = await execute_graph_with_capture(graph, input_request.input_value)
+        results, logs = await execute_graph_with_capture(graph, input_request.input_value, concurrent=True)
         result_data = extract_result_data(results, logs)
 
         # Send the final result
@@ -419,8 +418,8 @@ def create_multi_serve_app(
             request: RunRequest,
         ) -> RunResponse:
             try:
-                graph_copy = deepcopy(graph)
-                results, logs = await execute_graph_with_capture(graph_copy, request.input_value)
+                graph_copy = graph.fork()
+                results, logs = await execute_graph_with_capture(graph_copy, request.input_value, concurrent=True)
                 result_data = extract_result_data(results, logs)
 
                 # Debug logging
@@ -494,7 +493,7 @@ def create_multi_serve_app(
 
                 main_task = asyncio.create_task(
                     run_flow_generator_for_serve(
-                        graph=graph,
+                        graph=graph.fork(),
                         input_request=request,
                         flow_id=flow_id,
                         event_manager=event_manager,
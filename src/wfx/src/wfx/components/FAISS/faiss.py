@@ -2,6 +2,7 @@ from pathlib import Path
 
 from langchain_community.vectorstores import FAISS
 
+from wfx.base.vectorstores.cache import CachedVectorStore, document_content_hash, vector_store_cache
 from wfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
 from wfx.helpers.data import docs_to_data
 from wfx.io import BoolInput, HandleInput, IntInput, StrInput
@@ -63,49 +64,116 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             return Path(self.resolve_path(self.persist_directory))
         return Path()
 
+    def _get_index_version(self, path: Path) -> tuple[int, int] | None:
+        """Returns the modification times of the index files, or None if the index was not saved yet."""
+        try:
+            return (
+                (path / f"{self.index_name}.faiss").stat().st_mtime_ns,
+                (path / f"{self.index_name}.pkl").stat().st_mtime_ns,
+            )
+        except FileNotFoundError:
+            return None
+
+    def _open_index(self, path: Path) -> CachedVectorStore | None:
+        """Returns the saved index, loaded once per process and again only when its files change."""
+        key = ("faiss", str(path), self.index_name)
+        version = self._get_index_version(path)
+        if version is None:
+            vector_store_cache.pop(key)
+            return None
+
+        cached = vector_store_cache.get(key, version=version)
+        if cached is None:
+            faiss = FAISS.load_local(
+                folder_path=str(path),
+                embeddings=self.embedding,
+                index_name=self.index_name,
+                allow_dangerous_deserialization=self.allow_dangerous_deserialization,
+            )
+            document_ids: dict[str, list[str]] = {}
+            for document_id in faiss.index_to_docstore_id.values():
+                content_hash = document_content_hash(faiss.docstore.search(document_id))
+                document_ids.setdefault(content_hash, []).append(document_id)
+            cached = vector_store_cache.set(key, faiss, document_ids=document_ids, version=version)
+        return cached
+
     @check_cached_vector_store
     def build_vector_store(self) -> FAISS:
-        """Builds the FAISS object."""
+        """Builds the FAISS object.
+
+        Only the documents whose content is not in the saved index yet are embedded and added to it, and
+        the documents missing from the ingest data are deleted from it. Without ingest data, the saved
+        index is left as is.
+        """
         path = self.get_persist_directory()
         path.mkdir(parents=True, exist_ok=True)
 
         # Convert DataFrame to Data if needed using parent's method
         self.ingest_data = self._prepare_ingest_data()
 
-        documents = []
+        documents = {}
         for _input in self.ingest_data or []:
-            if isinstance(_input, Data):
-                documents.append(_input.to_lc_document())
-            else:
-                documents.append(_input)
+            document = _input.to_lc_document() if isinstance(_input, Data) else _input
+            documents.setdefault(document_content_hash(document), document)
 
-        faiss = FAISS.from_documents(documents=documents, embedding=self.embedding)
-        faiss.save_local(str(path), self.index_name)
-        return faiss
+        cached = self._open_index(path)
+        if cached is None:
+            faiss = FAISS.from_documents(
+                documents=list(documents.values()), embedding=self.embedding, ids=list(documents)
+            )
+            faiss.save_local(str(path), self.index_name)
+            vector_store_cache.set(
+                ("faiss", str(path), self.index_name),
+                faiss,
+                document_ids={content_hash: [content_hash] for content_hash in documents},
+                version=self._get_index_version(path),
+            )
+            return faiss
+
+        if not documents:
+            return cached.vector_store
+
+        with cached.lock:
+            new_documents = {
+                content_hash: document
+                for content_hash, document in documents.items()
+                if content_hash not in cached.document_ids
+            }
+            stale_hashes = [content_hash for content_hash in cached.document_ids if content_hash not in documents]
+            if stale_hashes:
+                self.log(f"Deleting {len(stale_hashes)} documents from the FAISS index.")
+                cached.vector_store.delete(
+                    [document_id for content_hash in stale_hashes for document_id in cached.document_ids[content_hash]]
+                )
+                for content_hash in stale_hashes:
+                    del cached.document_ids[content_hash]
+            if new_documents:
+                self.log(f"Adding {len(new_documents)} documents to the FAISS index.")
+                cached.vector_store.embedding_function = self.embedding
+                cached.vector_store.add_documents(list(new_documents.values()), ids=list(new_documents))
+                cached.document_ids.update({content_hash: [content_hash] for content_hash in new_documents})
+            if stale_hashes or new_documents:
+                cached.vector_store.save_local(str(path), self.index_name)
+                cached.version = self._get_index_version(path)
+        return cached.vector_store
 
     def search_documents(self) -> list[Data]:
         """Search for documents in the FAISS vector store."""
         path = self.get_persist_directory()
-        index_path = path / f"{self.index_name}.faiss"
+        if self._open_index(path) is None:
+            self.build_vector_store()
+        cached = self._open_index(path)
 
-        if not index_path.exists():
-            vector_store = self.build_vector_store()
-        else:
-            vector_store = FAISS.load_local(
-                folder_path=str(path),
-                embeddings=self.embedding,
-                index_name=self.index_name,
-                allow_dangerous_deserialization=self.allow_dangerous_deserialization,
-            )
-
-        if not vector_store:
+        if cached is None:
             msg = "Failed to load the FAISS index."
             raise ValueError(msg)
 
         if self.search_query and isinstance(self.search_query, str) and self.search_query.strip():
-            docs = vector_store.similarity_search(
-                query=self.search_query,
-                k=self.number_of_results,
-            )
+            query_embedding = self.embedding.embed_query(self.search_query)
+            with cached.lock:
+                docs = cached.vector_store.similarity_search_by_vector(
+                    embedding=query_embedding,
+                    k=self.number_of_results,
+                )
             return docs_to_data(docs)
         return []
@@ -1,16 +1,19 @@
-from copy import deepcopy
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from chromadb.config import Settings
 from langchain_chroma import Chroma
 from typing_extensions import override
 
+from wfx.base.vectorstores.cache import document_content_hash, vector_store_cache
 from wfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
 from wfx.base.vectorstores.utils import chroma_collection_to_data
 from wfx.inputs.inputs import BoolInput, DropdownInput, HandleInput, IntInput, StrInput
 from wfx.schema.data import Data
 
 if TYPE_CHECKING:
+    from chromadb.api import ClientAPI
+
     from wfx.schema.dataframe import DataFrame
 
 
@@ -112,6 +115,9 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
 
         # Check persist_directory and expand it if it is a relative path
         persist_directory = self.resolve_path(self.persist_directory) if self.persist_directory is not None else None
+        if client is None and persist_directory is not None:
+            client = self._get_persistent_client(persist_directory)
+            persist_directory = None
 
         chroma = Chroma(
             persist_directory=persist_directory,
@@ -125,6 +131,60 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
         self.status = chroma_collection_to_data(chroma.get(limit=limit))
         return chroma
 
+    @staticmethod
+    def _get_persistent_client(persist_directory: str) -> "ClientAPI":
+        """Returns the client of the persist directory, opened once per process.
+
+        The client is opened again if the database file was replaced, e.g. after the directory was deleted.
+        """
+        from chromadb import PersistentClient
+
+        def get_database_version() -> int | None:
+            database = Path(persist_directory) / "chroma.sqlite3"
+            return database.stat().st_ino if database.exists() else None
+
+        key = ("chroma", persist_directory)
+        cached = vector_store_cache.get(key, version=get_database_version())
+        if cached is None:
+            client = PersistentClient(path=persist_directory)
+            cached = vector_store_cache.set(key, client, version=get_database_version())
+        return cached.vector_store
+
+    def _get_new_data(self, vector_store: "Chroma", ingest_data: list) -> dict[str, Data]:
+        """Returns the inputs that are not in the Vector Store yet, keyed by the content hash of their document.
+
+        The content hashes are the ids of the stored documents, so only the ids of the inputs are looked up.
+        Inputs missing from these ids are still compared with the stored documents containing their text,
+        to find documents that were stored without them.
+        """
+        new_data: dict[str, Data] = {}
+        for _input in ingest_data:
+            if not isinstance(_input, Data):
+                msg = "Vector Store Inputs must be Data objects."
+                raise TypeError(msg)
+            new_data.setdefault(document_content_hash(_input.to_lc_document()), _input)
+
+        if new_data:
+            stored_ids = set(vector_store.get(ids=list(new_data), include=[])["ids"])
+            new_data = {content_hash: data for content_hash, data in new_data.items() if content_hash not in stored_ids}
+        if not new_data:
+            return new_data
+
+        # Chroma cannot look up empty texts by content
+        texts = list({data.to_lc_document().page_content for data in new_data.values()} - {""})
+        if not texts:
+            return new_data
+        contains = [{"$contains": text} for text in texts]
+        where_document = contains[0] if len(contains) == 1 else {"$or": contains}
+        limit = int(self.limit) if self.limit is not None and str(self.limit).strip() else None
+        stored_documents_without_id = []
+        for value in chroma_collection_to_data(vector_store.get(where_document=where_document, limit=limit)):
+            del value.id
+            stored_documents_without_id.append(value)
+        return {
+            content_hash: data for content_hash, data in new_data.items() if data not in stored_documents_without_id
+        }
+
     def _add_documents_to_vector_store(self, vector_store: "Chroma") -> None:
         """Adds documents to the Vector Store."""
         ingest_data: list | Data | DataFrame = self.ingest_data
@@ -135,24 +195,19 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
         # Convert DataFrame to Data if needed using parent's method
         ingest_data = self._prepare_ingest_data()
 
-        stored_documents_without_id = []
         if self.allow_duplicates:
-            stored_data = []
-        else:
-            limit = int(self.limit) if self.limit is not None and str(self.limit).strip() else None
-            stored_data = chroma_collection_to_data(vector_store.get(limit=limit))
-            for value in deepcopy(stored_data):
-                del value.id
-                stored_documents_without_id.append(value)
-
-        documents = []
-        for _input in ingest_data or []:
-            if isinstance(_input, Data):
-                if _input not in stored_documents_without_id:
+            ids = None
+            documents = []
+            for _input in ingest_data or []:
+                if isinstance(_input, Data):
                     documents.append(_input.to_lc_document())
-            else:
-                msg = "Vector Store Inputs must be Data objects."
-                raise TypeError(msg)
+                else:
+                    msg = "Vector Store Inputs must be Data objects."
+                    raise TypeError(msg)
+        else:
+            new_data = self._get_new_data(vector_store, ingest_data or [])
+            ids = list(new_data)
+            documents = [data.to_lc_document() for data in new_data.values()]
 
         if documents and self.embedding is not None:
             self.log(f"Adding {len(documents)} documents to the Vector Store.")
@@ -161,9 +216,9 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
                 from langchain_community.vectorstores.utils import filter_complex_metadata
 
                 filtered_documents = filter_complex_metadata(documents)
-                vector_store.add_documents(filtered_documents)
+                vector_store.add_documents(filtered_documents, ids=ids)
             except ImportError:
                 self.log("Warning: Could not import filter_complex_metadata. Adding documents without filtering.")
-                vector_store.add_documents(documents)
+                vector_store.add_documents(documents, ids=ids)
         else:
             self.log("No documents to add to the Vector Store.")
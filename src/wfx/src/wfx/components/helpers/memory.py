@@ -175,6 +175,7 @@ class MemoryComponent(Component):
                     context_id=message.context_id,
                     sender_name=message.sender_name,
                     sender=message.sender,
+                    limit=1,
                 )
                 or []
             )
@@ -230,11 +231,11 @@ class MemoryComponent(Component):
                 sender_name=sender_name,
                 session_id=session_id,
                 context_id=context_id,
-                limit=10000,
-                order=order,
+                limit=n_messages or 10000,
+                order="DESC",
             )
-            if n_messages:
-                stored = stored[-n_messages:]  # Get last N messages
+            if order == "ASC":
+                stored = stored[::-1]
 
         # self.status = stored
         return cast("Data", stored)
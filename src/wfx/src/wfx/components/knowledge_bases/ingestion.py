@@ -40,6 +40,8 @@ from wfx.services.deps import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from wfx.schema.dataframe import DataFrame
 
 HUGGINGFACE_MODEL_NAMES = [
@@ -47,6 +49,10 @@ HUGGINGFACE_MODEL_NAMES = [
     "sentence-transformers/all-mpnet-base-v2",
 ]
 COHERE_MODEL_NAMES = ["embed-english-v3.0", "embed-multilingual-v3.0"]
+# Rows converted, checked for duplicates and embedded together
+INGESTION_BATCH_SIZE = 1000
+# Batches being embedded and added to the vector store at the same time
+INGESTION_CONCURRENCY = 2
 
 settings = get_settings_service().settings
 knowledge_directory = settings.knowledge_bases_dir
@@ -378,9 +384,6 @@ class KnowledgeIngestionComponent(Component):
             # Create embeddings model
             embedding_function = self._build_embeddings(embedding_model, api_key)
 
-            # Convert DataFrame to Data objects (following Local DB pattern)
-            data_objects = await self._convert_df_to_data_objects(df_source, config_list)
-
             # Create vector store
             chroma = Chroma(
                 persist_directory=str(vector_store_dir),
@@ -388,41 +391,64 @@ class KnowledgeIngestionComponent(Component):
                 collection_name=self.knowledge_base,
             )
 
-            # Convert Data objects to LangChain Documents
-            documents = []
-            for data_obj in data_objects:
-                doc = data_obj.to_lc_document()
-                documents.append(doc)
-
-            # Add documents to vector store
-            if documents:
-                chroma.add_documents(documents)
-                self.log(f"Added {len(documents)} documents to vector store '{self.knowledge_base}'")
+            # Convert the DataFrame to Data objects (following Local DB pattern) and add them batch by batch
+            added = await self._add_data_batches(chroma, self._iter_data_batches(df_source, config_list, chroma))
+            if added:
+                self.log(f"Added {added} documents to vector store '{self.knowledge_base}'")
 
         except (OSError, ValueError, RuntimeError) as e:
             self.log(f"Error creating vector store: {e}")
 
+    async def _add_data_batches(self, chroma: Chroma, batches: Iterator[list[Data]]) -> int:
+        """Add batches of Data objects to the vector store, returning the number of added documents.
+
+        Batches are converted in a worker thread while up to `INGESTION_CONCURRENCY` previous batches
+        are embedded and added, so only these batches are held in memory at once.
+        """
+        added = 0
+        pending: set[asyncio.Future[None]] = set()
+        try:
+            while data_objects := await asyncio.to_thread(next, batches, None):
+                if len(pending) >= INGESTION_CONCURRENCY:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        task.result()
+                documents = [data_obj.to_lc_document() for data_obj in data_objects]
+                pending.add(asyncio.ensure_future(asyncio.to_thread(chroma.add_documents, documents)))
+                added += len(documents)
+            await asyncio.gather(*pending)
+        finally:
+            # Worker threads can't be cancelled, wait for them before leaving
+            if pending:
+                await asyncio.wait(pending)
+        return added
+
     async def _convert_df_to_data_objects(
         self, df_source: pd.DataFrame, config_list: list[dict[str, Any]]
     ) -> list[Data]:
         """Convert DataFrame to Data objects for vector store."""
-        data_objects: list[Data] = []
-
         # Set up vector store directory
         kb_path = await self._kb_path()
 
-        # If we don't allow duplicates, we need to get the existing hashes
+        # If we don't allow duplicates, we need to look up the existing hashes
         chroma = Chroma(
             persist_directory=str(kb_path),
             collection_name=self.knowledge_base,
         )
+        return [data_obj for batch in self._iter_data_batches(df_source, config_list, chroma) for data_obj in batch]
 
-        # Get all documents and their metadata
-        all_docs = chroma.get()
-
-        # Extract all _id values from metadata
-        id_list = [metadata.get("_id") for metadata in all_docs["metadatas"] if metadata.get("_id")]
+    def _iter_data_batches(
+        self,
+        df_source: pd.DataFrame,
+        config_list: list[dict[str, Any]],
+        chroma: Chroma,
+        batch_size: int = INGESTION_BATCH_SIZE,
+    ) -> Iterator[list[Data]]:
+        """Convert the DataFrame to Data objects, `batch_size` rows at a time.
 
+        If duplicates are disallowed, rows whose hash is already in the collection or in a previous row
+        are skipped. Only the hashes of each batch are looked up, the collection is never loaded.
+        """
         # Get column roles
         content_cols = []
         identifier_cols = []
@@ -437,46 +463,72 @@ class KnowledgeIngestionComponent(Component):
             elif identifier:
                 identifier_cols.append(col_name)
 
-        # Convert each row to a Data object
-        for _, row in df_source.iterrows():
-            # Build content text from identifier columns using list comprehension
-            identifier_parts = [str(row[col]) for col in content_cols if col in row and pd.notna(row[col])]
-
-            # Join all parts into a single string
-            page_content = " ".join(identifier_parts)
-
-            # Build metadata from NON-vectorized columns only (simple key-value pairs)
-            data_dict = {
-                "text": page_content,  # Main content for vectorization
-            }
-
-            # Add identifier columns if they exist
-            if identifier_cols:
-                identifier_parts = [str(row[col]) for col in identifier_cols if col in row and pd.notna(row[col])]
-                page_content = " ".join(identifier_parts)
-
-            # Add metadata columns as simple key-value pairs
-            for col in df_source.columns:
-                if col not in content_cols and col in row and pd.notna(row[col]):
-                    # Convert to simple types for Chroma metadata
-                    value = row[col]
-                    data_dict[col] = str(value)  # Convert complex types to string
+        seen_hashes: set[str] = set()
+        for start in range(0, len(df_source), batch_size):
+            data_objects = self._convert_rows(df_source.iloc[start : start + batch_size], content_cols, identifier_cols)
+            if not self.allow_duplicates:
+                batch_hashes = {data_obj.data["_id"] for data_obj in data_objects} - seen_hashes
+                seen_hashes |= self._get_stored_hashes(chroma, list(batch_hashes))
+                unique_objects = []
+                for data_obj in data_objects:
+                    if data_obj.data["_id"] not in seen_hashes:
+                        seen_hashes.add(data_obj.data["_id"])
+                        unique_objects.append(data_obj)
+                if skipped := len(data_objects) - len(unique_objects):
+                    self.log(f"Skipping {skipped} duplicate rows")
+                data_objects = unique_objects
+            if data_objects:
+                yield data_objects
+
+    @staticmethod
+    def _join_columns(df_source: pd.DataFrame, columns: list[str]) -> pd.Series:
+        """Join the non-null values of `columns` with spaces, for all the rows at once."""
+        joined = pd.Series("", index=df_source.index, dtype=object)
+        started = pd.Series(data=False, index=df_source.index)
+        for col in columns:
+            if col not in df_source.columns:
+                continue
+            present = df_source[col].notna()
+            values = df_source[col].map(str)
+            joined = (joined.where(~started, joined + " ") + values).where(present, joined)
+            started |= present
+        return joined
+
+    def _convert_rows(self, df_source: pd.DataFrame, content_cols: list[str], identifier_cols: list[str]) -> list[Data]:
+        """Convert rows to Data objects, building their text, metadata and hash column by column."""
+        # Build content text from the vectorized columns
+        page_contents = self._join_columns(df_source, content_cols).tolist()
+
+        # The hash identifies the row by its identifier columns if there are any, else by its content
+        hash_sources = self._join_columns(df_source, identifier_cols).tolist() if identifier_cols else page_contents
+        page_content_hashes = [hashlib.sha256(source.encode()).hexdigest() for source in hash_sources]
+
+        # Build metadata from NON-vectorized columns only, as simple key-value pairs
+        metadata_columns = [
+            (col, df_source[col].map(str).tolist(), df_source[col].notna().tolist())
+            for col in df_source.columns
+            if col not in content_cols
+        ]
 
-            # Hash the page_content for unique ID
-            page_content_hash = hashlib.sha256(page_content.encode()).hexdigest()
+        data_objects: list[Data] = []
+        for index, (page_content, page_content_hash) in enumerate(zip(page_contents, page_content_hashes, strict=True)):
+            data_dict = {"text": page_content}  # Main content for vectorization
+            for col, values, present in metadata_columns:
+                if present[index]:
+                    data_dict[col] = values[index]
             data_dict["_id"] = page_content_hash
 
-            # If duplicates are disallowed, and hash exists, prevent adding this row
-            if not self.allow_duplicates and page_content_hash in id_list:
-                self.log(f"Skipping duplicate row with hash {page_content_hash}")
-                continue
-
             # Create Data object - everything except "text" becomes metadata
-            data_obj = Data(data=data_dict)
-            data_objects.append(data_obj)
-
+            data_objects.append(Data(data=data_dict))
         return data_objects
 
+    def _get_stored_hashes(self, chroma: Chroma, page_content_hashes: list[str]) -> set[str]:
+        """Return which of the hashes are already in the collection, looking up only these hashes."""
+        if not page_content_hashes:
+            return set()
+        stored = chroma.get(where={"_id": {"$in": page_content_hashes}}, include=["metadatas"])
+        return {metadata["_id"] for metadata in stored["metadatas"] if metadata and metadata.get("_id")}
+
     def is_valid_collection_name(self, name, min_length: int = 3, max_length: int = 63) -> bool:
         """Validates collection name against conditions 1-3.
 
@@ -22,6 +22,7 @@ from wfx.base.tools.constants import (
     TOOLS_METADATA_INPUT_NAME,
 )
 from wfx.custom.tree_visitor import RequiredInputsVisitor
+from wfx.events.token_buffer import TokenBuffer
 from wfx.exceptions.component import StreamingError
 from wfx.field_typing import Tool  # noqa: TC001
 
@@ -36,6 +37,7 @@ from wfx.schema.data import Data
 from wfx.schema.log import Log
 from wfx.schema.message import ErrorMessage, Message
 from wfx.schema.properties import Source
+from wfx.services.deps import get_settings_service
 from wfx.template.field.base import UNDEFINED, Input, Output
 from wfx.template.frontend_node.custom_components import ComponentFrontendNode
 from wfx.utils.async_helpers import run_until_complete
@@ -364,16 +366,17 @@ class Component(CustomComponent):
         kwargs = deepcopy(self.__config, memo)
         kwargs["inputs"] = deepcopy(self.__inputs, memo)
         new_component = type(self)(**kwargs)
-        new_component._code = self._code
-        new_component._outputs_map = self._outputs_map
-        new_component._inputs = self._inputs
-        new_component._edges = self._edges
-        new_component._components = self._components
-        new_component._parameters = self._parameters
-        new_component._attributes = self._attributes
-        new_component._output_logs = self._output_logs
-        new_component._logs = self._logs  # type: ignore[attr-defined]
         memo[id(self)] = new_component
+        new_component._code = self._code
+        # Inputs, outputs and attributes hold per-run values, so copies must not share them
+        new_component._outputs_map = deepcopy(self._outputs_map, memo)
+        new_component._inputs = deepcopy(self._inputs, memo)
+        new_component._edges = deepcopy(self._edges, memo)
+        new_component._components = deepcopy(self._components, memo)
+        new_component._parameters = deepcopy(self._parameters, memo)
+        new_component._attributes = deepcopy(self._attributes, memo)
+        new_component._output_logs = deepcopy(self._output_logs, memo)
+        new_component._logs = deepcopy(self._logs, memo)  # type: ignore[attr-defined]
         return new_component
 
     def set_class_code(self) -> None:
@@ -810,7 +813,8 @@ class Component(CustomComponent):
         except KeyError:
             input_ = self._get_fallback_input(name=key, display_name=key)
             self._inputs[key] = input_
-            self.inputs.append(input_)
+            # The inputs list may be shared with the class, which is cached by its code
+            self.inputs = [*self.inputs, input_]
             return input_
 
     def _connect_to_component(self, key, value, input_) -> None:
@@ -1497,14 +1501,15 @@ class Component(CustomComponent):
 
     def _append_tool_output(self) -> None:
         if next((output for output in self.outputs if output.name == TOOL_OUTPUT_NAME), None) is None:
-            self.outputs.append(
+            self.outputs = [
+                *self.outputs,
                 Output(
                     name=TOOL_OUTPUT_NAME,
                     display_name=TOOL_OUTPUT_DISPLAY_NAME,
                     method="to_toolkit",
                     types=["Tool"],
-                )
-            )
+                ),
+            ]
 
     def is_connected_to_chat_output(self) -> bool:
         # Lazy import to avoid circular dependency
@@ -1672,46 +1677,58 @@ class Component(CustomComponent):
         if isinstance(iterator, AsyncIterator):
             return await self._handle_async_iterator(iterator, message.id, message)
         try:
-            complete_message = ""
+            buffer = self._create_token_buffer()
             first_chunk = True
             for chunk in iterator:
-                complete_message = await self._process_chunk(
-                    chunk.content, complete_message, message.id, message, first_chunk=first_chunk
-                )
+                await self._process_chunk(chunk.content, buffer, message.id, message, first_chunk=first_chunk)
                 first_chunk = False
+            await self._send_token_event(buffer.flush(), message.id)
         except Exception as e:
             raise StreamingError(cause=e, source=message.properties.source) from e
         else:
-            return complete_message
+            return buffer.text
 
     async def _handle_async_iterator(self, iterator: AsyncIterator, message_id: str, message: Message) -> str:
-        complete_message = ""
+        buffer = self._create_token_buffer()
         first_chunk = True
         async for chunk in iterator:
-            complete_message = await self._process_chunk(
-                chunk.content, complete_message, message_id, message, first_chunk=first_chunk
-            )
+            await self._process_chunk(chunk.content, buffer, message_id, message, first_chunk=first_chunk)
             first_chunk = False
-        return complete_message
+        await self._send_token_event(buffer.flush(), message_id)
+        return buffer.text
+
+    @staticmethod
+    def _create_token_buffer() -> TokenBuffer:
+        settings_service = get_settings_service()
+        if settings_service is None:
+            return TokenBuffer()
+        settings = settings_service.settings
+        return TokenBuffer(settings.stream_token_flush_interval, settings.stream_token_flush_size)
 
     async def _process_chunk(
-        self, chunk: str, complete_message: str, message_id: str, message: Message, *, first_chunk: bool = False
-    ) -> str:
-        complete_message += chunk
+        self, chunk: str, buffer: TokenBuffer, message_id: str, message: Message, *, first_chunk: bool = False
+    ) -> None:
+        batch = buffer.add(chunk)
         if self._event_manager:
             if first_chunk:
-                # Send the initial message only on the first chunk
+                # Send the initial message and the first token right away
                 msg_copy = message.model_copy()
-                msg_copy.text = complete_message
+                msg_copy.text = buffer.text
                 await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
-                data={
-                    "chunk": chunk,
-                    "id": str(message_id),
-                },
-            )
-        return complete_message
+                batch = batch or buffer.flush()
+            await self._send_token_event(batch, message_id)
+
+    async def _send_token_event(self, chunk: str | None, message_id: str) -> None:
+        """Sends a batch of streamed tokens, which may be a single token."""
+        if chunk is None or not self._event_manager:
+            return
+        await asyncio.to_thread(
+            self._event_manager.on_token,
+            data={
+                "chunk": chunk,
+                "id": str(message_id),
+            },
+        )
 
     async def send_error(
         self,
@@ -468,6 +468,18 @@ class CustomComponent(BaseComponent):
                     logger.debug(f"Found context override for variable '{name}': {request_variables[name]}")
                     return request_variables[name]
 
+        # Then the values fetched in bulk for the graph's user before the build
+        prefetched = getattr(self.graph, "prefetched_variables", None) if hasattr(self, "graph") else None
+        if (
+            isinstance(prefetched, dict)
+            and (name, field) in prefetched
+            and str(self.user_id) == str(self.graph.user_id)
+        ):
+            value = prefetched[name, field]
+            if isinstance(value, Exception):
+                raise value
+            return value
+
         variable_service = get_variable_service()  # Get service instance
         # Retrieve and decrypt the variable by name for the current user
         if isinstance(self.user_id, str):
@@ -1,12 +1,93 @@
+import hashlib
+import threading
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from cachetools import LRUCache
+
 from wfx.custom import validate
 
 if TYPE_CHECKING:
     from wfx.custom.custom_component.custom_component import CustomComponent
 
+COMPONENT_CLASS_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class ComponentClassCacheInfo:
+    """Snapshot of the component class cache counters."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class ComponentClassCache:
+    """Process-wide LRU cache of component classes built from source code.
+
+    Classes are keyed by the SHA-256 digest of their source, so identical code is only parsed,
+    imported, compiled and executed once per process. Failed evaluations are not cached.
+    """
+
+    def __init__(self, maxsize: int = COMPONENT_CLASS_CACHE_SIZE) -> None:
+        self._cache: LRUCache[str, type[CustomComponent]] = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key(code: str) -> str:
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+    def get(self, code: str) -> "type[CustomComponent] | None":
+        key = self.key(code)
+        with self._lock:
+            class_object = self._cache.get(key)
+            if class_object is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return class_object
+
+    def set(self, code: str, class_object: "type[CustomComponent]") -> None:
+        key = self.key(code)
+        with self._lock:
+            self._cache[key] = class_object
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> ComponentClassCacheInfo:
+        with self._lock:
+            return ComponentClassCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._cache),
+                maxsize=int(self._cache.maxsize),
+            )
+
+
+component_class_cache = ComponentClassCache()
+
+
+def eval_custom_component_code(code: str, *, use_cache: bool = True) -> type["CustomComponent"]:
+    """Evaluate custom component code.
+
+    Built classes are memoized in `component_class_cache`, so evaluating the same source again
+    returns the same class object without re-executing the code. Pass `use_cache=False` to force
+    a fresh evaluation.
+    """
+    if use_cache:
+        class_object = component_class_cache.get(code)
+        if class_object is not None:
+            return class_object
 
-def eval_custom_component_code(code: str) -> type["CustomComponent"]:
-    """Evaluate custom component code."""
     class_name = validate.extract_class_name(code)
-    return validate.create_class(code, class_name)
+    class_object = validate.create_class(code, class_name)
+    if use_cache:
+        component_class_cache.set(code, class_object)
+    return class_object
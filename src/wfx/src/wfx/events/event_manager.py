@@ -91,6 +91,7 @@ class EventManager:
 def create_default_event_manager(queue=None):
     manager = EventManager(queue)
     manager.register_event("on_token", "token")
+    manager.register_event("on_content_block_delta", "content_block_delta")
     manager.register_event("on_vertices_sorted", "vertices_sorted")
     manager.register_event("on_error", "error")
     manager.register_event("on_end", "end")
@@ -106,5 +107,6 @@ def create_stream_tokens_event_manager(queue=None):
     manager = EventManager(queue)
     manager.register_event("on_message", "add_message")
     manager.register_event("on_token", "token")
+    manager.register_event("on_content_block_delta", "content_block_delta")
     manager.register_event("on_end", "end")
     return manager
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import time
+
+
+class TokenBuffer:
+    """Accumulates a streamed message and batches its tokens into fewer `token` events.
+
+    Tokens are held until `flush_interval` seconds have passed since the last batch or
+    `flush_size` bytes are pending, so a fast stream produces one event per window instead
+    of one per token. The complete text is kept as a list of chunks and joined once.
+    """
+
+    def __init__(self, flush_interval: float = 0.0, flush_size: int = 0) -> None:
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._chunks: list[str] = []
+        self._pending: list[str] = []
+        self._pending_size = 0
+        self._last_flush = time.monotonic()
+
+    @property
+    def text(self) -> str:
+        """The text streamed so far."""
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def add(self, chunk: str) -> str | None:
+        """Adds a chunk and returns the batch of pending tokens if it is due to be sent."""
+        if not chunk:
+            return None
+        self._chunks.append(chunk)
+        self._pending.append(chunk)
+        if self.flush_size > 0:
+            self._pending_size += len(chunk.encode("utf-8"))
+            if self._pending_size >= self.flush_size:
+                return self.flush()
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            return self.flush()
+        return None
+
+    def flush(self) -> str | None:
+        """Returns the pending tokens as one batch, or None if there are none."""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return None
+        batch = "".join(self._pending)
+        self._pending.clear()
+        self._pending_size = 0
+        return batch
@@ -48,6 +48,7 @@ if TYPE_CHECKING:
     from wfx.custom.custom_component.component import Component
     from wfx.events.event_manager import EventManager
     from wfx.graph.edge.schema import EdgeData
+    from wfx.graph.graph.schema import SchedulerMode
     from wfx.graph.schema import ResultData
     from wfx.schema.schema import InputValueRequest
     from wfx.services.chat.schema import GetCache, SetCache
@@ -88,6 +89,8 @@ class Graph:
         self.flow_name = flow_name
         self.description = description
         self.user_id = user_id
+        # Stateless graphs never write themselves, or the results of their vertices, to the chat cache
+        self.stateless = False
         self._is_input_vertices: list[str] = []
         self._is_output_vertices: list[str] = []
         self._is_state_vertices: list[str] | None = None
@@ -127,6 +130,9 @@ class Graph:
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        # load_from_db variables of all vertices by (variable name, field), fetched once per run
+        self.prefetched_variables: dict[tuple[str, str], str | Exception] | None = None
+        self._prefetch_lock: asyncio.Lock | None = None
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -149,6 +155,13 @@ class Graph:
             self._lock = asyncio.Lock()
         return self._lock
 
+    @property
+    def prefetch_lock(self) -> asyncio.Lock:
+        """Lock that makes concurrently built vertices wait for a single variable prefetch."""
+        if self._prefetch_lock is None:
+            self._prefetch_lock = asyncio.Lock()
+        return self._prefetch_lock
+
     @property
     def context(self) -> dotdict:
         if isinstance(self._context, dotdict):
@@ -357,7 +370,24 @@ class Graph:
         event_manager: EventManager | None = None,
         *,
         reset_output_values: bool = True,
+        concurrent: bool = False,
+        max_concurrency: int | None = None,
     ):
+        """Runs the graph and yields a `VertexBuildResult` for each built vertex, then `Finish`.
+
+        Args:
+            inputs: Optional inputs for the vertices.
+            max_iterations: Optional maximum number of times a single vertex may be yielded.
+            config: Optional configuration applied to every output.
+            event_manager: Optional event manager.
+            reset_output_values: Whether to reset the output values before running.
+            concurrent: If True, every runnable vertex in the run queue is built at once and results
+                are yielded in completion order. Otherwise vertices are built one at a time.
+            max_concurrency: Maximum number of vertices built at the same time in concurrent mode.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            msg = f"Invalid max_concurrency: {max_concurrency}. Expected a positive integer"
+            raise ValueError(msg)
         self.prepare()
         if reset_output_values:
             self._reset_all_output_values()
@@ -370,6 +400,17 @@ class Graph:
         # has been yielded
         yielded_counts: dict[str, int] = defaultdict(int)
 
+        if concurrent:
+            async for result in self._async_start_concurrent(
+                yielded_counts,
+                max_iterations,
+                inputs=inputs,
+                event_manager=event_manager,
+                max_concurrency=max_concurrency,
+            ):
+                yield result
+            return
+
         while should_continue(yielded_counts, max_iterations):
             result = await self.astep(event_manager=event_manager, inputs=inputs)
             yield result
@@ -381,6 +422,59 @@ class Graph:
         msg = "Max iterations reached"
         raise ValueError(msg)
 
+    async def _async_start_concurrent(
+        self,
+        yielded_counts: dict[str, int],
+        max_iterations: int | None,
+        *,
+        inputs: InputValueRequest | None = None,
+        event_manager: EventManager | None = None,
+        max_concurrency: int | None = None,
+    ):
+        """Concurrent counterpart of the `astep` loop used by `async_start`.
+
+        Drains the run queue into build tasks, and as each task completes runs the same bookkeeping
+        as `astep` (next runnable vertices, `stop_vertex`, cycle state, cache and snapshot) before
+        yielding its result. A vertex is never built twice at the same time; if it is queued again
+        while running, it waits in the queue until the running build completes.
+        """
+        running: dict[asyncio.Task, str] = {}
+        try:
+            while True:
+                if not should_continue(yielded_counts, max_iterations):
+                    msg = "Max iterations reached"
+                    raise ValueError(msg)
+                blocked: list[str] = []
+                while self._run_queue and (max_concurrency is None or len(running) < max_concurrency):
+                    vertex_id = self.get_next_in_queue()
+                    if vertex_id in running.values():
+                        blocked.append(vertex_id)
+                        continue
+                    task = asyncio.create_task(
+                        self._build_step_vertex(vertex_id, inputs=inputs, event_manager=event_manager),
+                        name=f"{vertex_id} Step",
+                    )
+                    running[task] = vertex_id
+                self._run_queue.extendleft(reversed(blocked))
+
+                if not running:
+                    self._end_all_traces_async()
+                    yield Finish()
+                    return
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    running.pop(task)
+                    vertex_build_result = task.result()
+                    await self._complete_step(vertex_build_result)
+                    yield vertex_build_result
+                    yielded_counts[vertex_build_result.vertex.id] += 1
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
     def _snapshot(self):
         return {
             "_run_queue": self._run_queue.copy(),
@@ -506,6 +600,8 @@ class Graph:
         self._edges.append(edge)
 
     def initialize(self) -> None:
+        # Variables may have changed since the last run
+        self.prefetched_variables = None
         self._build_graph()
         self.build_graph_maps(self.edges)
         self.define_vertices_lists()
@@ -739,6 +835,8 @@ class Graph:
         session_id: str,
         fallback_to_env_vars: bool,
         event_manager: EventManager | None = None,
+        scheduler: SchedulerMode = "layered",
+        max_concurrency: int | None = None,
     ) -> list[ResultData | None]:
         """Runs the graph with the given inputs.
 
@@ -751,6 +849,8 @@ class Graph:
             session_id (str): The session ID for the graph.
             fallback_to_env_vars (bool): Whether to fallback to environment variables.
             event_manager (EventManager | None): The event manager for the graph.
+            scheduler (SchedulerMode): How vertices are scheduled. See `process`.
+            max_concurrency (int | None): Maximum number of vertices built at once in dataflow mode.
 
         Returns:
             List[Optional["ResultData"]]: The outputs of the graph.
@@ -776,7 +876,7 @@ class Graph:
         # Process the graph
         try:
             cache_service = get_chat_service()
-            if cache_service and self.flow_id:
+            if cache_service and self.flow_id and not self.stateless:
                 await cache_service.set_cache(self.flow_id, self)
         except Exception:  # noqa: BLE001
             logger.exception("Error setting cache")
@@ -788,6 +888,8 @@ class Graph:
                 start_component_id=start_component_id,
                 fallback_to_env_vars=fallback_to_env_vars,
                 event_manager=event_manager,
+                scheduler=scheduler,
+                max_concurrency=max_concurrency,
             )
             self.increment_run_count()
         except Exception as exc:
@@ -823,9 +925,16 @@ class Graph:
         stream: bool = False,
         fallback_to_env_vars: bool = False,
         event_manager: EventManager | None = None,
+        scheduler: SchedulerMode = "layered",
+        max_concurrency: int | None = None,
+        batch_concurrency: int | None = None,
     ) -> list[RunOutputs]:
         """Runs the graph with the given inputs.
 
+        By default the inputs are run one after the other on this graph. With a `batch_concurrency`,
+        each input is run on its own fork of this graph instead, that many at a time, and this graph
+        itself is not run. Either way the outputs are returned in the order of the inputs.
+
         Args:
             inputs (list[Dict[str, str]]): The input values for the graph.
             inputs_components (Optional[list[list[str]]], optional): Components to run for the inputs. Defaults to None.
@@ -835,6 +944,11 @@ class Graph:
             stream (bool, optional): Whether to stream the results or not. Defaults to False.
             fallback_to_env_vars (bool, optional): Whether to fallback to environment variables. Defaults to False.
             event_manager (EventManager | None): The event manager for the graph.
+            scheduler (SchedulerMode, optional): How vertices are scheduled. Defaults to "layered".
+            max_concurrency (Optional[int], optional): Maximum number of vertices built at once in dataflow mode.
+                Defaults to None.
+            batch_concurrency (Optional[int], optional): Maximum number of inputs run at once, each on a fork
+                of the graph. Defaults to None, running the inputs one at a time on this graph.
 
         Returns:
             List[RunOutputs]: The outputs of the graph.
@@ -860,16 +974,41 @@ class Graph:
             self.session_id = session_id
         for _ in range(len(inputs) - len(types)):
             types.append("chat")  # default to chat
-        for run_inputs, components, input_type in zip(inputs, inputs_components, types, strict=True):
+        runs = list(zip(inputs, inputs_components, types, strict=True))
+        run_options = {
+            "outputs": outputs or [],
+            "stream": stream,
+            "session_id": session_id or "",
+            "fallback_to_env_vars": fallback_to_env_vars,
+            "event_manager": event_manager,
+            "scheduler": scheduler,
+            "max_concurrency": max_concurrency,
+        }
+        if batch_concurrency is not None and len(runs) > 1:
+            semaphore = asyncio.Semaphore(max(batch_concurrency, 1))
+
+            async def run_fork(run_inputs: dict[str, str], components: list[str], input_type: InputType | None):
+                async with semaphore:
+                    return await self.fork()._run(
+                        inputs=run_inputs, input_components=components, input_type=input_type, **run_options
+                    )
+
+            tasks = [asyncio.create_task(run_fork(*run)) for run in runs]
+            try:
+                runs_outputs = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+            for (run_inputs, _, _), run_outputs in zip(runs, runs_outputs, strict=True):
+                run_output_object = RunOutputs(inputs=run_inputs, outputs=run_outputs)
+                await logger.adebug(f"Run outputs: {run_output_object}")
+                vertex_outputs.append(run_output_object)
+            return vertex_outputs
+
+        for run_inputs, components, input_type in runs:
             run_outputs = await self._run(
-                inputs=run_inputs,
-                input_components=components,
-                input_type=input_type,
-                outputs=outputs or [],
-                stream=stream,
-                session_id=session_id or "",
-                fallback_to_env_vars=fallback_to_env_vars,
-                event_manager=event_manager,
+                inputs=run_inputs, input_components=components, input_type=input_type, **run_options
             )
             run_output_object = RunOutputs(inputs=run_inputs, outputs=run_outputs)
             await logger.adebug(f"Run outputs: {run_output_object}")
@@ -1108,12 +1247,79 @@ class Graph:
 
         return new_graph
 
+    def fork(self) -> Graph:
+        """Returns an unbuilt copy of this graph that reuses its prepared structure.
+
+        Unlike `Graph.from_payload` or `copy.deepcopy`, forking does not parse node data, rebuild vertex
+        parameters or detect cycles again. Node data, code and topology are shared with this graph, while
+        the run state, vertex results, edges and components are copied, so several forks of the same
+        template can run at the same time.
+
+        Components of graphs built from a payload are instantiated again from their code. Graphs
+        assembled from `Component` objects get deep copies of those components instead, as
+        `copy.deepcopy` does.
+        """
+        graph = type(self).__new__(type(self))
+        graph.__dict__.update(
+            {
+                key: copy.copy(value) if isinstance(value, list | dict | set | deque) else value
+                for key, value in self.__dict__.items()
+            }
+        )
+        graph._context = dotdict(self._context)
+        graph._lock = None
+        graph._state_model = None
+        graph._run_id = ""
+        graph._start_time = datetime.now(timezone.utc)
+        graph._call_order = []
+        graph._snapshots = []
+        graph._end_trace_tasks = set()
+        graph._tracing_service = None
+        graph._tracing_service_initialized = False
+        graph.prefetched_variables = None
+        graph._prefetch_lock = None
+        graph.run_manager = copy.deepcopy(self.run_manager)
+
+        graph.vertices = [vertex.fork(graph) for vertex in self.vertices]
+        graph.vertex_map = {vertex.id: vertex for vertex in graph.vertices}
+        # Parameters that point at vertices of this graph must point at their forks instead
+        memo: dict[int, Any] = {id(vertex): graph.vertex_map[vertex.id] for vertex in self.vertices}
+        for vertex in self.vertices:
+            forked_vertex = graph.vertex_map[vertex.id]
+            forked_vertex.params = copy.deepcopy(vertex.params, memo)
+            if hasattr(vertex, "raw_params"):
+                forked_vertex.raw_params = copy.deepcopy(vertex.raw_params, memo)
+
+        graph.edges = []
+        for edge in self.edges:
+            forked_edge = type(edge).__new__(type(edge))
+            forked_edge.__dict__.update(edge.__dict__)
+            graph.edges.append(forked_edge)
+
+        if self.raw_graph_data["nodes"]:
+            graph._instantiate_components_in_vertices()
+        else:
+            for vertex in self.vertices:
+                if vertex.custom_component is not None:
+                    component = copy.deepcopy(vertex.custom_component, memo)
+                    graph.vertex_map[vertex.id].add_component_instance(component)
+            graph._start = copy.deepcopy(self._start, memo)
+            graph._end = copy.deepcopy(self._end, memo)
+        for vertex in graph.vertices:
+            if vertex.id in graph.cycle_vertices:
+                vertex.apply_on_outputs(lambda output_object: setattr(output_object, "cache", False))
+        graph._set_cache_if_listen_notify_components()
+        return graph
+
     def __setstate__(self, state):
         run_manager = state["run_manager"]
         if isinstance(run_manager, RunnableVerticesManager):
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
+        # Decrypted variables are never pickled
+        state.setdefault("prefetched_variables", None)
+        state.setdefault("_prefetch_lock", None)
         self.__dict__.update(state)
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         # Tracing service will be lazily initialized via property when needed
@@ -1409,6 +1615,22 @@ class Graph:
         if not vertex_id:
             msg = "No vertex to run"
             raise ValueError(msg)
+        vertex_build_result = await self._build_step_vertex(
+            vertex_id, inputs=inputs, files=files, user_id=user_id, event_manager=event_manager
+        )
+        await self._complete_step(vertex_build_result)
+        return vertex_build_result
+
+    async def _build_step_vertex(
+        self,
+        vertex_id: str,
+        *,
+        inputs: InputValueRequest | None = None,
+        files: list[str] | None = None,
+        user_id: str | None = None,
+        event_manager: EventManager | None = None,
+    ) -> VertexBuildResult:
+        """Builds a single vertex taken from the run queue."""
         chat_service = get_chat_service()
 
         # Provide fallback cache functions if chat service is unavailable
@@ -1420,10 +1642,12 @@ class Graph:
             async def get_cache_func(*args, **kwargs):  # noqa: ARG001
                 return None
 
+        if chat_service is None or self.stateless:
+
             async def set_cache_func(*args, **kwargs) -> bool:  # noqa: ARG001
                 return True
 
-        vertex_build_result = await self.build_vertex(
+        return await self.build_vertex(
             vertex_id=vertex_id,
             user_id=user_id,
             inputs_dict=inputs.model_dump() if inputs and hasattr(inputs, "model_dump") else {},
@@ -1433,6 +1657,9 @@ class Graph:
             event_manager=event_manager,
         )
 
+    async def _complete_step(self, vertex_build_result: VertexBuildResult) -> None:
+        """Queues the vertices unlocked by a built vertex and records the step."""
+        vertex_id = vertex_build_result.vertex.id
         next_runnable_vertices = await self.get_next_runnable_vertices(
             self.lock, vertex=vertex_build_result.vertex, cache=False
         )
@@ -1442,10 +1669,10 @@ class Graph:
         self.reset_inactivated_vertices()
         self.reset_activated_vertices()
 
-        if chat_service is not None:
+        chat_service = get_chat_service()
+        if chat_service is not None and not self.stateless:
             await chat_service.set_cache(str(self.flow_id or self._run_id), self)
         self._record_snapshot(vertex_id)
-        return vertex_build_result
 
     def get_snapshot(self):
         return copy.deepcopy(
@@ -1622,8 +1849,26 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        scheduler: SchedulerMode = "layered",
+        max_concurrency: int | None = None,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph, running independent vertices in parallel.
+
+        Args:
+            fallback_to_env_vars: Whether to fallback to environment variables.
+            start_component_id: Optional ID of the vertex to start from.
+            event_manager: Optional event manager.
+            scheduler: ``"layered"`` runs each layer behind a barrier; ``"dataflow"`` starts each vertex
+                as soon as its predecessors are fulfilled.
+            max_concurrency: Maximum number of vertices built at the same time in ``"dataflow"`` mode.
+                Defaults to no limit.
+        """
+        if scheduler not in {"layered", "dataflow"}:
+            msg = f"Invalid scheduler: {scheduler}. Expected 'layered' or 'dataflow'"
+            raise ValueError(msg)
+        if max_concurrency is not None and max_concurrency < 1:
+            msg = f"Invalid max_concurrency: {max_concurrency}. Expected a positive integer"
+            raise ValueError(msg)
         has_webhook_component = "webhook" in start_component_id.lower() if start_component_id else False
         first_layer = self.sort_vertices(start_component_id=start_component_id)
         vertex_task_run_count: dict[str, int] = {}
@@ -1640,11 +1885,27 @@ class Graph:
             async def get_cache_func(*args, **kwargs):  # noqa: ARG001
                 return None
 
+        if chat_service is None or self.stateless:
+
             async def set_cache_func(*args, **kwargs):
                 pass
 
         await self.initialize_run()
         lock = asyncio.Lock()
+        if scheduler == "dataflow":
+            await self._process_dataflow(
+                first_layer,
+                lock=lock,
+                fallback_to_env_vars=fallback_to_env_vars,
+                get_cache=get_cache_func,
+                set_cache=set_cache_func,
+                event_manager=event_manager,
+                has_webhook_component=has_webhook_component,
+                max_concurrency=max_concurrency,
+            )
+            await logger.adebug("Graph processing complete")
+            return self
+
         while to_process:
             current_batch = list(to_process)  # Copy current deque items to a list
             to_process.clear()  # Clear the deque for new items
@@ -1682,6 +1943,86 @@ class Graph:
         await logger.adebug("Graph processing complete")
         return self
 
+    async def _process_dataflow(
+        self,
+        first_layer: list[str],
+        *,
+        lock: asyncio.Lock,
+        fallback_to_env_vars: bool,
+        get_cache: GetCache,
+        set_cache: SetCache,
+        event_manager: EventManager | None = None,
+        has_webhook_component: bool = False,
+        max_concurrency: int | None = None,
+    ) -> None:
+        """Builds vertices as soon as their predecessors are fulfilled, without layer barriers.
+
+        Every completed vertex is handed to the run manager right away, so its successors can start
+        while slower vertices of the same layer are still running. At most ``max_concurrency``
+        vertices are built at the same time; the rest wait in a FIFO ready queue.
+        """
+        ready: deque[str] = deque(first_layer)
+        queued: set[str] = set(first_layer)
+        running: dict[asyncio.Task, str] = {}
+        vertex_task_run_count: dict[str, int] = {}
+        try:
+            while ready or running:
+                while ready and (max_concurrency is None or len(running) < max_concurrency):
+                    vertex_id = ready.popleft()
+                    queued.discard(vertex_id)
+                    run_count = vertex_task_run_count.get(vertex_id, 0)
+                    task = asyncio.create_task(
+                        self.build_vertex(
+                            vertex_id=vertex_id,
+                            user_id=self.user_id,
+                            inputs_dict={},
+                            fallback_to_env_vars=fallback_to_env_vars,
+                            get_cache=get_cache,
+                            set_cache=set_cache,
+                            event_manager=event_manager,
+                        ),
+                        name=f"{vertex_id} Run {run_count}",
+                    )
+                    vertex_task_run_count[vertex_id] = run_count + 1
+                    running[task] = vertex_id
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    vertex_id = running.pop(task)
+                    result = task.exception() or task.result()
+                    if isinstance(result, Exception):
+                        await logger.aerror(f"Task {task.get_name()} failed with exception: {result}")
+                        if has_webhook_component:
+                            await self._log_vertex_build_from_exception(vertex_id, result)
+                        raise result
+                    if not isinstance(result, VertexBuildResult):
+                        msg = f"Invalid result from task {task.get_name()}: {result}"
+                        raise TypeError(msg)
+                    if self.flow_id is not None:
+                        await log_vertex_build(
+                            flow_id=self.flow_id,
+                            vertex_id=result.vertex.id,
+                            valid=result.valid,
+                            params=result.params,
+                            data=result.result_dict,
+                            artifacts=result.artifacts,
+                        )
+                    self.run_manager.remove_vertex_from_runnables(vertex_id)
+                    await logger.adebug(f"Vertex {vertex_id} finished, {len(running)} still running")
+
+                    next_runnable_vertices = await self.get_next_runnable_vertices(
+                        lock, vertex=result.vertex, cache=False
+                    )
+                    for next_vertex_id in next_runnable_vertices:
+                        if next_vertex_id not in queued:
+                            ready.append(next_vertex_id)
+                            queued.add(next_vertex_id)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         """Determines the next set of runnable vertices from a list of successor vertex IDs.
 
@@ -1706,7 +2047,7 @@ class Graph:
         Args:
             lock: An asyncio lock for thread-safe updates.
             vertex: The vertex that has just finished execution.
-            cache: If True, caches the updated graph state.
+            cache: If True, caches the updated graph state, unless the graph is stateless.
 
         Returns:
             A list of vertex IDs that are ready to be executed next.
@@ -1723,7 +2064,7 @@ class Graph:
                     next_runnable_vertices.remove(v_id)
                 else:
                     self.run_manager.add_to_vertices_being_run(next_v_id)
-            if cache and self.flow_id is not None:
+            if cache and self.flow_id is not None and not self.stateless:
                 set_cache_coro = partial(get_chat_service().set_cache, key=self.flow_id)
                 await set_cache_coro(data=self, lock=lock)
         if vertex.is_state:
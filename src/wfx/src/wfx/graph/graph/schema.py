@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, NamedTuple, Protocol
+from typing import TYPE_CHECKING, Literal, NamedTuple, Protocol
 
 from typing_extensions import NotRequired, TypedDict
 
@@ -12,6 +12,14 @@ if TYPE_CHECKING:
     from wfx.schema.log import LoggableType
 
 
+SchedulerMode = Literal["layered", "dataflow"]
+"""How `Graph.process` schedules vertices.
+
+- ``layered``: every vertex of a layer must finish before the next layer starts.
+- ``dataflow``: each vertex starts as soon as its own predecessors are fulfilled.
+"""
+
+
 class ViewPort(TypedDict):
     x: float
     y: float
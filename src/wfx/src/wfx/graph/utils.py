@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Collection, Generator
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
@@ -11,7 +11,7 @@ from wfx.schema.data import Data
 from wfx.schema.message import Message
 
 # Database imports removed - wfx should be lightweight
-from wfx.services.deps import get_db_service, get_settings_service
+from wfx.services.deps import get_db_service, get_execution_log_service, get_settings_service
 
 if TYPE_CHECKING:
     from wfx.graph.vertex.base import Vertex
@@ -92,16 +92,76 @@ def post_process_raw(raw, artifact_type: str):
     return raw
 
 
+_SECRET_PLACEHOLDER = "*****"
+_SECRET_KEY_WORDS = ("api_key", "apikey", "password", "secret", "authorization", "credential")
+
+
+def _is_secret_key(key: Any) -> bool:
+    """Returns whether the name of a dict key looks like it holds a credential."""
+    name = str(key).lower()
+    return any(word in name for word in _SECRET_KEY_WORDS) or name == "token" or name.endswith(("_token", "-token"))
+
+
+def _get_template(target: Vertex) -> dict:
+    return target.data.get("node", {}).get("template", {}) if isinstance(target.data, dict) else {}
+
+
+def _get_secret_fields(target: Vertex) -> set[str]:
+    """Returns the fields of the vertex holding secrets: password fields and values loaded from global variables."""
+    template = _get_template(target)
+    password_fields = {key for key, field in template.items() if isinstance(field, dict) and field.get("password")}
+    return password_fields | set(target.load_from_db_fields)
+
+
+def _get_secret_columns(field: dict) -> set[str]:
+    """Returns the columns of a table field holding secrets."""
+    table_schema = field.get("table_schema") or []
+    columns = table_schema.get("columns", []) if isinstance(table_schema, dict) else table_schema
+    return {column["name"] for column in columns if isinstance(column, dict) and column.get("load_from_db")}
+
+
+def _redact_secrets(value: Any, secret_keys: Collection[str] = ()) -> Any:
+    """Replaces the values of secret keys found anywhere in nested dicts and lists.
+
+    A key is secret if it is in `secret_keys` or if its name looks like it holds a credential. Rows of
+    key-value tables, such as `{"key": "Authorization", "value": "..."}`, are redacted by their key.
+    """
+    if isinstance(value, dict):
+        if set(value) == {"key", "value"} and _is_secret_key(value["key"]):
+            return {"key": value["key"], "value": _SECRET_PLACEHOLDER}
+        return {
+            key: _SECRET_PLACEHOLDER
+            if key in secret_keys or _is_secret_key(key)
+            else _redact_secrets(item, secret_keys)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact_secrets(item, secret_keys) for item in value]
+    return value
+
+
 def _vertex_to_primitive_dict(target: Vertex) -> dict:
-    """Cleans the parameters of the target vertex."""
+    """Cleans the parameters of the target vertex, leaving out its secrets so they are never stored.
+
+    Password fields and values loaded from global variables are left out. Secrets nested in dict and table
+    fields, such as headers or table columns loaded from global variables, are redacted.
+    """
+    secret_fields = _get_secret_fields(target)
+    template = _get_template(target)
     # Removes all keys that the values aren't python types like str, int, bool, etc.
     params = {
-        key: value for key, value in target.params.items() if isinstance(value, str | int | bool | float | list | dict)
+        key: value
+        for key, value in target.params.items()
+        if key not in secret_fields and isinstance(value, str | int | bool | float | list | dict)
     }
     # if it is a list we need to check if the contents are python types
     for key, value in params.items():
         if isinstance(value, list):
             params[key] = [item for item in value if isinstance(item, str | int | bool | float | list | dict)]
+    for key, value in params.items():
+        if isinstance(value, list | dict):
+            field = template.get(key)
+            params[key] = _redact_secrets(value, _get_secret_columns(field) if isinstance(field, dict) else set())
     return params
 
 
@@ -109,16 +169,18 @@ async def log_transaction(
     flow_id: str | UUID,
     source: Vertex,
     status,
-    target: Vertex | None = None,  # noqa: ARG001
-    error=None,  # noqa: ARG001
+    target: Vertex | None = None,
+    error=None,
 ) -> None:
     """Asynchronously logs a transaction record for a vertex in a flow if transaction storage is enabled.
 
-    This is a lightweight implementation that only logs if database service is available.
+    The record is handed to the execution log service when one is registered (as in primeagent) and
+    `execution_log_storage_enabled` is set, and only logged otherwise.
     """
     try:
         settings_service = get_settings_service()
-        if not settings_service or not getattr(settings_service.settings, "transactions_storage_enabled", False):
+        settings = settings_service.settings if settings_service else None
+        if not getattr(settings, "transactions_storage_enabled", False):
             return
 
         db_service = get_db_service()
@@ -132,8 +194,21 @@ async def log_transaction(
             else:
                 return
 
-        # Log basic transaction info - concrete implementation should be in primeagent
-        logger.debug(f"Transaction logged: vertex={source.id}, flow={flow_id}, status={status}")
+        execution_log_service = get_execution_log_service()
+        if execution_log_service is None or not getattr(settings, "execution_log_storage_enabled", False):
+            logger.debug(f"Transaction logged: vertex={source.id}, flow={flow_id}, status={status}")
+            return
+        await execution_log_service.add_transaction(
+            {
+                "vertex_id": source.id,
+                "target_id": target.id if target else None,
+                "inputs": _vertex_to_primitive_dict(source),
+                "outputs": source.result.model_dump() if source.result else None,
+                "status": status,
+                "error": str(error) if error is not None else None,
+                "flow_id": flow_id,
+            }
+        )
     except Exception as exc:  # noqa: BLE001
         logger.debug(f"Error logging transaction: {exc!s}")
 
@@ -143,17 +218,19 @@ async def log_vertex_build(
     flow_id: str | UUID,
     vertex_id: str,
     valid: bool,
-    params: Any,  # noqa: ARG001
-    data: dict | Any,  # noqa: ARG001
-    artifacts: dict | None = None,  # noqa: ARG001
+    params: Any,
+    data: dict | Any,
+    artifacts: dict | None = None,
 ) -> None:
     """Asynchronously logs a vertex build record if vertex build storage is enabled.
 
-    This is a lightweight implementation that only logs if database service is available.
+    The record is handed to the execution log service when one is registered (as in primeagent) and
+    `execution_log_storage_enabled` is set, and only logged otherwise.
     """
     try:
         settings_service = get_settings_service()
-        if not settings_service or not getattr(settings_service.settings, "vertex_builds_storage_enabled", False):
+        settings = settings_service.settings if settings_service else None
+        if not getattr(settings, "vertex_builds_storage_enabled", False):
             return
 
         db_service = get_db_service()
@@ -168,8 +245,20 @@ async def log_vertex_build(
             logger.debug(f"Invalid flow_id passed to log_vertex_build: {flow_id!r}")
             return
 
-        # Log basic vertex build info - concrete implementation should be in primeagent
-        logger.debug(f"Vertex build logged: vertex={vertex_id}, flow={flow_id}, valid={valid}")
+        execution_log_service = get_execution_log_service()
+        if execution_log_service is None or not getattr(settings, "execution_log_storage_enabled", False):
+            logger.debug(f"Vertex build logged: vertex={vertex_id}, flow={flow_id}, valid={valid}")
+            return
+        await execution_log_service.add_vertex_build(
+            {
+                "flow_id": flow_id,
+                "id": vertex_id,
+                "valid": valid,
+                "params": str(params) if params else None,
+                "data": data,
+                "artifacts": artifacts,
+            }
+        )
     except Exception:  # noqa: BLE001
         logger.debug("Error logging vertex build")
 
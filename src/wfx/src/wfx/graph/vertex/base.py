@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import inspect
 import traceback
 import types
@@ -234,6 +235,28 @@ class Vertex:
         self.built_object = state.get("built_object") or UnbuiltObject()
         self.built_result = state.get("built_result") or UnbuiltResult()
 
+    def fork(self, graph: Graph) -> Vertex:
+        """Returns an unbuilt copy of this vertex that belongs to `graph`.
+
+        The node data is shared with this vertex while the containers mutated during a build are copied.
+        Parameters and the component are left to the caller: parameters may point at other vertices of the
+        graph and the component must be instantiated once those are in place.
+        """
+        vertex = type(self).__new__(type(self))
+        vertex.__dict__.update(
+            {
+                key: copy.copy(value) if isinstance(value, list | dict | set) else value
+                for key, value in self.__dict__.items()
+            }
+        )
+        vertex.graph = graph
+        vertex._lock = None
+        vertex.custom_component = None
+        vertex._incoming_edges = None
+        vertex._outgoing_edges = None
+        vertex.steps = [getattr(vertex, step.__name__) for step in self.steps]
+        return vertex
+
     def set_top_level(self, top_level_vertices: list[str]) -> None:
         self.parent_is_top_level = self.parent_node_id in top_level_vertices
 
@@ -643,6 +666,8 @@ class Vertex:
         fallback_to_env_vars=False,
     ) -> None:
         try:
+            if self.load_from_db_fields:
+                await initialize.loading.prefetch_graph_variables(self.graph)
             result = await initialize.loading.get_instance_results(
                 custom_component=custom_component,
                 custom_params=custom_params,
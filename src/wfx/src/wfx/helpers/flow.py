@@ -125,6 +125,7 @@ async def run_flow(
     run_id: str | None = None,
     session_id: str | None = None,
     graph: Graph | None = None,
+    batch_concurrency: int | None = None,
 ) -> list[RunOutputs]:
     """Run a flow with given inputs.
 
@@ -138,9 +139,10 @@ async def run_flow(
         run_id: Optional run ID.
         session_id: Optional session ID.
         graph: Optional pre-loaded graph.
+        batch_concurrency: Maximum number of inputs run at once, each on a fork of the graph.
 
     Returns:
-        List of run outputs.
+        List of run outputs, in the order of the inputs.
     """
     if user_id is None:
         msg = "Session is invalid"
@@ -188,4 +190,5 @@ async def run_flow(
         inputs_components=inputs_components,
         types=types,
         fallback_to_env_vars=fallback_to_env_vars,
+        batch_concurrency=batch_concurrency,
     )
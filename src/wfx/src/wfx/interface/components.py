@@ -31,6 +31,8 @@ class ComponentCache:
         """
         self.all_types_dict: dict[str, Any] | None = None
         self.fully_loaded_components: dict[str, bool] = {}
+        # Bumped whenever all_types_dict is changed in place, so derived data can be rebuilt
+        self.version = 0
 
 
 # Singleton instance
@@ -709,6 +711,7 @@ async def ensure_component_loaded(component_type: str, component_name: str, sett
 
             # Mark as fully loaded
             component_cache.fully_loaded_components[component_key] = True
+            component_cache.version += 1
             await logger.adebug(f"Component {component_type}:{component_name} fully loaded")
         else:
             await logger.awarning(f"Failed to fully load component {component_type}:{component_name}")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import os
+import uuid
 import warnings
 from typing import TYPE_CHECKING, Any
 
@@ -12,12 +13,13 @@ from wfx.custom.eval import eval_custom_component_code
 from wfx.log.logger import logger
 from wfx.schema.artifact import get_artifact_type, post_process_raw
 from wfx.schema.data import Data
-from wfx.services.deps import get_settings_service, session_scope
+from wfx.services.deps import get_settings_service, get_variable_service, session_scope
 from wfx.services.session import NoopSession
 
 if TYPE_CHECKING:
     from wfx.custom.custom_component.component import Component
     from wfx.custom.custom_component.custom_component import CustomComponent
+    from wfx.graph.graph.base import Graph
     from wfx.graph.vertex.base import Vertex
 
     # This is forward declared to avoid circular import
@@ -126,6 +128,69 @@ def load_from_env_vars(params, load_from_db_fields):
     return params
 
 
+def get_load_from_db_variables(vertex: Vertex) -> set[tuple[str, str]]:
+    """Returns the (variable name, field) pairs that building `vertex` loads from the database."""
+    params = vertex.params
+    variables = set()
+    for field in vertex.load_from_db_fields:
+        if field.startswith("table:"):
+            table_field_name = field[6:]
+            columns = params.get(f"{table_field_name}_load_from_db_columns") or []
+            for row in params.get(table_field_name) or []:
+                if isinstance(row, dict):
+                    variables.update(
+                        (row[column], f"{table_field_name}.{column}")
+                        for column in columns
+                        if isinstance(row.get(column), str) and row[column]
+                    )
+        elif isinstance(params.get(field), str) and params[field]:
+            variables.add((params[field], field))
+    return variables
+
+
+async def prefetch_graph_variables(graph: Graph) -> None:
+    """Fetches the load_from_db variables of every vertex of `graph` with a single query.
+
+    Runs once per graph run, before the first vertex that needs variables is built, and stores the
+    results in `graph.prefetched_variables`, where `CustomComponent.get_variable` looks them up.
+    Without a user, a database or a variable service that supports bulk lookups, nothing is
+    prefetched and each field is resolved on its own as before.
+    """
+    if graph.prefetched_variables is not None:
+        return
+    async with graph.prefetch_lock:
+        if graph.prefetched_variables is None:
+            graph.prefetched_variables = await _fetch_graph_variables(graph)
+
+
+async def _fetch_graph_variables(graph: Graph) -> dict[tuple[str, str], str | Exception]:
+    variable_service = get_variable_service()
+    if not graph.user_id or not hasattr(variable_service, "get_variables"):
+        return {}
+
+    request_variables = graph.context.get("request_variables") or {}
+    variables = {
+        (name, field)
+        for vertex in graph.vertices
+        for name, field in get_load_from_db_variables(vertex)
+        if name not in request_variables
+    }
+    if not variables:
+        return {}
+
+    async with session_scope() as session:
+        settings_service = get_settings_service()
+        if isinstance(session, NoopSession) or (settings_service and settings_service.settings.use_noop_database):
+            return {}
+        user_id = uuid.UUID(graph.user_id) if isinstance(graph.user_id, str) else graph.user_id
+        try:
+            return await variable_service.get_variables(user_id=user_id, fields=variables, session=session)
+        except Exception as e:  # noqa: BLE001
+            # Fields are then resolved one by one, which reports any error where it happens
+            await logger.adebug(f"Could not prefetch variables: {e}")
+            return {}
+
+
 async def update_table_params_with_load_from_db_fields(
     custom_component: CustomComponent,
     params: dict,
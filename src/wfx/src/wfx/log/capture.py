@@ -0,0 +1,143 @@
+"""Per-context capture of stdout, stderr and log output.
+
+`capture_output()` collects everything printed or logged by the code running in the current
+context (an asyncio task and the threads it starts with `asyncio.to_thread`). Captures of
+concurrent tasks are independent, so one process can run many flows at once and still return
+each flow's own output.
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal, TextIO
+
+import structlog
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+StreamName = Literal["stdout", "stderr"]
+
+
+@dataclass
+class CapturedOutput:
+    """Output collected by a `capture_output()` block."""
+
+    stdout: io.StringIO = field(default_factory=io.StringIO)
+    stderr: io.StringIO = field(default_factory=io.StringIO)
+
+    def stream(self, name: StreamName) -> io.StringIO:
+        return self.stdout if name == "stdout" else self.stderr
+
+    def getvalue(self) -> str:
+        """Returns the captured stdout followed by the captured stderr."""
+        return self.stdout.getvalue() + self.stderr.getvalue()
+
+
+_active_capture: ContextVar[CapturedOutput | None] = ContextVar("wfx_active_capture", default=None)
+
+
+class ContextAwareStream(io.TextIOBase):
+    """Text stream that writes to the capture active in the current context, or to `fallback` otherwise."""
+
+    def __init__(self, name: StreamName, fallback: TextIO) -> None:
+        super().__init__()
+        self.name = name
+        self.fallback = fallback
+
+    def _target(self) -> TextIO:
+        captured = _active_capture.get()
+        return captured.stream(self.name) if captured is not None else self.fallback
+
+    def write(self, s: str) -> int:
+        return self._target().write(s)
+
+    def writelines(self, lines) -> None:
+        self._target().writelines(lines)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return _active_capture.get() is None and self.fallback.isatty()
+
+    def writable(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return self.fallback.fileno()
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return getattr(self.fallback, "encoding", "utf-8")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.fallback, name)
+
+
+class _StreamInstaller:
+    """Keeps `sys.stdout`/`sys.stderr` wrapped in `ContextAwareStream` while any capture is active."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._active = 0
+        self._originals: dict[StreamName, TextIO] = {}
+
+    def acquire(self) -> None:
+        with self._lock:
+            self._active += 1
+            if self._active > 1:
+                return
+            for name in ("stdout", "stderr"):
+                original = getattr(sys, name)
+                self._originals[name] = original
+                setattr(sys, name, ContextAwareStream(name, original))
+
+    def release(self) -> None:
+        with self._lock:
+            self._active -= 1
+            if self._active > 0:
+                return
+            for name, original in self._originals.items():
+                # Leave the stream alone if something else replaced it in the meantime
+                if isinstance(getattr(sys, name), ContextAwareStream):
+                    setattr(sys, name, original)
+            self._originals.clear()
+
+
+_installer = _StreamInstaller()
+
+
+@contextmanager
+def capture_output() -> Iterator[CapturedOutput]:
+    """Captures stdout, stderr and wfx log output written in the current context.
+
+    Unlike `contextlib.redirect_stdout`, writes from other tasks or threads keep going to the real
+    streams, and nested captures only collect what is written while they are innermost.
+    """
+    captured = CapturedOutput()
+    token = _active_capture.set(captured)
+    _installer.acquire()
+    try:
+        yield captured
+    finally:
+        _installer.release()
+        _active_capture.reset(token)
+
+
+def capture_log_output(_logger: Any, _method_name: str, rendered: Any) -> Any:
+    """Structlog processor that sends rendered log lines to the active capture instead of the log output.
+
+    Must come after the renderer so that captured lines look like the ones printed to the console.
+    """
+    captured = _active_capture.get()
+    if captured is None:
+        return rendered
+    line = rendered.decode() if isinstance(rendered, bytes) else str(rendered)
+    captured.stdout.write(line + "\n")
+    raise structlog.DropEvent
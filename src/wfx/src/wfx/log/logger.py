@@ -1,21 +1,25 @@
 """Logging configuration for Primeagent using structlog."""
 
+import atexit
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import sys
-from collections import deque
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from threading import Lock, Semaphore
-from typing import Any, TypedDict
+from typing import Any, TextIO, TypedDict
 
 import orjson
 import structlog
 from platformdirs import user_cache_dir
 from typing_extensions import NotRequired
 
+from wfx.log.capture import capture_log_output
 from wfx.settings import DEV
 
 VALID_LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -31,7 +35,11 @@ LOG_LEVEL_MAP = {
 
 
 class SizedLogBuffer:
-    """A buffer for storing log messages for the log retrieval API."""
+    """A ring buffer of `(epoch_ms, message)` entries for the log retrieval API.
+
+    Entries are kept in arrival order, which is also timestamp order for log records, so timestamp
+    queries are binary searches. Writers hold the lock only to store one entry in its slot.
+    """
 
     def __init__(
         self,
@@ -42,7 +50,10 @@ class SizedLogBuffer:
         The buffer can be overwritten by an env variable PRIMEAGENT_LOG_RETRIEVER_BUFFER_SIZE
         because the logger is initialized before the settings_service are loaded.
         """
-        self.buffer: deque = deque()
+        self._slots: list[tuple[int, str] | None] = []
+        # Number of entries ever written; the oldest entry kept is number `_written - _size`
+        self._written = 0
+        self._size = 0
 
         self._max_readers = max_readers
         self._wlock = Lock()
@@ -54,7 +65,7 @@ class SizedLogBuffer:
         return self._wlock
 
     def write(self, message: str) -> None:
-        """Write a message to the buffer."""
+        """Write a JSON-serialized log record to the buffer."""
         record = json.loads(message)
         log_entry = record.get("event", record.get("msg", record.get("text", "")))
 
@@ -72,63 +83,109 @@ class SizedLogBuffer:
         else:
             epoch = int(timestamp * 1000)
 
+        self.append(epoch, log_entry)
+
+    def write_event(self, event_dict: dict[str, Any]) -> None:
+        """Write a structlog event dict to the buffer.
+
+        Numeric timestamps are used as they are; records stamped with a formatted time are stored
+        with the current time instead of parsing it back.
+        """
+        log_entry = event_dict.get("event", event_dict.get("msg", event_dict.get("text", "")))
+        timestamp = event_dict.get("timestamp")
+        epoch = int(timestamp * 1000) if isinstance(timestamp, int | float) else time.time_ns() // 1_000_000
+        self.append(epoch, str(log_entry))
+
+    def append(self, epoch_ms: int, message: str) -> None:
+        """Add an entry, dropping the oldest one when the buffer is full."""
+        capacity = self.max
+        if capacity <= 0:
+            return
+        with self._wlock:
+            if len(self._slots) != capacity:
+                self._resize(capacity)
+            self._slots[self._written % capacity] = (epoch_ms, message)
+            self._written += 1
+            self._size = min(self._size + 1, capacity)
+
+    def _resize(self, capacity: int) -> None:
+        """Rebuilds the ring for a new capacity, keeping the newest entries. Called with the lock held."""
+        entries = self._entries(0, self._size)[-capacity:]
+        self._slots = [None] * capacity
+        self._size = len(entries)
+        for sequence, entry in enumerate(entries, start=self._written - len(entries)):
+            self._slots[sequence % capacity] = entry
+
+    def _entry(self, index: int) -> tuple[int, str]:
+        """The entry at `index`, counting from the oldest one kept. Called with the lock held."""
+        return self._slots[(self._written - self._size + index) % len(self._slots)]  # type: ignore[return-value]
+
+    def _entries(self, start: int, stop: int) -> list[tuple[int, str]]:
+        """The entries from `start` to `stop` (exclusive), oldest first. Called with the lock held."""
+        return [self._entry(index) for index in range(max(start, 0), min(stop, self._size))]
+
+    def _first_at_or_after(self, timestamp: int) -> int:
+        """Index of the first entry whose timestamp is at least `timestamp`. Called with the lock held."""
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            if self._entry(middle)[0] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    @property
+    def buffer(self) -> list[tuple[int, str]]:
+        """A snapshot of the entries, oldest first."""
         with self._wlock:
-            if len(self.buffer) >= self.max:
-                for _ in range(len(self.buffer) - self.max + 1):
-                    self.buffer.popleft()
-            self.buffer.append((epoch, log_entry))
+            return self._entries(0, self._size)
 
     def __len__(self) -> int:
         """Get the length of the buffer."""
-        return len(self.buffer)
+        return self._size
+
+    def get_after_sequence(self, sequence: int | None) -> tuple[int, list[tuple[int, str]]]:
+        """Get the entries written since `sequence`, along with the sequence to pass on the next call.
+
+        Pass None to start from the current end of the buffer. When older entries were already dropped,
+        the remaining ones are returned.
+        """
+        with self._wlock:
+            if sequence is None:
+                return self._written, []
+            first_kept = self._written - self._size
+            return self._written, self._entries(max(sequence, first_kept) - first_kept, self._size)
 
     def get_after_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
         """Get log entries after a timestamp."""
-        rc = {}
-
         self._rsemaphore.acquire()
         try:
             with self._wlock:
-                for ts, msg in self.buffer:
-                    if lines == 0:
-                        break
-                    if ts >= timestamp and lines > 0:
-                        rc[ts] = msg
-                        lines -= 1
+                start = self._first_at_or_after(timestamp)
+                return dict(self._entries(start, start + max(lines, 0)))
         finally:
             self._rsemaphore.release()
 
-        return rc
-
     def get_before_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
         """Get log entries before a timestamp."""
         self._rsemaphore.acquire()
         try:
             with self._wlock:
-                as_list = list(self.buffer)
-            max_index = -1
-            for i, (ts, _) in enumerate(as_list):
-                if ts >= timestamp:
-                    max_index = i
-                    break
-            if max_index == -1:
-                return self.get_last_n(lines)
-            rc = {}
-            start_from = max(max_index - lines, 0)
-            for i, (ts, msg) in enumerate(as_list):
-                if start_from <= i < max_index:
-                    rc[ts] = msg
-            return rc
+                max_index = self._first_at_or_after(timestamp)
+                if max_index < self._size:
+                    return dict(self._entries(max_index - lines, max_index))
         finally:
             self._rsemaphore.release()
+        return self.get_last_n(lines)
 
     def get_last_n(self, last_idx: int) -> dict[int, str]:
         """Get the last n log entries."""
         self._rsemaphore.acquire()
         try:
             with self._wlock:
-                as_list = list(self.buffer)
-            return dict(as_list[-last_idx:])
+                start = self._size - last_idx if last_idx > 0 else 0
+                return dict(self._entries(start, self._size))
         finally:
             self._rsemaphore.release()
 
@@ -185,11 +242,108 @@ def remove_exception_in_production(_logger: Any, _method_name: str, event_dict:
 def buffer_writer(_logger: Any, _method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
     """Write to log buffer if enabled."""
     if log_buffer.enabled():
-        # Create a JSON representation for the buffer
-        log_buffer.write(json.dumps(event_dict))
+        log_buffer.write_event(event_dict)
     return event_dict
 
 
+class AsyncLogSink:
+    """File-like object handing log output to a background thread that writes it to `stream`.
+
+    Logging calls only enqueue the text, so request handlers never wait on a slow terminal, pipe or
+    disk. When `max_pending` writes are already waiting, new ones are dropped and counted, and the
+    count is reported in the output once the thread catches up.
+    """
+
+    def __init__(self, stream: TextIO, max_pending: int = 10000) -> None:
+        self.stream = stream
+        self.dropped = 0
+        self._queue: queue.Queue[str | None] = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="wfx-log-sink", daemon=True)
+        self._thread.start()
+
+    def write(self, text: str) -> int:
+        try:
+            self._queue.put_nowait(text)
+        except queue.Full:
+            self.dropped += 1
+        return len(text)
+
+    def flush(self) -> None:
+        """Does nothing; the sink thread flushes `stream` after writing each batch."""
+
+    def isatty(self) -> bool:
+        return self.stream.isatty()
+
+    def _run(self) -> None:
+        closed = False
+        while not closed:
+            chunks = [self._queue.get()]
+            while not self._queue.empty():
+                chunks.append(self._queue.get_nowait())
+            if None in chunks:
+                closed = True
+                chunks = chunks[: chunks.index(None)]
+            if self.dropped:
+                dropped, self.dropped = self.dropped, 0
+                chunks.append(f"[{dropped} log writes dropped because the log output was too slow]\n")
+            try:
+                self.stream.write("".join(chunks))  # type: ignore[arg-type]
+                self.stream.flush()
+            except (OSError, ValueError):
+                # The stream was closed, e.g. at interpreter shutdown
+                pass
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Writes the pending output and stops the sink thread, waiting at most `timeout` seconds."""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+
+# Background writers installed by `configure(async_sink=True)`
+_async_sink: AsyncLogSink | None = None
+_file_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_async_logging() -> None:
+    """Stops the background log writers, writing the output they still hold."""
+    global _async_sink, _file_listener  # noqa: PLW0603
+    if _async_sink is not None:
+        _async_sink.close()
+        _async_sink = None
+    if _file_listener is not None:
+        _file_listener.stop()
+        _file_listener = None
+
+
+atexit.register(_stop_async_logging)
+
+
+def _get_async_sink(stream: TextIO) -> AsyncLogSink:
+    global _async_sink  # noqa: PLW0603
+    if _async_sink is None or _async_sink.stream is not stream:
+        if _async_sink is not None:
+            _async_sink.close()
+        _async_sink = AsyncLogSink(stream)
+    return _async_sink
+
+
+def _add_file_handler(file_handler: logging.Handler, *, async_sink: bool) -> None:
+    """Adds `file_handler` to the root logger, behind a queue drained by a background thread if `async_sink`."""
+    global _file_listener  # noqa: PLW0603
+    if not async_sink:
+        logging.root.addHandler(file_handler)
+        return
+    if _file_listener is not None:
+        _file_listener.stop()
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    _file_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _file_listener.start()
+    logging.root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
 class LogConfig(TypedDict):
     """Configuration for logging."""
 
@@ -210,8 +364,13 @@ def configure(
     log_rotation: str | None = None,
     cache: bool | None = None,
     output_file=None,
+    async_sink: bool | None = None,
 ) -> None:
-    """Configure the logger."""
+    """Configure the logger.
+
+    With `async_sink` (or PRIMEAGENT_LOG_ASYNC_SINK=true), log output is written by a background
+    thread so logging calls never block on the console or the log file.
+    """
     # Early-exit only if structlog is configured AND current min level matches the requested one.
     cfg = structlog.get_config() if structlog.is_configured() else {}
     wrapper_class = cfg.get("wrapper_class")
@@ -241,6 +400,9 @@ def configure(
     if log_format is None:
         log_format = os.getenv("PRIMEAGENT_LOG_FORMAT")
 
+    if async_sink is None:
+        async_sink = os.getenv("PRIMEAGENT_LOG_ASYNC_SINK", "false").lower() == "true"
+
     # Configure processors based on environment
     processors = [
         structlog.contextvars.merge_contextvars,
@@ -290,6 +452,9 @@ def configure(
         else:
             processors.append(structlog.processors.JSONRenderer())
 
+    # Output of code running inside `capture_output()` goes to that capture instead
+    processors.append(capture_log_output)
+
     # Get numeric log level
     numeric_level = LOG_LEVEL_MAP.get(log_level.upper(), logging.ERROR)
 
@@ -300,6 +465,8 @@ def configure(
     # Configure structlog
     # Default to stdout for backward compatibility, unless output_file is specified
     log_output_file = output_file if output_file is not None else sys.stdout
+    if async_sink and not log_file:
+        log_output_file = _get_async_sink(log_output_file)
 
     structlog.configure(
         processors=processors,
@@ -344,7 +511,7 @@ def configure(
         file_handler.setFormatter(logging.Formatter("%(message)s"))
 
         # Add file handler to root logger
-        logging.root.addHandler(file_handler)
+        _add_file_handler(file_handler, async_sink=async_sink)
         logging.root.setLevel(numeric_level)
 
     # Set up interceptors for uvicorn and gunicorn
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
         CacheServiceProtocol,
         ChatServiceProtocol,
         DatabaseServiceProtocol,
+        ExecutionLogServiceProtocol,
         SettingsServiceProtocol,
         StorageServiceProtocol,
         TracingServiceProtocol,
@@ -101,6 +102,13 @@ def get_tracing_service() -> TracingServiceProtocol | None:
     return get_service(ServiceType.TRACING_SERVICE)
 
 
+def get_execution_log_service() -> ExecutionLogServiceProtocol | None:
+    """Retrieves the service storing transactions and vertex builds, if one is registered."""
+    from wfx.services.schema import ServiceType
+
+    return get_service(ServiceType.EXECUTION_LOG_SERVICE)
+
+
 @asynccontextmanager
 async def session_scope():
     """Session scope context manager.
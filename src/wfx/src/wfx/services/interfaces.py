@@ -101,3 +101,17 @@ class TracingServiceProtocol(Protocol):
     def log(self, message: str, **kwargs) -> None:
         """Log tracing information."""
         ...
+
+
+class ExecutionLogServiceProtocol(Protocol):
+    """Protocol for the service storing transactions and vertex builds."""
+
+    @abstractmethod
+    async def add_transaction(self, transaction: dict[str, Any]) -> None:
+        """Queue a transaction to be stored."""
+        ...
+
+    @abstractmethod
+    async def add_vertex_build(self, vertex_build: dict[str, Any]) -> None:
+        """Queue a vertex build to be stored."""
+        ...
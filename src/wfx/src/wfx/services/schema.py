@@ -19,3 +19,4 @@ class ServiceType(str, Enum):
     JOB_QUEUE_SERVICE = "job_queue_service"
     SHARED_COMPONENT_CACHE_SERVICE = "shared_component_cache_service"
     MCP_COMPOSER_SERVICE = "mcp_composer_service"
+    EXECUTION_LOG_SERVICE = "execution_log_service"
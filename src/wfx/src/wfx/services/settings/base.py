@@ -108,6 +108,11 @@ class Settings(BaseSettings):
     """Frequency (in seconds) at which the background cleanup task wakes up to
     reap idle sessions."""
 
+    mcp_tool_cache_ttl: int = 300  # seconds
+    """How long (in seconds) the tools listed by an MCP server are reused before
+    the server is asked again. A `tools/list_changed` notification from the server
+    drops its tools right away. Set to 0 to list tools on every build."""
+
     # sqlite configuration
     sqlite_pragmas: dict | None = {"synchronous": "NORMAL", "journal_mode": "WAL"}
     """SQLite pragmas to use when connecting to the database."""
@@ -147,8 +152,13 @@ class Settings(BaseSettings):
     """The cache type can be 'async' or 'redis'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    graph_template_cache_size: int = 128
+    """Number of prepared flow graphs kept in memory so /api/v1/run only forks them. Set to 0 to disable."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
+    variable_cache_ttl: int = 0
+    """Seconds that decrypted variable values are cached in memory per user. Set to 0 to disable.
+    Changes made through this process clear the cache right away; other workers see them after the TTL."""
 
     prometheus_enabled: bool = False
     """If set to True, Primeagent will expose Prometheus metrics."""
@@ -156,6 +166,13 @@ class Settings(BaseSettings):
     """The port on which Primeagent will expose Prometheus metrics. 9090 is the default port."""
 
     disable_track_apikey_usage: bool = False
+    api_key_cache_ttl: int = 30
+    """Seconds that verified API keys are cached in memory, so requests authenticated with them only load their user.
+    Set to 0 to disable. Deleting a key or updating its user through this process clears it right away; other
+    workers see the change after the TTL."""
+    api_key_usage_flush_interval: float = 10.0
+    """Seconds between writes of API key usage counters, which are aggregated in memory meanwhile.
+    Set to 0 to write them on every use."""
     remove_api_keys: bool = False
     components_path: list[str] = []
     components_index_path: str | None = None
@@ -265,10 +282,27 @@ class Settings(BaseSettings):
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    execution_log_storage_enabled: bool = False
+    """If set to True, the transactions and vertex builds of flow runs are written to the database by the execution
+    log service, if `transactions_storage_enabled` and `vertex_builds_storage_enabled` allow it. Otherwise they are
+    only logged."""
+    execution_log_batch_size: int = 500
+    """The maximum number of queued transactions and vertex builds written to the database in one insert."""
+    execution_log_flush_interval: float = 1.0
+    """The maximum time in seconds a queued transaction or vertex build waits before being written."""
+    execution_log_queue_size: int = 10000
+    """The number of transactions and vertex builds that can wait to be written before flow runs are slowed down."""
+    execution_log_compaction_interval: float = 60.0
+    """The interval in seconds at which flows with new transactions or vertex builds are trimmed to the limits above."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
+    batch_run_concurrency: int = 1
+    """The number of `input_values` of a /api/v1/run request executed at once, each on its own copy of the
+    flow's graph. With 1, the default, they run one after the other. Above 1, runs sharing a session may store
+    their messages in any order."""
     fs_flows_polling_interval: int = 10000
-    """The polling interval in milliseconds for synchronizing flows from the file system."""
+    """The polling interval in milliseconds for synchronizing flows from the file system. When watchfiles is
+    installed the files are watched instead, and this is how often newly saved flows are looked up."""
     ssl_cert_file: str | None = None
     """Path to the SSL certificate file on the local system."""
     ssl_key_file: str | None = None
@@ -305,6 +339,11 @@ class Settings(BaseSettings):
     Default is 24 hours (86400 seconds). Minimum is 600 seconds (10 minutes)."""
     event_delivery: Literal["polling", "streaming", "direct"] = "streaming"
     """How to deliver build events to the frontend. Can be 'polling', 'streaming' or 'direct'."""
+    stream_token_flush_interval: float = 0.05
+    """Seconds that streamed LLM tokens are batched for before being sent as one `token` event.
+    Set to 0 to send one event per token."""
+    stream_token_flush_size: int = 256
+    """Batched streamed tokens are sent as soon as they reach this many bytes."""
     lazy_load_components: bool = False
     """If set to True, Primeagent will only partially load components at startup and fully load them on demand.
     This significantly reduces startup time but may cause a slight delay when a component is first used."""
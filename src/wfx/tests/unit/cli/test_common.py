@@ -209,7 +209,7 @@ class TestGraphExecution:
         # Mock graph and async iterator
         mock_result = MagicMock(results={"text": "Test result"})
 
-        async def mock_async_start(inputs):  # noqa: ARG001
+        async def mock_async_start(inputs, **kwargs):  # noqa: ARG001
             yield mock_result
 
         mock_graph = MagicMock()
@@ -230,7 +230,7 @@ class TestGraphExecution:
         # Ensure results attribute doesn't exist
         delattr(mock_result, "results")
 
-        async def mock_async_start(inputs):  # noqa: ARG001
+        async def mock_async_start(inputs, **kwargs):  # noqa: ARG001
             yield mock_result
 
         mock_graph = MagicMock()
@@ -245,7 +245,7 @@ class TestGraphExecution:
     async def test_execute_graph_with_capture_error(self):
         """Test graph execution with error."""
 
-        async def mock_async_start_error(inputs):  # noqa: ARG001
+        async def mock_async_start_error(inputs, **kwargs):  # noqa: ARG001
             msg = "Execution failed"
             raise RuntimeError(msg)
             yield  # This line never executes but makes it an async generator
@@ -256,6 +256,37 @@ class TestGraphExecution:
         with pytest.raises(RuntimeError, match="Execution failed"):
             await execute_graph_with_capture(mock_graph, "test input")
 
+    @pytest.mark.asyncio
+    async def test_execute_graph_with_capture_keeps_concurrent_logs_apart(self):
+        """Test that concurrent executions only capture their own prints and log lines."""
+        import asyncio
+
+        from wfx.log.logger import logger
+
+        def make_graph(name: str):
+            async def mock_async_start(inputs, **kwargs):  # noqa: ARG001
+                print(f"{name} start")  # noqa: T201
+                await asyncio.sleep(0.01)
+                await asyncio.to_thread(print, f"{name} thread", file=sys.stderr)
+                logger.critical(f"{name} log")
+                await asyncio.sleep(0.01)
+                yield MagicMock(results={"text": name})
+
+            mock_graph = MagicMock()
+            mock_graph.async_start = mock_async_start
+            return mock_graph
+
+        original_stdout = sys.stdout
+        names = ("first-flow", "second-flow")
+        outputs = await asyncio.gather(*(execute_graph_with_capture(make_graph(name), "x") for name in names))
+
+        for name, other, (_, logs) in zip(names, reversed(names), outputs, strict=True):
+            assert f"{name} start" in logs
+            assert f"{name} thread" in logs
+            assert f"{name} log" in logs
+            assert other not in logs
+        assert sys.stdout is original_stdout
+
 
 class TestResultExtraction:
     """Test result data extraction."""
@@ -184,7 +184,7 @@ class TestServeAppEndpoints:
         original_async_start = graph.async_start
 
         # Mock successful execution with real ResultData
-        async def mock_async_start(inputs):  # noqa: ARG001
+        async def mock_async_start(inputs, **kwargs):  # noqa: ARG001
             # Create real Message and ResultData objects
             message = Message(text="Hello from flow")
             result_data = ResultData(
@@ -237,7 +237,7 @@ class TestServeAppEndpoints:
         # Create second real graph using the same JSON structure
         graph2 = Graph.from_payload(simple_chat_json, flow_id="flow-2")
 
-        async def mock_async_start2(inputs):  # noqa: ARG001
+        async def mock_async_start2(inputs, **kwargs):  # noqa: ARG001
             # Return empty results for this test
             yield MagicMock(outputs=[])
 
@@ -347,7 +347,7 @@ class TestServeAppEndpoints:
         headers = {"x-api-key": "test-api-key"}
 
         # Mock execute_graph_with_capture to raise an error
-        async def mock_execute_error(graph, input_value):  # noqa: ARG001
+        async def mock_execute_error(graph, input_value, **kwargs):  # noqa: ARG001
             msg = "Flow execution failed"
             raise RuntimeError(msg)
 
@@ -372,7 +372,7 @@ class TestServeAppEndpoints:
         headers = {"x-api-key": "test-api-key"}
 
         # Mock execute_graph_with_capture to return empty results
-        async def mock_execute_empty(graph, input_value):  # noqa: ARG001
+        async def mock_execute_empty(graph, input_value, **kwargs):  # noqa: ARG001
             return [], ""  # Empty results and logs
 
         with (
@@ -445,7 +445,7 @@ class TestServeAppEndpoints:
         """Test flow execution with message-type output."""
 
         # Create a real message output scenario
-        async def mock_async_start_message(inputs):  # noqa: ARG001
+        async def mock_async_start_message(inputs, **kwargs):  # noqa: ARG001
             # Create real Message and ResultData objects
             message = Message(text="Message output")
             result_data = ResultData(
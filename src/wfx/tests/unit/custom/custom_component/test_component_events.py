@@ -1,13 +1,15 @@
 import asyncio
+import json
 import time
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
 from wfx.custom.custom_component.component import Component
 from wfx.events.event_manager import EventManager
+from wfx.events.token_buffer import TokenBuffer
 from wfx.schema.content_block import ContentBlock
 from wfx.schema.content_types import TextContent, ToolContent
 from wfx.schema.message import Message
@@ -262,3 +264,45 @@ async def test_component_streaming_message():
             tokens.append(event)
 
     assert len(tokens) > 0
+
+
+@pytest.mark.asyncio
+async def test_component_streaming_message_batches_tokens():
+    """Test that streamed tokens are coalesced into fewer token events without losing text."""
+    queue = asyncio.Queue()
+    event_manager = EventManager(queue)
+    event_manager.register_event("on_token", "token")
+    event_manager.register_event("on_message", "add_message")
+
+    vertex = MagicMock()
+    vertex.graph.flow_id = str(uuid4())
+    component = ComponentForTesting(_vertex=vertex)
+    component.set_event_manager(event_manager)
+
+    class StreamChunk:
+        def __init__(self, content: str):
+            self.content = content
+
+    chunks = [f"token{i} " for i in range(50)]
+
+    async def text_generator():
+        for chunk in chunks:
+            yield StreamChunk(chunk)
+
+    message = Message(sender="test_sender", session_id="test_session", sender_name="test", text=text_generator())
+
+    with patch.object(Component, "_create_token_buffer", return_value=TokenBuffer(flush_interval=60, flush_size=64)):
+        sent_message = await component.send_message(message)
+
+    token_chunks = []
+    while not queue.empty():
+        _, event_data, _ = queue.get_nowait()
+        event = json.loads(event_data.decode("utf-8"))
+        if event["event"] == "token":
+            token_chunks.append(event["data"]["chunk"])
+
+    assert sent_message.text == "".join(chunks)
+    assert "".join(token_chunks) == "".join(chunks)
+    # The first token is sent right away, the rest in batches of at least 64 bytes
+    assert token_chunks[0] == chunks[0]
+    assert 1 < len(token_chunks) < len(chunks) / 4
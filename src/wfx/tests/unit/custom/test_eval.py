@@ -0,0 +1,83 @@
+from textwrap import dedent
+from unittest.mock import patch
+
+import pytest
+
+from wfx.custom import eval as custom_eval
+from wfx.custom.eval import ComponentClassCache, component_class_cache, eval_custom_component_code
+
+CODE = dedent(
+    """
+from wfx.custom import Component
+
+class CachedComponent(Component):
+    display_name = "Cached"
+"""
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_component_class_cache():
+    component_class_cache.clear()
+    yield
+    component_class_cache.clear()
+
+
+def test_identical_code_is_only_executed_once():
+    with patch.object(custom_eval.validate, "create_class", wraps=custom_eval.validate.create_class) as create_class:
+        first = eval_custom_component_code(CODE)
+        second = eval_custom_component_code(CODE)
+
+    assert first is second
+    assert create_class.call_count == 1
+    info = component_class_cache.info()
+    assert (info.hits, info.misses, info.size) == (1, 1, 1)
+
+
+def test_different_code_builds_different_classes():
+    first = eval_custom_component_code(CODE)
+    second = eval_custom_component_code(CODE.replace('"Cached"', '"Other"'))
+
+    assert first is not second
+    assert second.display_name == "Other"
+    assert component_class_cache.info().size == 2
+
+
+def test_use_cache_false_bypasses_cache():
+    first = eval_custom_component_code(CODE, use_cache=False)
+    second = eval_custom_component_code(CODE, use_cache=False)
+
+    assert first is not second
+    assert component_class_cache.info().size == 0
+
+
+def test_failed_evaluation_is_not_cached():
+    with pytest.raises(TypeError):
+        eval_custom_component_code("x = 1")
+
+    assert component_class_cache.info().size == 0
+
+
+def test_cache_evicts_least_recently_used_entries():
+    cache = ComponentClassCache(maxsize=2)
+    cache.set("a", int)
+    cache.set("b", str)
+    assert cache.get("a") is int
+    cache.set("c", float)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is int
+    assert cache.get("c") is float
+    assert cache.info().maxsize == 2
+
+
+def test_instances_of_a_cached_class_do_not_share_runtime_inputs():
+    component_class = eval_custom_component_code(CODE)
+    first = component_class()
+    first._get_or_create_input("added_at_runtime")
+
+    second = eval_custom_component_code(CODE)()
+
+    assert "added_at_runtime" in {input_.name for input_ in first.inputs}
+    assert "added_at_runtime" not in {input_.name for input_ in second.inputs}
+    assert "added_at_runtime" not in {input_.name for input_ in component_class.inputs}
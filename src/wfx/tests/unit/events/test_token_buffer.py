@@ -0,0 +1,40 @@
+"""Unit tests for wfx.events.token_buffer module."""
+
+from unittest.mock import patch
+
+from wfx.events.token_buffer import TokenBuffer
+
+
+class TestTokenBuffer:
+    """Test cases for the TokenBuffer class."""
+
+    def test_without_limits_every_token_is_a_batch(self):
+        """Test that a buffer with no interval or size sends each token on its own."""
+        buffer = TokenBuffer()
+
+        assert [buffer.add(token) for token in ["Hello", " ", "World"]] == ["Hello", " ", "World"]
+        assert buffer.flush() is None
+        assert buffer.text == "Hello World"
+
+    def test_tokens_are_batched_until_interval_passes(self):
+        """Test that tokens are held until the flush interval has passed."""
+        with patch("wfx.events.token_buffer.time.monotonic", return_value=0.0) as monotonic:
+            buffer = TokenBuffer(flush_interval=0.05)
+            assert buffer.add("a") is None
+            assert buffer.add("b") is None
+            monotonic.return_value = 0.06
+            assert buffer.add("c") == "abc"
+            assert buffer.add("d") is None
+
+        assert buffer.flush() == "d"
+        assert buffer.text == "abcd"
+
+    def test_tokens_are_sent_when_size_is_reached(self):
+        """Test that pending tokens are sent once they reach the flush size in bytes."""
+        buffer = TokenBuffer(flush_interval=60, flush_size=4)
+
+        assert buffer.add("ab") is None
+        assert buffer.add("é") == "abé"
+        assert buffer.add("") is None
+        assert buffer.flush() is None
+        assert buffer.text == "abé"
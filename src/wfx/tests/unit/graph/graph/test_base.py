@@ -5,6 +5,7 @@ import pytest
 from wfx.components.input_output import ChatInput, ChatOutput, TextOutputComponent
 from wfx.graph import Graph
 from wfx.graph.graph.constants import Finish
+from wfx.services.cache.utils import CacheMiss
 
 
 @pytest.mark.asyncio
@@ -56,6 +57,40 @@ async def test_graph_functional():
     assert graph.edges[0].target_id == "chat_output"
 
 
+class RecordingChatService:
+    def __init__(self):
+        self.cached = []
+
+    async def get_cache(self, key, lock=None):  # noqa: ARG002
+        return CacheMiss()
+
+    async def set_cache(self, key, data, lock=None) -> bool:  # noqa: ARG002
+        self.cached.append((key, data))
+        return True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stateless", [False, True])
+async def test_stateless_graph_is_not_cached(monkeypatch, stateless):
+    chat_service = RecordingChatService()
+    monkeypatch.setattr("wfx.graph.graph.base.get_chat_service", lambda: chat_service)
+    chat_input = ChatInput(_id="chat_input", should_store_message=False)
+    chat_output = ChatOutput(_id="chat_output", should_store_message=False)
+    chat_output.set(input_value=chat_input.message_response)
+    graph = Graph(chat_input, chat_output, flow_id="flow")
+    graph.stateless = stateless
+
+    await graph.arun(inputs=[{"input_value": "hi"}], outputs=[], fallback_to_env_vars=False)
+    results = [result async for result in graph.fork().async_start()]
+
+    assert results[-1] == Finish()
+    if stateless:
+        assert chat_service.cached == []
+    else:
+        assert any(data is graph for _, data in chat_service.cached)
+        assert {key for key, _ in chat_service.cached} >= {"flow", "chat_input", "chat_output"}
+
+
 @pytest.mark.asyncio
 async def test_graph_functional_async_start():
     chat_input = ChatInput(_id="chat_input")
@@ -0,0 +1,213 @@
+"""Tests and a wall-clock benchmark for the concurrent schedulers of `Graph.process` and `Graph.async_start`."""
+
+import asyncio
+import time
+
+import pytest
+
+from wfx.custom.custom_component.component import Component
+from wfx.graph.graph.base import Graph
+from wfx.graph.graph.constants import Finish
+from wfx.io import FloatInput, MessageTextInput, Output
+from wfx.schema.message import Message
+
+EVENTS: list[tuple[str, str]] = []
+RUNNING: dict[str, int] = {"current": 0, "peak": 0}
+
+
+class SleepComponent(Component):
+    display_name = "Sleep"
+    description = "Waits for `delay` seconds and appends a dot to its input."
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text"),
+        FloatInput(name="delay", display_name="Delay", value=0.0),
+    ]
+    outputs = [
+        Output(display_name="Message", name="out", method="run"),
+    ]
+
+    async def run(self) -> Message:
+        EVENTS.append(("start", self._id))
+        RUNNING["current"] += 1
+        RUNNING["peak"] = max(RUNNING["peak"], RUNNING["current"])
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            RUNNING["current"] -= 1
+        EVENTS.append(("end", self._id))
+        return Message(text=f"{self.text or ''}.")
+
+
+class FailingComponent(Component):
+    display_name = "Failing"
+
+    inputs = [MessageTextInput(name="text", display_name="Text")]
+    outputs = [Output(display_name="Message", name="out", method="run")]
+
+    async def run(self) -> Message:
+        msg = "boom"
+        raise RuntimeError(msg)
+
+
+@pytest.fixture(autouse=True)
+def reset_tracking():
+    EVENTS.clear()
+    RUNNING.update(current=0, peak=0)
+
+
+def build_unbalanced_graph(width: int, slow: float) -> Graph:
+    """Builds `source -> first_i -> second_i` branches where each branch has one slow vertex.
+
+    Branch 0 is slow in its first vertex, every other branch is slow in its second vertex, so the
+    layered scheduler pays `2 * slow` while the dataflow scheduler only pays `slow`.
+    """
+    graph = Graph()
+    graph.add_component(SleepComponent(_id="source"))
+    for i in range(width):
+        first_delay, second_delay = (slow, 0.0) if i == 0 else (0.0, slow)
+        graph.add_component(SleepComponent(_id=f"first_{i}", delay=first_delay))
+        graph.add_component(SleepComponent(_id=f"second_{i}", delay=second_delay))
+        graph.add_component_edge("source", ("out", "text"), f"first_{i}")
+        graph.add_component_edge(f"first_{i}", ("out", "text"), f"second_{i}")
+    graph.prepare()
+    return graph
+
+
+async def test_dataflow_builds_every_vertex_with_same_results_as_layered():
+    layered = build_unbalanced_graph(width=3, slow=0.01)
+    await layered.process(fallback_to_env_vars=False)
+    dataflow = build_unbalanced_graph(width=3, slow=0.01)
+    await dataflow.process(fallback_to_env_vars=False, scheduler="dataflow")
+
+    assert all(vertex.built for vertex in dataflow.vertices)
+    for vertex in layered.vertices:
+        expected = vertex.results["out"].get_text()
+        assert dataflow.get_vertex(vertex.id).results["out"].get_text() == expected
+    assert dataflow.get_vertex("second_0").results["out"].get_text() == "..."
+
+
+async def test_dataflow_starts_successor_before_slow_sibling_finishes():
+    graph = build_unbalanced_graph(width=2, slow=0.2)
+    await graph.process(fallback_to_env_vars=False, scheduler="dataflow")
+
+    # second_1 only depends on first_1, so it must not wait for the slow first_0
+    assert EVENTS.index(("start", "second_1")) < EVENTS.index(("end", "first_0"))
+
+
+async def test_layered_waits_for_whole_layer():
+    graph = build_unbalanced_graph(width=2, slow=0.05)
+    await graph.process(fallback_to_env_vars=False)
+
+    assert EVENTS.index(("start", "second_1")) > EVENTS.index(("end", "first_0"))
+
+
+async def test_dataflow_respects_max_concurrency():
+    graph = build_unbalanced_graph(width=6, slow=0.02)
+    await graph.process(fallback_to_env_vars=False, scheduler="dataflow", max_concurrency=2)
+
+    assert RUNNING["peak"] <= 2
+    assert all(vertex.built for vertex in graph.vertices)
+
+
+async def test_dataflow_propagates_vertex_errors():
+    graph = Graph()
+    graph.add_component(SleepComponent(_id="source"))
+    graph.add_component(FailingComponent(_id="failing"))
+    graph.add_component(SleepComponent(_id="slow", delay=5.0))
+    graph.add_component_edge("source", ("out", "text"), "failing")
+    graph.add_component_edge("source", ("out", "text"), "slow")
+    graph.prepare()
+
+    start = time.perf_counter()
+    with pytest.raises(Exception, match="boom"):
+        await graph.process(fallback_to_env_vars=False, scheduler="dataflow")
+    # The slow sibling is cancelled instead of being awaited
+    assert time.perf_counter() - start < 5.0
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"scheduler": "eager"}, "Invalid scheduler"),
+        ({"scheduler": "dataflow", "max_concurrency": 0}, "Invalid max_concurrency"),
+    ],
+)
+async def test_process_rejects_invalid_scheduler_options(kwargs, match):
+    graph = build_unbalanced_graph(width=1, slow=0.0)
+    with pytest.raises(ValueError, match=match):
+        await graph.process(fallback_to_env_vars=False, **kwargs)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("width", [4, 16, 64])
+async def test_benchmark_dataflow_vs_layered_on_wide_unbalanced_graphs(width):
+    """Compares wall-clock time of both schedulers on wide graphs with one slow vertex per branch."""
+    slow = 0.2
+
+    async def timed(scheduler: str) -> float:
+        graph = build_unbalanced_graph(width=width, slow=slow)
+        start = time.perf_counter()
+        await graph.process(fallback_to_env_vars=False, scheduler=scheduler)
+        return time.perf_counter() - start
+
+    # Warm up tracing/logging so neither run pays the one-off initialization cost
+    await timed("layered")
+    layered = await timed("layered")
+    dataflow = await timed("dataflow")
+    print(f"width={width}: layered={layered:.3f}s dataflow={dataflow:.3f}s speedup={layered / dataflow:.2f}x")  # noqa: T201
+
+    assert layered >= 2 * slow
+    assert dataflow < layered * 0.75
+
+
+async def collect_vertex_ids(graph: Graph, **kwargs) -> list[str]:
+    results = [result async for result in graph.async_start(**kwargs)]
+    assert results[-1] == Finish()
+    return [result.vertex.id for result in results[:-1]]
+
+
+async def test_async_start_concurrent_yields_in_completion_order():
+    graph = build_unbalanced_graph(width=2, slow=0.2)
+    vertex_ids = await collect_vertex_ids(graph, concurrent=True)
+
+    assert sorted(vertex_ids) == sorted(vertex.id for vertex in graph.vertices)
+    # Results come back as builds finish, and second_1 starts while first_0 is still running
+    assert vertex_ids.index("first_1") < vertex_ids.index("first_0")
+    assert EVENTS.index(("start", "second_1")) < EVENTS.index(("end", "first_0"))
+
+
+async def test_async_start_sequential_builds_one_vertex_at_a_time():
+    graph = build_unbalanced_graph(width=3, slow=0.01)
+    await collect_vertex_ids(graph)
+
+    assert RUNNING["peak"] == 1
+
+
+async def test_async_start_concurrent_respects_max_concurrency():
+    graph = build_unbalanced_graph(width=6, slow=0.02)
+    vertex_ids = await collect_vertex_ids(graph, concurrent=True, max_concurrency=3)
+
+    assert RUNNING["peak"] <= 3
+    assert len(vertex_ids) == len(graph.vertices)
+
+
+async def test_async_start_concurrent_respects_stop_vertex():
+    sequential = build_unbalanced_graph(width=3, slow=0.0)
+    sequential.stop_vertex = "first_1"
+    concurrent = build_unbalanced_graph(width=3, slow=0.0)
+    concurrent.stop_vertex = "first_1"
+
+    expected = await collect_vertex_ids(sequential)
+    assert sorted(await collect_vertex_ids(concurrent, concurrent=True)) == sorted(expected)
+    assert "first_0" not in expected
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+async def test_async_start_raises_on_max_iterations(concurrent):
+    graph = build_unbalanced_graph(width=2, slow=0.0)
+    results = graph.async_start(max_iterations=0, concurrent=concurrent)
+
+    assert (await anext(results)).vertex.id == "source"
+    with pytest.raises(ValueError, match="Max iterations reached"):
+        await anext(results)
@@ -0,0 +1,163 @@
+import asyncio
+import copy
+import json
+import time
+
+import pytest
+
+from wfx.components.input_output import ChatInput, ChatOutput
+from wfx.graph import Graph
+from wfx.graph.vertex.base import Vertex
+from wfx.schema.schema import InputValueRequest
+
+FLOW_ID = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+
+
+def load_graph(path) -> Graph:
+    return Graph.from_payload(json.loads(path.read_text(encoding="utf-8")), flow_id=FLOW_ID)
+
+
+def vertices_in(value) -> list[Vertex]:
+    if isinstance(value, Vertex):
+        return [value]
+    if isinstance(value, dict):
+        return [vertex for item in value.values() for vertex in vertices_in(item)]
+    if isinstance(value, list):
+        return [vertex for item in value for vertex in vertices_in(item)]
+    return []
+
+
+def build_chat_chain(length: int) -> Graph:
+    """Builds `ChatInput -> ChatOutput_0 -> ... -> ChatOutput_{length - 1}` from component objects."""
+    previous = start = ChatInput(_id="input")
+    for i in range(length):
+        previous = ChatOutput(_id=f"output_{i}").set(input_value=previous.message_response)
+    return Graph(start, previous)
+
+
+async def run_chat(graph: Graph, text: str) -> str:
+    results = await graph.arun(
+        inputs=[{"input_value": text}], outputs=[], session_id="session", fallback_to_env_vars=False
+    )
+    return next(output.results["message"].text for output in results[0].outputs if output.results)
+
+
+@pytest.mark.parametrize("path_attr", ["MEMORY_CHATBOT_NO_LLM", "LOOP_TEST"])
+def test_fork_copies_vertices_edges_and_components(path_attr):
+    template = load_graph(getattr(pytest, path_attr))
+    fork = template.fork()
+
+    assert [vertex.id for vertex in fork.vertices] == [vertex.id for vertex in template.vertices]
+    assert len(fork.edges) == len(template.edges)
+    assert not any(edge is original for edge in fork.edges for original in template.edges)
+    assert fork.is_cyclic == template.is_cyclic
+    for vertex in fork.vertices:
+        original = template.get_vertex(vertex.id)
+        assert vertex is not original
+        assert vertex.graph is fork
+        assert vertex.custom_component is not original.custom_component
+        assert vertex.custom_component._vertex is vertex
+        # Parameters pointing at other vertices now point at the forked vertices
+        assert all(param.graph is fork for param in vertices_in(vertex.params))
+        assert all(param.graph is fork for param in vertices_in(vertex.raw_params))
+
+
+async def test_forks_run_independently_of_template_and_each_other():
+    template = load_graph(pytest.BASIC_EXAMPLE_PATH.parent / "simple_chat_no_llm.json")
+    first, second = template.fork(), template.fork()
+
+    assert await asyncio.gather(run_chat(first, "hello"), run_chat(second, "world")) == ["hello", "world"]
+    assert not any(vertex.built for vertex in template.vertices)
+    assert await run_chat(template.fork(), "again") == "again"
+
+
+def test_fork_has_its_own_context():
+    template = load_graph(pytest.MEMORY_CHATBOT_NO_LLM)
+    template.context = {"shared": True}
+    fork = template.fork()
+    fork.context["request"] = "value"
+
+    assert "request" not in template.context
+    assert fork.context["shared"] is True
+
+
+async def test_forks_of_component_graphs_do_not_share_component_state():
+    template = build_chat_chain(length=2)
+    forks = [template.fork() for _ in range(4)]
+
+    async def run(graph: Graph, text: str) -> str:
+        results = [result async for result in graph.async_start(InputValueRequest(input_value=text), concurrent=True)]
+        return next(result.result_dict.results["message"].text for result in results if result.vertex.id == "output_1")
+
+    texts = [f"message {i}" for i in range(len(forks))]
+    assert await asyncio.gather(*(run(graph, text) for graph, text in zip(forks, texts, strict=True))) == texts
+    assert forks[0]._start is forks[0].get_vertex("input").custom_component
+    assert forks[0]._start is not template._start
+
+
+@pytest.mark.parametrize("batch_concurrency", [1, 3])
+async def test_arun_batch_runs_each_input_on_a_fork_in_order(batch_concurrency):
+    template = load_graph(pytest.BASIC_EXAMPLE_PATH.parent / "simple_chat_no_llm.json")
+    texts = [f"message {i}" for i in range(6)]
+
+    results = await template.arun(
+        inputs=[{"input_value": text} for text in texts],
+        outputs=[],
+        session_id="session",
+        fallback_to_env_vars=False,
+        batch_concurrency=batch_concurrency,
+    )
+
+    assert [result.inputs["input_value"] for result in results] == texts
+    assert [
+        next(output.results["message"].text for output in result.outputs if output.results) for result in results
+    ] == texts
+    assert not any(vertex.built for vertex in template.vertices)
+
+
+async def test_arun_batch_limits_concurrent_runs(monkeypatch):
+    running = max_running = 0
+
+    async def run(self, *, inputs, **kwargs):  # noqa: ARG001
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        # Later inputs finish first
+        await asyncio.sleep(0.05 - int(inputs["input_value"].split()[-1]) * 0.005)
+        running -= 1
+        return []
+
+    monkeypatch.setattr(Graph, "_run", run)
+    template = load_graph(pytest.BASIC_EXAMPLE_PATH.parent / "simple_chat_no_llm.json")
+    texts = [f"message {i}" for i in range(10)]
+
+    results = await template.arun(inputs=[{"input_value": text} for text in texts], batch_concurrency=4)
+
+    assert [result.inputs["input_value"] for result in results] == texts
+    assert max_running == 4
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("length", [4, 16, 64])
+def test_benchmark_fork_vs_deepcopy(length):
+    """Compares the per-request clone cost of `Graph.fork()` and `copy.deepcopy` against graph size."""
+    component_graph = build_chat_chain(length)
+    payload_graph = Graph.from_payload(copy.deepcopy(component_graph.dump()))
+    repeats = 5
+
+    def per_clone(clone, graph: Graph) -> float:
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            clone(graph)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    for kind, graph in (("components", component_graph), ("payload", payload_graph)):
+        deepcopy_cost = per_clone(copy.deepcopy, graph)
+        fork_cost = per_clone(Graph.fork, graph)
+        print(  # noqa: T201
+            f"{kind} vertices={len(graph.vertices)}: deepcopy={deepcopy_cost * 1000:.2f}ms "
+            f"fork={fork_cost * 1000:.2f}ms speedup={deepcopy_cost / fork_cost:.1f}x"
+        )
+        assert fork_cost < deepcopy_cost
@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from wfx.graph import utils
+from wfx.graph.utils import _vertex_to_primitive_dict, log_transaction
+from wfx.graph.vertex.base import Vertex
+
+
+def test_vertex_to_primitive_dict_leaves_out_secrets():
+    vertex = Mock(spec=Vertex)
+    vertex.data = {
+        "node": {
+            "template": {
+                "api_key": {"type": "str", "password": True, "value": "OPENAI_API_KEY"},
+                "base_url": {"type": "str", "load_from_db": True, "value": "BASE_URL"},
+                "model_name": {"type": "str", "value": "gpt-4o"},
+            }
+        }
+    }
+    vertex.load_from_db_fields = ["base_url"]
+    vertex.params = {
+        "api_key": "sk-secret",
+        "base_url": "https://internal",
+        "model_name": "gpt-4o",
+        "temperature": 0.1,
+        "client": object(),
+    }
+
+    assert _vertex_to_primitive_dict(vertex) == {"model_name": "gpt-4o", "temperature": 0.1}
+
+
+def test_vertex_to_primitive_dict_redacts_nested_secrets():
+    vertex = Mock(spec=Vertex)
+    vertex.data = {
+        "node": {
+            "template": {
+                "headers": {"type": "table", "value": []},
+                "accounts": {
+                    "type": "table",
+                    "table_schema": [{"name": "user"}, {"name": "key", "load_from_db": True}],
+                    "value": [],
+                },
+                "model_kwargs": {"type": "dict", "value": {}},
+            }
+        }
+    }
+    vertex.load_from_db_fields = []
+    vertex.params = {
+        "headers": [{"key": "Authorization", "value": "Bearer secret"}, {"key": "Accept", "value": "text/plain"}],
+        "accounts": [{"user": "alice", "key": "OPENAI_KEY_VALUE"}],
+        "model_kwargs": {"max_tokens": 10, "client": {"api_key": "sk-secret", "refresh_token": "rt"}},
+    }
+
+    assert _vertex_to_primitive_dict(vertex) == {
+        "headers": [{"key": "Authorization", "value": "*****"}, {"key": "Accept", "value": "text/plain"}],
+        "accounts": [{"user": "alice", "key": "*****"}],
+        "model_kwargs": {"max_tokens": 10, "client": {"api_key": "*****", "refresh_token": "*****"}},
+    }
+
+
+@pytest.mark.parametrize(("storage_enabled", "stored"), [(False, False), (True, True)])
+async def test_log_transaction_only_stores_records_when_enabled(storage_enabled, stored):
+    settings = SimpleNamespace(transactions_storage_enabled=True, execution_log_storage_enabled=storage_enabled)
+    execution_log_service = Mock(add_transaction=AsyncMock())
+    source = Mock(spec=Vertex, id="ChatInput-1", data={}, params={}, load_from_db_fields=[], result=None)
+
+    with (
+        patch.object(utils, "get_settings_service", return_value=SimpleNamespace(settings=settings)),
+        patch.object(utils, "get_db_service", return_value=Mock()),
+        patch.object(utils, "get_execution_log_service", return_value=execution_log_service),
+    ):
+        await log_transaction("flow-id", source, "success")
+
+    assert execution_log_service.add_transaction.await_count == int(stored)